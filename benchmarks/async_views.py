@@ -0,0 +1,134 @@
+"""Compares request concurrency of FlaskMuckApiView and AsyncFlaskMuckApiView against a database with simulated
+latency. Requires the aiosqlite and asgiref packages.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.async_views --requests 200 --concurrency 20 --latency-ms 10
+
+Sync views are driven by a thread pool, with one thread per in-flight request. Async views are driven by a single
+thread running one event loop, with every in-flight request awaiting the database concurrently.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import marshmallow as ma
+from flask import Flask
+from marshmallow import fields as mf
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.ext.asyncio import (
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
+from sqlalchemy.util import await_only
+
+from flask_muck import AsyncFlaskMuckApiView, FlaskMuckApiView
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class TodoModel(Base):
+    __tablename__ = "todo"
+    id = Column(Integer, primary_key=True)
+    text = Column(String, nullable=False)
+
+
+class TodoSchema(ma.Schema):
+    id = mf.Integer()
+    text = mf.String()
+
+
+def run(requests: int, concurrency: int, latency: float, rows: int) -> None:
+    database = Path(tempfile.mkdtemp()) / "benchmark.db"
+    engine = create_engine(f"sqlite:///{database}", pool_size=concurrency)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            TodoModel.__table__.insert(),
+            [{"text": f"Todo {i}"} for i in range(rows)],
+        )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def sync_latency(*args: object) -> None:
+        time.sleep(latency)
+
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", pool_size=concurrency
+    )
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def async_latency(*args: object) -> None:
+        await_only(asyncio.sleep(latency))
+
+    class SyncTodoApiView(FlaskMuckApiView):
+        api_name = "todos"
+        session = scoped_session(sessionmaker(engine))
+        Model = TodoModel
+        ResponseSchema = TodoSchema
+
+    class AsyncTodoApiView(AsyncFlaskMuckApiView):
+        api_name = "async-todos"
+        session = async_scoped_session(
+            async_sessionmaker(async_engine), scopefunc=asyncio.current_task
+        )
+        Model = TodoModel
+        ResponseSchema = TodoSchema
+
+    app = Flask(__name__)
+    url = "/todos/?limit=20"
+
+    def sync_request() -> None:
+        with app.test_request_context(url):
+            SyncTodoApiView().dispatch_request(resource_id=None)
+            SyncTodoApiView.session.remove()
+
+    async def async_request() -> None:
+        with app.test_request_context(url):
+            await AsyncTodoApiView().dispatch_request(resource_id=None)
+
+    def run_sync(workers: int) -> float:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(sync_request) for _ in range(requests)]:
+                future.result()
+        return requests / (time.perf_counter() - start)
+
+    async def run_async() -> float:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited_request() -> None:
+            async with semaphore:
+                await async_request()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(limited_request() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+        await async_engine.dispose()
+        return requests / elapsed
+
+    print(f"{'view':<28} {'threads':>8} {'in-flight':>10} {'requests/sec':>14}")
+    print(f"{'FlaskMuckApiView':<28} {1:>8} {1:>10} {run_sync(1):>14,.1f}")
+    print(
+        f"{'FlaskMuckApiView':<28} {concurrency:>8} {concurrency:>10} {run_sync(concurrency):>14,.1f}"
+    )
+    print(
+        f"{'AsyncFlaskMuckApiView':<28} {1:>8} {concurrency:>10} {asyncio.run(run_async()):>14,.1f}"
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=200)
+    arg_parser.add_argument("--concurrency", type=int, default=20)
+    arg_parser.add_argument("--latency-ms", type=float, default=10)
+    arg_parser.add_argument("--rows", type=int, default=1000)
+    args = arg_parser.parse_args()
+    run(args.requests, args.concurrency, args.latency_ms / 1000, args.rows)
@@ -0,0 +1,357 @@
+"""Measures the throughput and latency of the request hot paths and compares the results against a stored baseline.
+
+Synthetic guardians, children and families are seeded into a local SQLite file at each scale using the test models.
+Seeded databases are reused by later runs. Every scenario is run through the Flask test client against views using
+Marshmallow and Pydantic schemas.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.hot_paths run --scales 1000 100000 1000000 --output baseline.json
+    PYTHONPATH=src python -m benchmarks.hot_paths run --scales 1000 100000 --output current.json
+    PYTHONPATH=src python -m benchmarks.hot_paths compare baseline.json current.json --threshold 0.1
+
+Pass `--json-encoder orjson` to run the views with the orjson JSON encoder.
+
+`compare` exits with a non-zero status if any scenario's median latency regressed by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import marshmallow as ma
+import sqlalchemy
+from flask import Blueprint, Flask
+from flask.testing import FlaskClient
+from marshmallow import fields as mf
+from pydantic import BaseModel
+
+from flask_muck import FlaskMuckApiView
+from flask_muck.types import SerializerType
+from tests.app import ChildModel, FamilyModel, GuardianModel, db
+
+SEED_CHUNK_SIZE = 50_000
+
+
+class GuardianMarshmallowSchema(ma.Schema):
+    id = mf.Integer(dump_only=True)
+    name = mf.String(required=True)
+    age = mf.Integer()
+    family_id = mf.Integer()
+
+
+class GuardianPydanticModel(BaseModel):
+    id: int
+    name: str
+    age: Optional[int]
+    family_id: Optional[int]
+
+
+class GuardianPydanticInputModel(BaseModel):
+    name: str
+    age: Optional[int] = None
+    family_id: Optional[int] = None
+
+
+SERIALIZERS: dict[str, tuple[SerializerType, SerializerType]] = {
+    "marshmallow": (GuardianMarshmallowSchema, GuardianMarshmallowSchema),
+    "pydantic": (GuardianPydanticModel, GuardianPydanticInputModel),
+}
+
+
+def _build_views() -> list[type[FlaskMuckApiView]]:
+    views = []
+    for name, (response_schema, input_schema) in SERIALIZERS.items():
+        views.append(
+            type(
+                f"{name.title()}GuardianApiView",
+                (FlaskMuckApiView,),
+                {
+                    "api_name": f"{name}-guardians",
+                    "session": db.session,
+                    "Model": GuardianModel,
+                    "ResponseSchema": response_schema,
+                    "CreateSchema": input_schema,
+                    "UpdateSchema": input_schema,
+                    "PatchSchema": input_schema,
+                    "searchable_columns": [GuardianModel.name],
+                },
+            )
+        )
+    return views
+
+
+def _create_app(database: Path, json_encoder: str) -> Flask:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database}"
+    app.config["MUCK_JSON_ENCODER"] = json_encoder
+    db.init_app(app)
+    blueprint = Blueprint("benchmarks", __name__, url_prefix="/")
+    for view in _build_views():
+        view.add_rules_to_blueprint(blueprint)
+    app.register_blueprint(blueprint)
+    return app
+
+
+def _seed(rows: int) -> None:
+    """Seeds `rows` guardians, one child per guardian and one family per ten guardians unless already seeded."""
+    if (
+        sqlalchemy.inspect(db.engine).has_table(GuardianModel.__tablename__)
+        and db.session.query(GuardianModel).count() == rows
+    ):
+        return
+    db.drop_all()
+    db.create_all()
+    families = max(rows // 10, 1)
+    tables = [
+        (FamilyModel, families, lambda i: {"id": i, "surname": f"Family {i}"}),
+        (
+            GuardianModel,
+            rows,
+            lambda i: {
+                "id": i,
+                "name": f"Guardian {i}",
+                "age": i % 90,
+                "family_id": i % families + 1,
+            },
+        ),
+        (
+            ChildModel,
+            rows,
+            lambda i: {
+                "id": i,
+                "name": f"Child {i}",
+                "age": i % 18,
+                "guardian_id": i,
+                "family_id": i % families + 1,
+            },
+        ),
+    ]
+    with db.engine.begin() as connection:
+        for model, count, make_row in tables:
+            for start in range(1, count + 1, SEED_CHUNK_SIZE):
+                connection.execute(
+                    model.__table__.insert(),
+                    [
+                        make_row(i)
+                        for i in range(start, min(start + SEED_CHUNK_SIZE, count + 1))
+                    ],
+                )
+
+
+def _get_scenarios(
+    client: FlaskClient, api_name: str, rows: int
+) -> dict[str, Callable[[int], None]]:
+    """Returns the scenarios to measure. Each scenario makes a single request for the given iteration."""
+    url = f"/{api_name}/"
+    rng = random.Random(rows)
+    created_ids: list[int] = []
+
+    def request(method: str, path: str, status: int, **kwargs: object) -> dict:
+        response = getattr(client, method)(path, **kwargs)
+        if response.status_code != status:
+            raise RuntimeError(
+                f"{method.upper()} {path} returned {response.status_code}: {response.data[:200]!r}"
+            )
+        return response.json
+
+    def create(i: int) -> None:
+        created = request(
+            "post",
+            url,
+            201,
+            json={"name": f"{api_name} {i}", "age": 30, "family_id": 1},
+        )
+        created_ids.append(created["id"])
+
+    def update(i: int) -> None:
+        resource_id = rng.randint(1, rows)
+        request(
+            "put",
+            f"{url}{resource_id}/",
+            200,
+            json={"name": f"Guardian {resource_id}", "age": i % 90, "family_id": 1},
+        )
+
+    return {
+        "list_paginated": lambda i: request(
+            "get", f"{url}?limit=20&offset={rng.randint(0, max(rows - 20, 0))}", 200
+        ),
+        "list_filtered": lambda i: request(
+            "get", f'{url}?limit=20&filters={{"age__gte": {i % 90}}}', 200
+        ),
+        "list_related_filter": lambda i: request(
+            "get", f'{url}?limit=20&filters={{"children.age": {i % 18}}}', 200
+        ),
+        "list_sorted": lambda i: request("get", f"{url}?limit=20&sort=name__desc", 200),
+        "list_search": lambda i: request(
+            "get", f"{url}?limit=20&search=Guardian {rng.randint(1, rows)}", 200
+        ),
+        "detail": lambda i: request("get", f"{url}{rng.randint(1, rows)}/", 200),
+        "create": create,
+        "update": update,
+        "patch": lambda i: request(
+            "patch", f"{url}{rng.randint(1, rows)}/", 200, json={"age": i % 90}
+        ),
+        "delete": lambda i: request("delete", f"{url}{created_ids.pop()}/", 204),
+    }
+
+
+def _measure(scenario: Callable[[int], None], requests: int, warmup: int) -> dict:
+    for i in range(warmup):
+        scenario(i)
+    latencies = []
+    start = time.perf_counter()
+    for i in range(warmup, warmup + requests):
+        request_start = time.perf_counter()
+        scenario(i)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": requests,
+        "requests_per_second": requests / elapsed,
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+    }
+
+
+def run(
+    scales: list[int],
+    requests: int,
+    warmup: int,
+    data_dir: Path,
+    scenarios: Optional[list[str]],
+    json_encoder: str = "json",
+) -> dict:
+    if scenarios and "delete" in scenarios and "create" not in scenarios:
+        # Deletes remove the resources created by the create scenario.
+        scenarios = [*scenarios, "create"]
+    data_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[str, dict] = {}
+    print(
+        f"{'scale':>9} {'serializer':<12} {'scenario':<20} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for rows in scales:
+        app = _create_app(data_dir / f"hot_paths_{rows}.db", json_encoder)
+        with app.app_context():
+            _seed(rows)
+            client = app.test_client()
+            for serializer in SERIALIZERS:
+                # Creates run before deletes so every delete removes a resource created by the benchmark.
+                for name, scenario in _get_scenarios(
+                    client, f"{serializer}-guardians", rows
+                ).items():
+                    if scenarios and name not in scenarios:
+                        continue
+                    result = _measure(scenario, requests, warmup)
+                    results[f"{rows}/{serializer}/{name}"] = result
+                    print(
+                        f"{rows:>9} {serializer:<12} {name:<20} {result['requests_per_second']:>10,.1f} "
+                        f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f}"
+                    )
+            db.session.remove()
+            db.engine.dispose()
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "requests": requests,
+            "json_encoder": json_encoder,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Returns a description of every scenario whose median latency regressed by more than the threshold."""
+    regressions = []
+    print(f"{'scenario':<45} {'baseline p50':>13} {'current p50':>12} {'change':>8}")
+    for key, result in sorted(current["results"].items()):
+        if key not in baseline["results"]:
+            continue
+        before, after = baseline["results"][key]["p50_ms"], result["p50_ms"]
+        change = after / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(
+                f"{key}: {before:.2f}ms -> {after:.2f}ms ({change:+.1%})"
+            )
+        print(f"{key:<45} {before:>11.2f}ms {after:>10.2f}ms {change:>+8.1%}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Runs the benchmarks.")
+    run_parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1000, 100_000, 1_000_000]
+    )
+    run_parser.add_argument("--requests", type=int, default=200)
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument(
+        "--scenarios", nargs="+", help="Only run these scenarios. Defaults to all."
+    )
+    run_parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "flask-muck-benchmarks",
+        help="Directory the seeded SQLite databases are stored in and reused from.",
+    )
+    run_parser.add_argument(
+        "--json-encoder",
+        choices=["json", "orjson"],
+        default="json",
+        help="The MUCK_JSON_ENCODER used by the views.",
+    )
+    run_parser.add_argument(
+        "--output", type=Path, help="Writes the results to this JSON file."
+    )
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compares results against a baseline."
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative increase in median latency. Defaults to 0.1 (10%%).",
+    )
+    args = arg_parser.parse_args()
+
+    if args.command == "run":
+        output = run(
+            args.scales,
+            args.requests,
+            args.warmup,
+            args.data_dir,
+            args.scenarios,
+            args.json_encoder,
+        )
+        if args.output:
+            args.output.write_text(json.dumps(output, indent=2))
+    else:
+        regressions = compare(
+            json.loads(args.baseline.read_text()),
+            json.loads(args.current.read_text()),
+            args.threshold,
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            print("\n".join(regressions))
+            sys.exit(1)
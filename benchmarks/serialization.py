@@ -0,0 +1,74 @@
+"""Compares per-row serialization against the batched list serialization path.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.serialization --rows 5000
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import marshmallow as ma
+from marshmallow import fields as mf
+from pydantic import BaseModel
+
+from flask_muck.types import SerializerType
+from flask_muck.utils import serialize_model_instance, serialize_model_instances
+from tests.app import GuardianModel
+
+
+class GuardianMarshmallowSchema(ma.Schema):
+    id = mf.Integer()
+    name = mf.String()
+    age = mf.Integer()
+    family_id = mf.Integer()
+
+
+class GuardianPydanticModel(BaseModel):
+    id: int
+    name: str
+    age: int
+    family_id: int
+
+
+def _rows_per_second(func: Callable[[], object], rows: int, repeat: int) -> float:
+    """Returns the best observed rows/sec over several runs of func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def run(rows: int, repeat: int) -> None:
+    instances = [
+        GuardianModel(id=i, name=f"Guardian {i}", age=i % 90, family_id=i % 100)
+        for i in range(rows)
+    ]
+    serializers: list[tuple[str, SerializerType]] = [
+        ("marshmallow", GuardianMarshmallowSchema),
+        ("pydantic", GuardianPydanticModel),
+    ]
+    print(f"{'serializer':<12} {'per-row':>14} {'batched':>14} {'speedup':>8}")
+    for name, serializer in serializers:
+        per_row = _rows_per_second(
+            lambda: [serialize_model_instance(i, serializer) for i in instances],
+            rows,
+            repeat,
+        )
+        batched = _rows_per_second(
+            lambda: serialize_model_instances(instances, serializer), rows, repeat
+        )
+        print(
+            f"{name:<12} {per_row:>10,.0f} r/s {batched:>10,.0f} r/s {batched / per_row:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=5000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,117 @@
+"""Compares per-request view configuration lookups against the compiled view plans for deeply nested views.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.view_compilation --depth 8
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import marshmallow as ma
+from flask import Flask, request
+from marshmallow import fields as mf
+from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy.orm import DeclarativeBase
+
+from flask_muck import FlaskMuckApiView
+from flask_muck.utils import (
+    get_fk_column,
+    get_pk_column,
+    get_query_filters_from_request_path,
+    get_url_path_variable,
+    get_url_rule,
+    get_view_plan,
+    register_muck_view,
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class IdSchema(ma.Schema):
+    id = mf.Integer()
+
+
+def _build_views(depth: int) -> list[type[FlaskMuckApiView]]:
+    """Builds a chain of models and views where each view is nested under the previous one."""
+    views: list[type[FlaskMuckApiView]] = []
+    for level in range(depth):
+        columns = {
+            "__tablename__": f"level_{level}",
+            "id": Column(Integer, primary_key=True),
+        }
+        if views:
+            columns["parent_id"] = Column(Integer, ForeignKey(f"level_{level - 1}.id"))
+        model = type(f"Level{level}Model", (Base,), columns)
+        views.append(
+            type(
+                f"Level{level}ApiView",
+                (FlaskMuckApiView,),
+                {
+                    "api_name": f"level-{level}",
+                    "Model": model,
+                    "ResponseSchema": IdSchema,
+                    "parent": views[-1] if views else None,
+                },
+            )
+        )
+    return views
+
+
+def _legacy_request_overhead(view: type[FlaskMuckApiView]) -> None:
+    """Recomputes the view configuration values the way requests did before views were compiled."""
+    request.method.lower() in [m.lower() for m in view.allowed_methods]
+    get_pk_column(view.Model)
+    query_filters = []
+    while view.parent:
+        fk_column = get_fk_column(view.parent.Model, view.Model)
+        query_filters.append(
+            fk_column == request.view_args[get_url_path_variable(view.parent)]
+        )
+        view = view.parent
+
+
+def _compiled_request_overhead(view: type[FlaskMuckApiView]) -> None:
+    plan = get_view_plan(view)
+    request.method.lower() in plan.allowed_methods
+    plan.pk_column
+    get_query_filters_from_request_path(view, [])
+
+
+def _requests_per_second(func: Callable[[], object], requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        func()
+    return requests / (time.perf_counter() - start)
+
+
+def run(depth: int, requests: int) -> None:
+    app = Flask(__name__)
+    views = _build_views(depth)
+    for view in views:
+        register_muck_view(view, app, url_prefix="/")
+    leaf = views[-1]
+    url = get_url_rule(leaf, None)
+    for level in range(depth - 1):
+        url = url.replace(f"<int:level{level}_model_id>", "1")
+
+    print(f"{'depth':<6} {'per-request':>16} {'compiled':>16} {'speedup':>8}")
+    with app.test_request_context(url):
+        legacy = _requests_per_second(lambda: _legacy_request_overhead(leaf), requests)
+        compiled = _requests_per_second(
+            lambda: _compiled_request_overhead(leaf), requests
+        )
+    print(
+        f"{depth:<6} {legacy:>12,.0f} r/s {compiled:>12,.0f} r/s {compiled / legacy:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--depth", type=int, default=8)
+    arg_parser.add_argument("--requests", type=int, default=20000)
+    args = arg_parser.parse_args()
+    run(args.depth, args.requests)
@@ -1,5 +1,10 @@
 from .views import FlaskMuckApiView
-from .callback import FlaskMuckCallback
+from .async_views import AsyncFlaskMuckApiView
+from .callback import (
+    FlaskMuckCallback,
+    AsyncFlaskMuckCallback,
+    DeferredCallbackExecutor,
+)
 from .extension import FlaskMuck
 
 __version__ = "0.4.2"
@@ -8,4 +13,7 @@ __all__ = [
     "FlaskMuck",
     "FlaskMuckApiView",
     "FlaskMuckCallback",
+    "AsyncFlaskMuckApiView",
+    "AsyncFlaskMuckCallback",
+    "DeferredCallbackExecutor",
 ]
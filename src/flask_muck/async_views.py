@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from inspect import isawaitable
+from typing import Any, Optional
+
+from flask.typing import ResponseReturnValue
+from sqlalchemy.ext.asyncio import async_scoped_session
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from flask_muck.views import FlaskMuckApiView
+
+
+class AsyncFlaskMuckApiView(FlaskMuckApiView):
+    """An asyncio counterpart to FlaskMuckApiView backed by a SQLAlchemy `AsyncSession`. It supports the same
+    configuration and features as FlaskMuckApiView, except streamed list responses, and is registered the same way.
+
+    Requests are handled by Flask's async view support. The request handling logic is shared with FlaskMuckApiView
+    and runs through `AsyncSession.run_sync`, so database IO is awaited on the async driver rather than blocking a
+    thread. Callbacks may define `execute` and `execute_batch` as coroutines; they are awaited in order.
+
+    Attributes:
+        session (async_scoped_session): An `async_scoped_session` used for all database operations. The session is
+            removed once each request has been handled.
+    """
+
+    session: async_scoped_session  # type: ignore[assignment]
+    init_every_request = True
+
+    async def dispatch_request(self, **kwargs: Any) -> ResponseReturnValue:  # type: ignore[override]
+        async_session = self.session
+
+        def dispatch(sync_session: Session) -> ResponseReturnValue:
+            # View instances are created for every request so the sync session is only visible to this request.
+            self.session = sync_session  # type: ignore[assignment]
+            return FlaskMuckApiView.dispatch_request(self, **kwargs)
+
+        try:
+            return await async_session().run_sync(dispatch)
+        finally:
+            await async_session.remove()
+
+    def _get_stream_mimetype(self) -> Optional[str]:
+        """Streamed responses are read after the view returns, once the session has been removed, so they are not
+        supported by async views.
+        """
+        return None
+
+    def _finish_callback(self, result: Any) -> None:
+        if isawaitable(result):
+            await_only(result)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class CacheBackend(ABC):
+    """The interface for cache backends used by Flask-Muck. Implement it to store cached responses somewhere other
+    than process memory.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value stored for a key or the default if the key is missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Stores a value. The ttl argument overrides the cache's default time-to-live for this entry."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Removes a key from the cache if it exists."""
+        ...
+
+
+class CacheStats:
+    """Thread safe hit and miss counters for a cache."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
+
+
+class TTLCache(CacheBackend):
+    """A thread safe, size bounded in-process cache. Entries can optionally expire after a time-to-live and the least
+    recently used entries are evicted first once the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, expires_at = self._data[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
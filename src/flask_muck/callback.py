@@ -1,8 +1,23 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from inspect import isawaitable
+from logging import getLogger
+from threading import Lock
+from typing import Sequence, Callable, Any, Optional, Union
+
+from flask import Flask, current_app
+from sqlalchemy.util import await_only
 
 from flask_muck.types import SqlaModel, JsonDict
 
+logger = getLogger(__name__)
+
+# Deferred callbacks receive serialized snapshots instead of model instances.
+CallbackResource = Union[SqlaModel, JsonDict]
+
 
 class CallbackType(Enum):
     pre = "pre"
@@ -10,9 +25,21 @@ class CallbackType(Enum):
 
 
 class FlaskMuckCallback(ABC):
-    """The base class for implementing Flask Muck callbacks."""
+    """The base class for implementing Flask Muck callbacks.
+
+    Attributes:
+        deferred (bool): Post callbacks with this set are executed in the background by the view's
+            `callback_executor` once the response is on its way. Deferred callbacks receive a snapshot of the resource,
+            serialized with the view's ResponseSchema, as `self.resource` instead of the model instance.
+        max_retries (int): The number of times a deferred callback is retried if it raises an exception.
+        retry_delay (float): The number of seconds to wait before the first retry. The delay doubles for each retry.
+    """
 
-    def __init__(self, resource: SqlaModel, kwargs: JsonDict):
+    deferred: bool = False
+    max_retries: int = 0
+    retry_delay: float = 1.0
+
+    def __init__(self, resource: CallbackResource, kwargs: JsonDict):
         self.resource = resource
         self.kwargs = kwargs
 
@@ -20,3 +47,163 @@ class FlaskMuckCallback(ABC):
     def execute(self) -> None:
         """This method executes the desired callback functionality. It must be overridden in concrete subclasses."""
         ...
+
+    @classmethod
+    def execute_batch(
+        cls, resources: Sequence[CallbackResource], kwargs_list: Sequence[JsonDict]
+    ) -> None:
+        """Executes the callback for a batch of resources created in a single request. By default the callback is
+        executed once per resource. Override this method to handle the whole batch at once.
+        """
+        for resource, kwargs in zip(resources, kwargs_list):
+            cls(resource, kwargs).execute()
+
+
+class AsyncFlaskMuckCallback(FlaskMuckCallback):
+    """The base class for implementing callbacks that await IO. Async callbacks are only supported by
+    AsyncFlaskMuckApiView, unless they are deferred.
+    """
+
+    @abstractmethod
+    async def execute(self) -> None:  # type: ignore[override]
+        """This coroutine executes the desired callback functionality. It must be overridden in concrete subclasses."""
+        ...
+
+    @classmethod
+    async def execute_batch(  # type: ignore[override]
+        cls, resources: Sequence[CallbackResource], kwargs_list: Sequence[JsonDict]
+    ) -> None:
+        """Executes the callback for a batch of resources created in a single request. By default the callback is
+        awaited once per resource. Override this method to handle the whole batch at once.
+        """
+        for resource, kwargs in zip(resources, kwargs_list):
+            await cls(resource, kwargs).execute()
+
+
+def _run_coroutine(coroutine: Any) -> None:
+    """Runs a coroutine returned by an async callback. Callbacks run inline by an async view are already inside its
+    event loop, so they are awaited through SQLAlchemy's greenlet bridge instead of starting a new loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coroutine)
+    else:
+        await_only(coroutine)
+
+
+class DeferredCallbackStats:
+    """Thread safe counters for a DeferredCallbackExecutor."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+        self.ran_inline = 0
+        self.queue_depth = 0
+        self._lock = Lock()
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retried": self.retried,
+            "ran_inline": self.ran_inline,
+            "queue_depth": self.queue_depth,
+        }
+
+
+class DeferredCallbackExecutor:
+    """Executes deferred post callbacks on a bounded thread pool, inside an application context of the app that
+    submitted them. Failed callbacks are retried according to their `max_retries` and `retry_delay`, and are logged once
+    they run out of retries.
+
+    Once `max_queue_size` callbacks are waiting or running, further callbacks are executed inline so work is never
+    dropped and the backlog can't grow without bound. If `synchronous` is set every callback is executed inline,
+    which keeps tests deterministic.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: int = 1000,
+        synchronous: bool = False,
+    ):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.synchronous = synchronous
+        self.stats = DeferredCallbackStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    def submit(
+        self, callback: type[FlaskMuckCallback], func: Callable[[], Any]
+    ) -> None:
+        """Schedules a function executing a deferred callback."""
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+        self.stats.increment("submitted")
+        with self._lock:
+            run_inline = (
+                self.synchronous or self.stats.queue_depth >= self.max_queue_size
+            )
+            if not run_inline:
+                self.stats.increment("queue_depth")
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="flask-muck-callbacks",
+                    )
+        if run_inline:
+            if not self.synchronous:
+                self.stats.increment("ran_inline")
+            self._run(app, callback, func)
+        else:
+            assert self._executor is not None
+            self._executor.submit(self._run_queued, app, callback, func)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker threads. Queued callbacks are executed first if `wait` is set."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _run_queued(
+        self, app: Flask, callback: type[FlaskMuckCallback], func: Callable[[], Any]
+    ) -> None:
+        try:
+            self._run(app, callback, func)
+        finally:
+            self.stats.increment("queue_depth", -1)
+
+    def _run(
+        self, app: Flask, callback: type[FlaskMuckCallback], func: Callable[[], Any]
+    ) -> None:
+        attempt = 0
+        while True:
+            try:
+                with app.app_context():
+                    if isawaitable(result := func()):
+                        _run_coroutine(result)
+            except Exception:
+                if attempt >= callback.max_retries:
+                    self.stats.increment("failed")
+                    logger.exception(
+                        f"Deferred callback {callback.__name__} failed after {attempt + 1} attempt(s)."
+                    )
+                    return
+                time.sleep(callback.retry_delay * 2**attempt)
+                attempt += 1
+                self.stats.increment("retried")
+            else:
+                self.stats.increment("succeeded")
+                return
+
+
+default_callback_executor = DeferredCallbackExecutor()
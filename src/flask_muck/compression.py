@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import importlib
+import zlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+from flask import Response, request
+
+from flask_muck.exceptions import MuckImplementationError
+
+
+class Compressor(ABC):
+    """The interface for the content encodings FlaskMuckApiViews can compress responses with.
+
+    Attributes:
+        encoding (str): The Content-Encoding token the compressor produces.
+        level (int): The compression level.
+    """
+
+    encoding: str
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def is_available(self) -> bool:
+        """Indicates whether the libraries the compressor needs are installed."""
+        return True
+
+    @abstractmethod
+    def compressobj(self) -> Any:
+        """Returns an incremental compressor with `compress(data)` and `flush()` methods, like `zlib.compressobj`."""
+        ...
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self.compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+
+class GzipCompressor(Compressor):
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6):
+        super().__init__(level)
+
+    def compressobj(self) -> Any:
+        # A window size of 16 + MAX_WBITS writes a gzip header and trailer.
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+@lru_cache(maxsize=None)
+def _get_zstd_module() -> Any:
+    """Returns the standard library's `compression.zstd` module on Python 3.14+, the zstandard package if it is
+    installed or None.
+    """
+    for module_name in ("compression.zstd", "zstandard"):
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            continue
+    return None
+
+
+class ZstdCompressor(Compressor):
+    """Compresses with Zstandard using the standard library on Python 3.14+ or the zstandard package. Zstandard
+    compresses faster than gzip at a similar ratio. If neither is installed views skip it when negotiating an encoding.
+    """
+
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3):
+        super().__init__(level)
+
+    def is_available(self) -> bool:
+        return _get_zstd_module() is not None
+
+    def compressobj(self) -> Any:
+        zstd = _get_zstd_module()
+        if zstd is None:
+            raise MuckImplementationError(
+                "zstd compression requires Python 3.14+ or the zstandard package. Install it with `pip install "
+                "flask-muck[zstd]`."
+            )
+        if zstd.__name__ == "zstandard":
+            return zstd.ZstdCompressor(level=self.level).compressobj()
+        return zstd.ZstdCompressor(level=self.level)
+
+
+# The compressors for each content encoding. Replace an entry to change its compression level.
+COMPRESSORS: dict[str, Compressor] = {
+    "zstd": ZstdCompressor(),
+    "gzip": GzipCompressor(),
+}
+
+
+def get_compressor(encodings: Sequence[str]) -> Optional[Compressor]:
+    """Returns the compressor for the available encoding in `encodings` that best matches the request's
+    Accept-Encoding header or None if the response shouldn't be compressed. Ties are broken by the order of
+    `encodings`.
+    """
+    available = []
+    for encoding in encodings:
+        if encoding not in COMPRESSORS:
+            raise MuckImplementationError(
+                f"Unsupported compression encoding {encoding!r}. Use one of {list(COMPRESSORS)}."
+            )
+        if COMPRESSORS[encoding].is_available():
+            available.append(encoding)
+    if best_match := request.accept_encodings.best_match(available):
+        return COMPRESSORS[best_match]
+    return None
+
+
+def _compress_stream(
+    chunks: Iterable[Union[bytes, str]], compressor: Compressor
+) -> Iterator[bytes]:
+    compressobj = compressor.compressobj()
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if data := compressobj.compress(chunk):
+                yield data
+        yield compressobj.flush()
+    finally:
+        # Closing the wrapped iterable lets streams clean up, e.g. pop the request context kept by
+        # `stream_with_context`.
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+def compress_response(
+    response: Response, compressor: Compressor, min_size: int
+) -> Response:
+    """Compresses a response's body. Buffered bodies smaller than `min_size` bytes are left as they are. Streamed
+    bodies are always compressed, chunk by chunk as they're written, so they're never buffered.
+    """
+    if (
+        request.method == "HEAD"
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, compressor)
+    else:
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        response.set_data(compressor.compress(data))
+    response.headers["Content-Encoding"] = compressor.encoding
+    return response
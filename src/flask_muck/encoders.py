@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from flask import Response, current_app
+
+from flask_muck.exceptions import MuckImplementationError
+
+
+class Encoder(ABC):
+    """The interface for encoders used by Flask-Muck to write the dicts and lists returned by FlaskMuckApiViews to
+    response bodies of a single media type.
+    """
+
+    mimetype: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes a value as bytes."""
+        ...
+
+    def response(self, obj: Any, status: int) -> Response:
+        """Returns a response with the value encoded as its body."""
+        return current_app.response_class(
+            self.dumps(obj), status=status, mimetype=self.mimetype
+        )
+
+
+class JsonEncoder(Encoder):
+    """The interface for JSON encoders. The encoder is chosen with the `MUCK_JSON_ENCODER` app config setting, which
+    can be "json", "orjson" or a JsonEncoder instance.
+    """
+
+    mimetype = "application/json"
+
+
+class StdlibJsonEncoder(JsonEncoder):
+    """The default encoder. Encodes with the app's Flask JSON provider, `app.json`, so responses are the same as those
+    built by `jsonify`.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return current_app.json.dumps(obj).encode()
+
+    def response(self, obj: Any, status: int) -> Response:
+        response = current_app.json.response(obj)
+        response.status_code = status
+        return response
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonEncoder(JsonEncoder):
+    """Encodes with orjson, which writes bytes directly and is several times faster than the standard library for
+    large lists. Datetimes, dates, times, UUIDs and dataclasses are encoded natively. Datetimes are encoded in ISO 8601
+    format rather than the HTTP date format used by Flask. Decimals are encoded as strings, like Flask does.
+
+    Attributes:
+        option (Optional[int]): orjson option flags, e.g. `orjson.OPT_NAIVE_UTC | orjson.OPT_SORT_KEYS`.
+    """
+
+    def __init__(self, option: Optional[int] = None):
+        try:
+            import orjson
+        except ImportError as e:
+            raise MuckImplementationError(
+                "orjson must be installed to use the orjson JSON encoder. Install it with `pip install "
+                "flask-muck[orjson]`."
+            ) from e
+        self._orjson = orjson
+        self.option = option
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_orjson_default, option=self.option)
+
+
+JSON_ENCODERS: dict[str, type[JsonEncoder]] = {
+    "json": StdlibJsonEncoder,
+    "orjson": OrjsonEncoder,
+}
+
+_json_encoders: dict[str, JsonEncoder] = {}
+
+
+def get_json_encoder() -> JsonEncoder:
+    """Returns the JSON encoder configured for the current app with `MUCK_JSON_ENCODER`. Defaults to the standard
+    library encoder.
+    """
+    encoder = current_app.config.get("MUCK_JSON_ENCODER", "json")
+    if isinstance(encoder, JsonEncoder):
+        return encoder
+    if (instance := _json_encoders.get(encoder)) is None:
+        if encoder not in JSON_ENCODERS:
+            raise MuckImplementationError(
+                f"Unknown MUCK_JSON_ENCODER {encoder!r}. Use one of {list(JSON_ENCODERS)} or a JsonEncoder instance."
+            )
+        instance = _json_encoders.setdefault(encoder, JSON_ENCODERS[encoder]())
+    return instance
+
+
+def _binary_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class BinaryEncoder(Encoder):
+    """The interface for binary encoders. Binary encoders are used for the media types listed in a view's
+    `media_types`, both to encode responses negotiated with the Accept header and to decode request bodies sent with a
+    matching Content-Type.
+    """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decodes a request body."""
+        ...
+
+
+class MsgpackEncoder(BinaryEncoder):
+    """Encodes and decodes MessagePack with the msgpack library. Datetimes, dates and times are encoded as ISO 8601
+    strings and decimals and UUIDs as strings, matching the JSON responses of Marshmallow schemas.
+    """
+
+    mimetype = "application/msgpack"
+
+    def __init__(self) -> None:
+        try:
+            import msgpack  # type: ignore
+        except ImportError as e:
+            raise MuckImplementationError(
+                "msgpack must be installed to use the application/msgpack media type. Install it with `pip install "
+                "flask-muck[msgpack]`."
+            ) from e
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, default=_binary_default)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data)
+
+
+class CborEncoder(BinaryEncoder):
+    """Encodes and decodes CBOR with the cbor2 library. Datetimes, decimals and UUIDs are encoded with their standard
+    CBOR tags. Naive datetimes are assumed to be in UTC.
+    """
+
+    mimetype = "application/cbor"
+
+    def __init__(self) -> None:
+        try:
+            import cbor2
+        except ImportError as e:
+            raise MuckImplementationError(
+                "cbor2 must be installed to use the application/cbor media type. Install it with `pip install "
+                "flask-muck[cbor]`."
+            ) from e
+        self._cbor2 = cbor2
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._cbor2.dumps(
+            obj, default=_cbor_default, timezone=datetime.timezone.utc
+        )
+
+    def loads(self, data: bytes) -> Any:
+        return self._cbor2.loads(data)
+
+
+def _cbor_default(encoder: Any, obj: Any) -> None:
+    encoder.encode(_binary_default(obj))
+
+
+BINARY_ENCODERS: dict[str, type[BinaryEncoder]] = {
+    "application/msgpack": MsgpackEncoder,
+    "application/cbor": CborEncoder,
+}
+
+_binary_encoders: dict[str, BinaryEncoder] = {}
+
+
+def get_binary_encoder(mimetype: str) -> BinaryEncoder:
+    """Returns the binary encoder for a media type."""
+    if (instance := _binary_encoders.get(mimetype)) is None:
+        if mimetype not in BINARY_ENCODERS:
+            raise MuckImplementationError(
+                f"Unsupported media type {mimetype!r}. Use application/json or one of {list(BINARY_ENCODERS)}."
+            )
+        instance = _binary_encoders.setdefault(mimetype, BINARY_ENCODERS[mimetype]())
+    return instance
+
+
+def get_encoder(mimetype: str) -> Encoder:
+    """Returns the encoder for a media type. JSON uses the encoder configured with `MUCK_JSON_ENCODER`."""
+    if mimetype == JsonEncoder.mimetype:
+        return get_json_encoder()
+    return get_binary_encoder(mimetype)
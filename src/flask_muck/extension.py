@@ -3,10 +3,11 @@ from typing import Optional
 
 from apispec import APISpec
 from flasgger import Swagger  # type: ignore
-from flask import Flask, current_app
+from flask import Flask, Response, current_app
 
 from flask_muck import FlaskMuckApiView
 from flask_muck.commands import muck_cli
+from flask_muck.metrics import DEFAULT_LATENCY_BUCKETS, MuckMetrics
 from flask_muck.types import JsonDict
 from flask_muck.utils import register_muck_view
 
@@ -15,15 +16,18 @@ class FlaskMuck:
     registered_views: list[type[FlaskMuckApiView]]
     url_prefix: str
     swagger: Optional[Swagger]
+    metrics: Optional[MuckMetrics]
     _spec: APISpec
 
     def __init__(self, app: Optional[Flask] = None):
         self.swagger = None
+        self.metrics = None
         if app is not None:
             self.init_app(app)
 
     def init_app(self, app: Flask) -> None:
         self.registered_views = []
+        self.metrics = None
         app.extensions["muck"] = self
         api_title = app.config.setdefault("MUCK_API_TITLE", "REST API")
         openapi_version = "3.0.3"
@@ -34,6 +38,7 @@ class FlaskMuck:
             openapi_version=openapi_version,
         )
         self.url_prefix = app.config.setdefault("MUCK_API_URL_PREFIX", "/")
+        app.config.setdefault("MUCK_JSON_ENCODER", "json")
 
         if app.config.setdefault("MUCK_APIDOCS_ENABLED", True):
             config = {
@@ -52,6 +57,18 @@ class FlaskMuck:
             else:
                 self.swagger.template = self._spec.to_dict()
 
+        if app.config.setdefault("MUCK_METRICS_ENABLED", False):
+            self.metrics = MuckMetrics(
+                app.config.setdefault(
+                    "MUCK_METRICS_LATENCY_BUCKETS", DEFAULT_LATENCY_BUCKETS
+                )
+            )
+            app.add_url_rule(
+                app.config.setdefault("MUCK_METRICS_URL_PATH", "/metrics/"),
+                "muck_metrics",
+                self._metrics_view,
+            )
+
         # Add CLI commands
         app.cli.add_command(muck_cli)
 
@@ -69,6 +86,22 @@ class FlaskMuck:
             return self._spec.to_dict()
         return None
 
+    @property
+    def response_cache_stats(self) -> dict[str, JsonDict]:
+        """Returns the response cache hit and miss counters of each registered view that has a response cache."""
+        return {
+            view.api_name: view.get_response_cache_stats().to_dict()
+            for view in self.registered_views
+            if view.response_cache is not None
+        }
+
+    def _metrics_view(self) -> Response:
+        """Serves the metrics collected from the FlaskMuckApiViews in the Prometheus text exposition format."""
+        assert self.metrics is not None
+        return Response(
+            self.metrics.to_prometheus(), mimetype="text/plain; version=0.0.4"
+        )
+
     def register_muck_views(
         self, muck_views: list[type[FlaskMuckApiView]], app: Optional[Flask] = None
     ) -> None:
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Optional
+
+from flask_muck.types import JsonDict
+
+# Upper bounds, in seconds, of the request latency histogram buckets.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class ViewMetrics:
+    """Thread safe metrics for the requests made with a single HTTP method to a single view. Each instance has its
+    own lock, so workers handling requests to different views or methods never contend.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.requests = 0
+        self.latency_bucket_counts = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.rows = 0
+        self.payload_bytes = 0
+        self.errors: dict[int, int] = {}
+        self.count_query_seconds = 0.0
+        self._lock = Lock()
+
+    def observe(
+        self,
+        latency: float,
+        status_code: int,
+        rows: int = 0,
+        payload_bytes: Optional[int] = None,
+        count_query_seconds: float = 0.0,
+    ) -> None:
+        bucket = bisect_left(self.buckets, latency)
+        with self._lock:
+            self.requests += 1
+            self.latency_bucket_counts[bucket] += 1
+            self.latency_sum += latency
+            self.rows += rows
+            self.payload_bytes += payload_bytes or 0
+            self.count_query_seconds += count_query_seconds
+            if status_code >= 400:
+                self.errors[status_code] = self.errors.get(status_code, 0) + 1
+
+    def to_dict(self) -> JsonDict:
+        with self._lock:
+            cumulative_counts = []
+            total = 0
+            for count in self.latency_bucket_counts:
+                total += count
+                cumulative_counts.append(total)
+            return {
+                "requests": self.requests,
+                "latency_seconds": {
+                    "buckets": dict(
+                        zip([*map(str, self.buckets), "+Inf"], cumulative_counts)
+                    ),
+                    "sum": self.latency_sum,
+                    "count": self.requests,
+                },
+                "rows": self.rows,
+                "payload_bytes": self.payload_bytes,
+                "errors": dict(self.errors),
+                "count_query_seconds": self.count_query_seconds,
+            }
+
+
+class MuckMetrics:
+    """Collects ViewMetrics for every view and HTTP method handled by the FlaskMuck extension."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._metrics: dict[tuple[str, str], ViewMetrics] = {}
+        self._lock = Lock()
+
+    def get_view_metrics(self, view_name: str, method: str) -> ViewMetrics:
+        key = (view_name, method)
+        if (metrics := self._metrics.get(key)) is None:
+            with self._lock:
+                metrics = self._metrics.setdefault(key, ViewMetrics(self.buckets))
+        return metrics
+
+    def to_dict(self) -> dict[str, dict[str, JsonDict]]:
+        """Returns the metrics of each view keyed by the view's api_name and the HTTP method."""
+        metrics: dict[str, dict[str, JsonDict]] = {}
+        for (view_name, method), view_metrics in sorted(self._metrics.items()):
+            metrics.setdefault(view_name, {})[method] = view_metrics.to_dict()
+        return metrics
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        families: dict[str, tuple[str, str, list[str]]] = {
+            "requests": ("counter", "Requests handled.", []),
+            "request_duration_seconds": (
+                "histogram",
+                "Time spent handling requests.",
+                [],
+            ),
+            "rows_returned": ("counter", "Resources serialized in responses.", []),
+            "response_bytes": ("counter", "Bytes of response payloads.", []),
+            "errors": ("counter", "Responses with an error status code.", []),
+            "count_query_seconds": (
+                "counter",
+                "Time spent counting the total of paginated lists.",
+                [],
+            ),
+        }
+        for view_name, methods in self.to_dict().items():
+            for method, data in methods.items():
+                labels = f'view="{_escape(view_name)}",method="{method}"'
+                families["requests"][2].append(
+                    f"flask_muck_requests_total{{{labels}}} {data['requests']}"
+                )
+                latency = families["request_duration_seconds"][2]
+                for bound, count in data["latency_seconds"]["buckets"].items():
+                    latency.append(
+                        f'flask_muck_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                latency.append(
+                    f"flask_muck_request_duration_seconds_sum{{{labels}}} {data['latency_seconds']['sum']}"
+                )
+                latency.append(
+                    f"flask_muck_request_duration_seconds_count{{{labels}}} {data['requests']}"
+                )
+                families["rows_returned"][2].append(
+                    f"flask_muck_rows_returned_total{{{labels}}} {data['rows']}"
+                )
+                families["response_bytes"][2].append(
+                    f"flask_muck_response_bytes_total{{{labels}}} {data['payload_bytes']}"
+                )
+                for status_code, count in sorted(data["errors"].items()):
+                    families["errors"][2].append(
+                        f'flask_muck_errors_total{{{labels},status="{status_code}"}} {count}'
+                    )
+                families["count_query_seconds"][2].append(
+                    f"flask_muck_count_query_seconds_total{{{labels}}} {data['count_query_seconds']}"
+                )
+        lines = []
+        for name, (metric_type, help_text, samples) in families.items():
+            metric_name = f"flask_muck_{name}"
+            if metric_type == "counter":
+                metric_name = f"{metric_name}_total"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def get_serialized_row_count(rv: Any) -> int:
+    """Returns the number of resources in the body returned by a view method. Paginated lists count their items and
+    single resources count as one. Responses the view built itself, such as streams and cached responses, count as
+    zero.
+    """
+    if isinstance(rv, tuple):
+        rv = rv[0]
+    if isinstance(rv, list):
+        return len(rv)
+    if isinstance(rv, dict):
+        if isinstance(items := rv.get("items"), list) and "limit" in rv:
+            return len(items)
+        return 1
+    return 0
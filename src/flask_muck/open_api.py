@@ -1,13 +1,18 @@
 ﻿from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from apispec import APISpec
 from marshmallow import Schema
 from marshmallow_jsonschema import JSONSchema  # type: ignore
 
-from flask_muck.types import JsonDict
-from flask_muck.utils import get_url_rule, get_pk_type, get_url_path_variable
+from flask_muck.types import JsonDict, SerializerType
+from flask_muck.utils import (
+    get_url_rule,
+    get_pk_type,
+    get_url_path_variable,
+    get_serializer_field_names,
+)
 
 if TYPE_CHECKING:
     from flask_muck import FlaskMuckApiView
@@ -42,6 +47,73 @@ def _get_path_parameters(
     return parameters
 
 
+def _get_fields_parameter(serializer: SerializerType) -> JsonDict:
+    """Returns the OpenAPI query parameter used to request a sparse fieldset from a serializer."""
+    field_names = ", ".join(
+        f"`{name}`" for name in get_serializer_field_names(serializer)
+    )
+    if issubclass(serializer, Schema):
+        effect = (
+            "Only the requested fields are fetched from the database and serialized."
+        )
+    else:
+        # Pydantic models are validated in full, so every column they read is fetched.
+        effect = "Only the requested fields are serialized."
+    return {
+        "name": "fields",
+        "in": "query",
+        "description": "Comma separated list of fields to include in the response. "
+        f"{effect} Available fields: {field_names}.",
+        "required": False,
+        "style": "form",
+        "explode": False,
+        "schema": {"type": "array", "items": {"type": "string"}},
+    }
+
+
+def _add_schema_component(
+    api_spec: APISpec, serializer: SerializerType, pydantic_name: str
+) -> str:
+    """Adds a serializer to the spec's component schemas unless it's already there and returns its name. Marshmallow
+    schemas are named by marshmallow-jsonschema while Pydantic models use `pydantic_name`.
+    """
+    if issubclass(serializer, Schema):
+        json_schema = JSONSchema().dump(serializer())
+        # There will only be a single entry in the json schema. Extract the resource name and component schema from it.
+        name, component_schema = list(json_schema["definitions"].items())[0]
+    else:
+        name, component_schema = pydantic_name, serializer.model_json_schema()
+    if name not in api_spec.components.schemas:
+        api_spec.components.schema(name, component_schema, lazy=False)
+    return name
+
+
+def _get_content(muck_view: type[FlaskMuckApiView], schema: Any) -> JsonDict:
+    """Returns the OpenAPI content of a request or response body in each of the view's media types."""
+    return {media_type: {"schema": schema} for media_type in muck_view.media_types}
+
+
+def _get_request_body(
+    api_spec: APISpec,
+    muck_view: type[FlaskMuckApiView],
+    serializer: SerializerType,
+    allow_many: bool = False,
+) -> JsonDict:
+    """Returns the OpenAPI request body of a write operation. `allow_many` allows an array of objects for bulk
+    creates.
+    """
+    # Pydantic response schemas are named after the Model, so the same name is used when they're reused for input.
+    pydantic_name = (
+        muck_view.Model.__name__
+        if serializer is muck_view.ResponseSchema
+        else serializer.__name__
+    )
+    schema: Any = _add_schema_component(api_spec, serializer, pydantic_name)
+    if allow_many:
+        schema = {"oneOf": [schema, {"type": "array", "items": schema}]}
+    return {"required": True, "content": _get_content(muck_view, schema)}
+
+
 def _convert_flask_path_to_openapi_path(url_path: str) -> str:
     """String manipulation to convert flask url path style to OpenAPI style."""
     return (
@@ -61,28 +133,32 @@ def update_spec_from_muck_view(
     tag_name = muck_view.api_name
     api_spec.tag({"name": tag_name})
 
-    resource_name = muck_view.Model.__name__
-
-    if issubclass(muck_view.ResponseSchema, Schema):
-        json_schema = JSONSchema().dump(muck_view.ResponseSchema())
-        # There will only be a single entry in the json schema. Extract the resource name and component schema from it.
-        resource_name, component_schema = list(json_schema["definitions"].items())[0]
-    else:
-        component_schema = muck_view.ResponseSchema.model_json_schema()
-    api_spec.components.schema(resource_name, component_schema, lazy=False)
+    resource_name = _add_schema_component(
+        api_spec, muck_view.ResponseSchema, muck_view.Model.__name__
+    )
 
     path = get_url_rule(muck_view, None, url_prefix=url_prefix)
     path = _convert_flask_path_to_openapi_path(path)
 
     success_description = "Successful operation"
-    instance_operations = {}
+    instance_operations: JsonDict = {}
     if "POST" in muck_view.allowed_methods:
         instance_operations["post"] = {
             "tags": [tag_name],
             "summary": f"Create {resource_name} resource",
+            "description": f"Accepts a single {resource_name} object or an array of objects to create in bulk. "
+            "Bulk creates are atomic and respond with an array.",
             "responses": {
                 "201": {
-                    "content": {"application/json": {"schema": resource_name}},
+                    "content": _get_content(
+                        muck_view,
+                        {
+                            "oneOf": [
+                                resource_name,
+                                {"type": "array", "items": resource_name},
+                            ]
+                        },
+                    ),
                     "description": success_description,
                 }
             },
@@ -91,9 +167,14 @@ def update_spec_from_muck_view(
         instance_operations["get"] = {
             "tags": [tag_name],
             "summary": f"Fetch {resource_name} resource",
+            "parameters": [
+                _get_fields_parameter(
+                    muck_view.DetailSchema or muck_view.ResponseSchema
+                )
+            ],
             "responses": {
                 "200": {
-                    "content": {"application/json": {"schema": resource_name}},
+                    "content": _get_content(muck_view, resource_name),
                     "description": success_description,
                 }
             },
@@ -104,7 +185,7 @@ def update_spec_from_muck_view(
             "summary": f"Update {resource_name} resource",
             "responses": {
                 "200": {
-                    "content": {"application/json": {"schema": resource_name}},
+                    "content": _get_content(muck_view, resource_name),
                     "description": success_description,
                 }
             },
@@ -115,7 +196,7 @@ def update_spec_from_muck_view(
             "summary": f"Patch {resource_name} resource",
             "responses": {
                 "200": {
-                    "content": {"application/json": {"schema": resource_name}},
+                    "content": _get_content(muck_view, resource_name),
                     "description": success_description,
                 }
             },
@@ -127,6 +208,17 @@ def update_spec_from_muck_view(
             "responses": {"204": {"description": "Deleted successfully"}},
         }
 
+    request_schemas = {
+        "post": muck_view.CreateSchema,
+        "put": muck_view.UpdateSchema,
+        "patch": muck_view.PatchSchema or muck_view.UpdateSchema,
+    }
+    for method, serializer in request_schemas.items():
+        if method in instance_operations and serializer is not None:
+            instance_operations[method]["requestBody"] = _get_request_body(
+                api_spec, muck_view, serializer, allow_many=method == "post"
+            )
+
     path_parameters = _get_path_parameters(muck_view)
     if muck_view.one_to_one_api:
         api_spec.path(
@@ -143,41 +235,32 @@ def update_spec_from_muck_view(
             parameters=path_parameters,
             operations=instance_operations,
         )
-        api_spec.path(
-            path=path,
-            parameters=path_parameters[:-1],
-            operations={
-                "get": {
-                    "summary": f"List {resource_name} resources",
-                    "description": f"Fetches {resource_name} resources with support for searching, filtering, "
-                    "sorting and pagination.",
-                    "tags": [tag_name],
-                    "parameters": [
-                        {
-                            "name": "limit",
-                            "in": "query",
-                            "description": "Number of resources to return. Using this parameter will return a paginated response.",
-                            "required": False,
-                            "schema": {"type": "integer"},
-                        },
-                        {
-                            "name": "offset",
-                            "in": "query",
-                            "description": "Number of resources to skip. Using this parameter will return a paginated response.",
-                            "required": False,
-                            "schema": {"type": "integer"},
-                        },
-                        {
-                            "name": "search",
-                            "in": "query",
-                            "description": "Search term to match resources against.",
-                            "required": False,
-                            "schema": {"type": "string"},
-                        },
-                        {
-                            "name": "filter",
-                            "in": "query",
-                            "description": f"""
+        list_parameters = [
+            {
+                "name": "limit",
+                "in": "query",
+                "description": "Number of resources to return. Using this parameter will return a paginated response.",
+                "required": False,
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": "offset",
+                "in": "query",
+                "description": "Number of resources to skip. Using this parameter will return a paginated response.",
+                "required": False,
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": "search",
+                "in": "query",
+                "description": "Search term to match resources against.",
+                "required": False,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": "filter",
+                "in": "query",
+                "description": f"""
 JSON-encoded object used to filter the resources. Filtering can be done 
 against any field on the resource and supports filtering against relationships 
 using dot notation. Operators are supported using the syntax:  `<column>{muck_view.operator_separator}<operator>` 
@@ -194,54 +277,130 @@ for more complex filtering. Available operators are below:.
 | `in`     | In                       |
 | `not_in` | Not In                   |
 """,
-                            "required": False,
-                            "schema": {
-                                "type": "string",
+                "required": False,
+                "schema": {
+                    "type": "string",
+                },
+            },
+            {
+                "name": "sort",
+                "in": "query",
+                "description": "Sorts resources by the provided field. Use dot notation to sort by a "
+                "related field and the `asc` or `desc` suffix to specify the sort order.",
+                "example": f"id{muck_view.operator_separator}asc",
+                "required": False,
+                "schema": {"type": "string"},
+            },
+            _get_fields_parameter(muck_view.ResponseSchema),
+        ]
+        list_response_schemas: list[JsonDict] = [
+            {
+                "type": "array",
+                "items": {
+                    "$ref": f"#/components/schemas/{resource_name}",
+                },
+            },
+            {
+                "type": "object",
+                "properties": {
+                    "total": {"type": "integer"},
+                    "limit": {"type": "integer"},
+                    "offset": {"type": "integer"},
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "$ref": f"#/components/schemas/{resource_name}",
+                        },
+                    },
+                },
+            },
+        ]
+        if muck_view.count_strategy == "none":
+            paginated_properties = list_response_schemas[1]["properties"]
+            del paginated_properties["total"]
+            paginated_properties["has_more"] = {"type": "boolean"}
+        if muck_view.allow_cursor_pagination:
+            list_parameters.append(
+                {
+                    "name": "cursor",
+                    "in": "query",
+                    "description": "Opaque cursor returned as `next_cursor` by the previous page. Pass an empty value "
+                    "to fetch the first page. Using this parameter will return a cursor paginated response.",
+                    "required": False,
+                    "schema": {"type": "string"},
+                }
+            )
+            list_response_schemas.append(
+                {
+                    "type": "object",
+                    "properties": {
+                        "limit": {"type": "integer"},
+                        "cursor": {"type": "string", "nullable": True},
+                        "next_cursor": {"type": "string", "nullable": True},
+                        "items": {
+                            "type": "array",
+                            "items": {
+                                "$ref": f"#/components/schemas/{resource_name}",
                             },
                         },
+                    },
+                }
+            )
+        collection_operations: JsonDict = {}
+        if muck_view.allows_bulk_modification(
+            "PATCH"
+        ) or muck_view.allows_bulk_modification("DELETE"):
+            filter_parameter = next(p for p in list_parameters if p["name"] == "filter")
+            bulk_parameters = [{**filter_parameter, "required": True}]
+            count_response = {
+                "200": {
+                    "description": success_description,
+                    "content": _get_content(
+                        muck_view,
                         {
-                            "name": "sort",
-                            "in": "query",
-                            "description": "Sorts resources by the provided field. Use dot notation to sort by a "
-                            "related field and the `asc` or `desc` suffix to specify the sort order.",
-                            "example": f"id{muck_view.operator_separator}asc",
-                            "required": False,
-                            "schema": {"type": "string"},
+                            "type": "object",
+                            "properties": {"count": {"type": "integer"}},
                         },
-                    ],
+                    ),
+                }
+            }
+            if muck_view.allows_bulk_modification("PATCH"):
+                collection_operations["patch"] = {
+                    "summary": f"Bulk patch {resource_name} resources",
+                    "description": f"Updates every {resource_name} resource matching the filter with a single "
+                    "statement and returns the number of resources updated.",
+                    "tags": [tag_name],
+                    "parameters": bulk_parameters,
+                    "responses": count_response,
+                }
+            if muck_view.allows_bulk_modification("DELETE"):
+                collection_operations["delete"] = {
+                    "summary": f"Bulk delete {resource_name} resources",
+                    "description": f"Deletes every {resource_name} resource matching the filter with a single "
+                    "statement and returns the number of resources deleted.",
+                    "tags": [tag_name],
+                    "parameters": bulk_parameters,
+                    "responses": count_response,
+                }
+        api_spec.path(
+            path=path,
+            parameters=path_parameters[:-1],
+            operations={
+                **collection_operations,
+                "get": {
+                    "summary": f"List {resource_name} resources",
+                    "description": f"Fetches {resource_name} resources with support for searching, filtering, "
+                    "sorting and pagination.",
+                    "tags": [tag_name],
+                    "parameters": list_parameters,
                     "responses": {
                         "200": {
                             "description": success_description,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "oneOf": [
-                                            {
-                                                "type": "array",
-                                                "items": {
-                                                    "$ref": f"#/components/schemas/{resource_name}",
-                                                },
-                                            },
-                                            {
-                                                "type": "object",
-                                                "properties": {
-                                                    "total": {"type": "integer"},
-                                                    "limit": {"type": "integer"},
-                                                    "offset": {"type": "integer"},
-                                                    "items": {
-                                                        "type": "array",
-                                                        "items": {
-                                                            "$ref": f"#/components/schemas/{resource_name}",
-                                                        },
-                                                    },
-                                                },
-                                            },
-                                        ]
-                                    }
-                                }
-                            },
+                            "content": _get_content(
+                                muck_view, {"oneOf": list_response_schemas}
+                            ),
                         }
                     },
-                }
+                },
             },
         )
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from logging import getLogger
+from threading import Lock
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from blinker import Namespace
+
+from flask_muck.types import JsonDict
+
+if TYPE_CHECKING:
+    from flask_muck.views import FlaskMuckApiView
+
+logger = getLogger(__name__)
+
+# Statement shapes executed at least this many times in a single request are reported as possible N+1 queries.
+N_PLUS_ONE_THRESHOLD = 3
+
+# Sent with the view class as the sender and the QueryProfile as `profile` after every profiled request.
+_signals = Namespace()
+queries_profiled = _signals.signal("flask-muck.queries-profiled")
+
+# Matches lists of bind parameters, such as IN clauses, which are collapsed so their length doesn't change the shape.
+_BIND_PARAM_LIST = re.compile(
+    r"\((?:\?|%s|%\(\w+\)s|:\w+)(?:, (?:\?|%s|%\(\w+\)s|:\w+))+\)"
+)
+
+_forced_profiling = 0
+_forced_profiling_lock = Lock()
+
+
+def get_statement_shape(statement: str) -> str:
+    """Returns a statement with its lists of bind parameters collapsed, so statements that only differ by the number
+    of values in an IN clause share a shape.
+    """
+    return _BIND_PARAM_LIST.sub("(?)", " ".join(statement.split()))
+
+
+class QueryProfile:
+    """The SQL statements executed while handling a request, each with the phase of the request it was executed in.
+    Phases are "parse", "query", "count", "serialize", "callbacks" and "encode".
+    """
+
+    def __init__(
+        self,
+        view: type[FlaskMuckApiView],
+        method: str,
+        path: str,
+        statements: list[tuple[str, str]],
+    ):
+        self.view = view
+        self.method = method
+        self.path = path
+        self.statements = statements
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def get_counts_by_phase(self) -> dict[str, int]:
+        return dict(Counter(phase for phase, _ in self.statements))
+
+    def get_repeated_statements(
+        self, threshold: int = N_PLUS_ONE_THRESHOLD
+    ) -> dict[str, int]:
+        """Returns the statement shapes executed at least `threshold` times, which usually indicates an N+1 pattern such
+        as a relationship lazy loaded once per serialized resource.
+        """
+        shapes = Counter(
+            get_statement_shape(statement) for _, statement in self.statements
+        )
+        return {shape: count for shape, count in shapes.items() if count >= threshold}
+
+    def to_dict(self) -> JsonDict:
+        return {
+            "view": self.view.__name__,
+            "method": self.method,
+            "path": self.path,
+            "count": self.count,
+            "phases": self.get_counts_by_phase(),
+            "repeated_statements": self.get_repeated_statements(),
+        }
+
+
+def is_profiling_forced() -> bool:
+    return _forced_profiling > 0
+
+
+@contextmanager
+def profile_queries() -> Iterator[list[QueryProfile]]:
+    """Profiles the SQL statements of every request handled by a FlaskMuckApiView inside the block, whether or not
+    the view has `query_profiling` enabled, and collects the profiles in the yielded list.
+    """
+    global _forced_profiling
+    profiles: list[QueryProfile] = []
+
+    def receiver(sender: type[FlaskMuckApiView], profile: QueryProfile) -> None:
+        profiles.append(profile)
+
+    with _forced_profiling_lock:
+        _forced_profiling += 1
+    try:
+        with queries_profiled.connected_to(receiver):
+            yield profiles
+    finally:
+        with _forced_profiling_lock:
+            _forced_profiling -= 1
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int,
+    view: Optional[type[FlaskMuckApiView]] = None,
+    allow_n_plus_one: bool = False,
+) -> Iterator[list[QueryProfile]]:
+    """Fails if any request handled inside the block, optionally only those handled by `view`, executes more than
+    `max_queries` SQL statements or, unless `allow_n_plus_one` is set, repeats a statement shape enough times to look
+    like an N+1 pattern. Intended for tests:
+
+        with assert_max_queries(2, view=GuardianApiView):
+            client.get("/guardians/")
+    """
+    with profile_queries() as profiles:
+        yield profiles
+    failures = []
+    for profile in profiles:
+        if view is not None and profile.view is not view:
+            continue
+        if profile.count > max_queries:
+            failures.append(
+                f"{profile.method} {profile.path} executed {profile.count} queries, exceeding the budget of "
+                f"{max_queries}. Queries by phase: {profile.get_counts_by_phase()}"
+            )
+        if not allow_n_plus_one and (repeated := profile.get_repeated_statements()):
+            failures.append(
+                f"{profile.method} {profile.path} repeated statements that look like N+1 queries: {repeated}"
+            )
+    if failures:
+        raise AssertionError("\n".join(failures))
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import scoped_session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from werkzeug.exceptions import BadRequest
+
+from flask_muck.exceptions import MuckImplementationError
+from flask_muck.types import ResourceId, SqlaModelType
+from flask_muck.utils import get_view_plan
+
+if TYPE_CHECKING:
+    from flask_muck.views import FlaskMuckApiView
+
+
+class SearchBackend(ABC):
+    """The interface for search backends used by Flask-Muck to handle the `search` query param. Search backends
+    translate a search string into a filter on a view's `searchable_columns` and can optionally rank results by
+    relevance and maintain a search index as resources are written.
+
+    Attributes:
+        supports_ranking (bool): Indicates whether the backend implements `get_rank`, allowing search results to be
+            sorted by relevance.
+        maintains_index (bool): Indicates whether the backend keeps its own index that must be updated whenever
+            resources are created, updated or deleted.
+    """
+
+    supports_ranking: bool = False
+    maintains_index: bool = False
+
+    @abstractmethod
+    def get_filter(
+        self, view: type[FlaskMuckApiView], search: str
+    ) -> tuple[ColumnElement, set[SqlaModelType]]:
+        """Returns a filter matching the search string and the set of models that must be joined to the base query."""
+        ...
+
+    def get_rank(self, view: type[FlaskMuckApiView], search: str) -> ColumnElement:
+        """Returns an expression ranking resources against the search string. Higher values are more relevant."""
+        raise NotImplementedError
+
+    def index(
+        self,
+        session: scoped_session,
+        view: type[FlaskMuckApiView],
+        resource_ids: Sequence[ResourceId],
+    ) -> None:
+        """Adds or refreshes resources in the search index. Called in the same transaction as the write."""
+
+    def remove(
+        self,
+        session: scoped_session,
+        view: type[FlaskMuckApiView],
+        resource_ids: Sequence[ResourceId],
+    ) -> None:
+        """Removes resources from the search index. Called in the same transaction as the delete."""
+
+
+def _get_model_columns(view: type[FlaskMuckApiView]) -> list[InstrumentedAttribute]:
+    """Returns the view's searchable columns, all of which must belong to the view's Model."""
+    if not view.searchable_columns:
+        raise MuckImplementationError(f"{view.__name__} has no searchable_columns.")
+    for _column in view.searchable_columns:
+        if _column.parent.class_ is not view.Model:
+            raise MuckImplementationError(
+                f"{view.__name__} searchable column {_column} is not a column of {view.Model.__name__}. Only "
+                f"columns of the view's Model are supported by full-text search backends."
+            )
+    return view.searchable_columns
+
+
+class ILikeSearchBackend(SearchBackend):
+    """The default search backend. Matches resources where any of the searchable columns contain the search string
+    using a case-insensitive `LIKE '%search%'` comparison. It needs no setup and supports columns of related models,
+    but can't use an index so every search scans the table.
+    """
+
+    def get_filter(
+        self, view: type[FlaskMuckApiView], search: str
+    ) -> tuple[ColumnElement, set[SqlaModelType]]:
+        searches = []
+        join_models = set()
+        for _column in view.searchable_columns:
+            join_models.add(_column.parent.class_)
+            searches.append(_column.ilike(f"%{search}%"))
+        if len(searches) == 1:
+            return searches[0], join_models
+        return or_(*searches), join_models
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    """Searches an SQLite FTS5 virtual table holding a copy of the view's searchable columns, keyed by the Model's
+    integer primary key. Each word of the search string is matched as a prefix and results can be sorted by bm25
+    relevance. The index is updated in the same transaction as every write made through the view. Writes made
+    elsewhere must be indexed with `index` or the whole index rebuilt with `create_index`.
+
+    Attributes:
+        table_name (Optional[str]): The name of the FTS5 table. Defaults to the Model's table name suffixed with
+            `_fts`.
+    """
+
+    supports_ranking = True
+    maintains_index = True
+
+    def __init__(self, table_name: Optional[str] = None):
+        self.table_name = table_name
+
+    def _get_fts_table_name(self, view: type[FlaskMuckApiView]) -> str:
+        return self.table_name or f"{view.Model.__tablename__}_fts"
+
+    def _get_match(self, view: type[FlaskMuckApiView], search: str) -> ColumnElement:
+        words = search.replace('"', '""').split()
+        if not words:
+            # FTS5 rejects an empty MATCH string as a syntax error.
+            raise BadRequest("Search must contain at least one word.")
+        # Words are quoted so FTS5 query syntax in the search string is matched literally.
+        query = " ".join(f'"{word}"*' for word in words)
+        return literal_column(self._get_fts_table_name(view)).op("MATCH")(query)
+
+    def create_index(
+        self, session: scoped_session, view: type[FlaskMuckApiView]
+    ) -> None:
+        """Creates the FTS5 table if it doesn't exist and rebuilds it from the Model's table."""
+        fts_table_name = self._get_fts_table_name(view)
+        column_names = ", ".join(c.key for c in _get_model_columns(view))
+        session.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table_name} USING fts5({column_names})"
+            )
+        )
+        session.execute(text(f"DELETE FROM {fts_table_name}"))
+        self.index(session, view, None)
+
+    def get_filter(
+        self, view: type[FlaskMuckApiView], search: str
+    ) -> tuple[ColumnElement, set[SqlaModelType]]:
+        fts_table = table(self._get_fts_table_name(view), column("rowid"))
+        matches = select(fts_table.c.rowid).where(self._get_match(view, search))
+        return get_view_plan(view).pk_column.in_(matches), {view.Model}
+
+    def get_rank(self, view: type[FlaskMuckApiView], search: str) -> ColumnElement:
+        fts_table = table(self._get_fts_table_name(view), column("rowid"))
+        # FTS5 ranks better matches with lower values.
+        return -(
+            select(literal_column("rank"))
+            .select_from(fts_table)
+            .where(
+                self._get_match(view, search),
+                fts_table.c.rowid == get_view_plan(view).pk_column,
+            )
+            .scalar_subquery()
+        )
+
+    def index(
+        self,
+        session: scoped_session,
+        view: type[FlaskMuckApiView],
+        resource_ids: Optional[Sequence[ResourceId]],
+    ) -> None:
+        """Copies resources from the Model's table to the FTS5 table. Every resource is copied if `resource_ids` is
+        None.
+        """
+        columns = _get_model_columns(view)
+        pk_column = get_view_plan(view).pk_column
+        fts_table = table(
+            self._get_fts_table_name(view),
+            column("rowid"),
+            *[column(c.key) for c in columns],
+        )
+        rows = select(pk_column, *columns)
+        # Statements on the FTS5 table don't trigger autoflush so pending changes are flushed before they're copied.
+        session.flush()
+        if resource_ids is not None:
+            self.remove(session, view, resource_ids)
+            rows = rows.where(pk_column.in_(resource_ids))
+        session.execute(insert(fts_table).from_select(list(fts_table.c), rows))
+
+    def remove(
+        self,
+        session: scoped_session,
+        view: type[FlaskMuckApiView],
+        resource_ids: Sequence[ResourceId],
+    ) -> None:
+        fts_table = table(self._get_fts_table_name(view), column("rowid"))
+        session.execute(delete(fts_table).where(fts_table.c.rowid.in_(resource_ids)))
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Matches resources using Postgres full-text search, parsing the search string with `websearch_to_tsquery` and
+    ranking results with `ts_rank`.
+
+    By default the document is built from the searchable columns on every query. Create a matching expression index
+    so searches can use it, e.g.
+    `CREATE INDEX ... USING GIN (to_tsvector('english', concat_ws(' ', name, description)))`. Alternatively store
+    the document in a generated `tsvector` column with a GIN index and set `vector_column` to its name. Either way
+    Postgres keeps the index up to date itself.
+
+    Attributes:
+        config (str): The text search configuration used to parse documents and search strings.
+        vector_column (Optional[str]): The name of a `tsvector` column on the Model to search instead of the
+            searchable columns.
+    """
+
+    supports_ranking = True
+
+    def __init__(self, config: str = "english", vector_column: Optional[str] = None):
+        self.config = config
+        self.vector_column = vector_column
+
+    def _get_vector(self, view: type[FlaskMuckApiView]) -> ColumnElement:
+        if self.vector_column is not None:
+            return getattr(view.Model, self.vector_column)
+        columns = _get_model_columns(view)
+        return func.to_tsvector(self.config, func.concat_ws(" ", *columns))
+
+    def _get_query(self, search: str) -> ColumnElement:
+        return func.websearch_to_tsquery(self.config, search)
+
+    def get_filter(
+        self, view: type[FlaskMuckApiView], search: str
+    ) -> tuple[ColumnElement, set[SqlaModelType]]:
+        return self._get_vector(view).op("@@")(self._get_query(search)), {view.Model}
+
+    def get_rank(self, view: type[FlaskMuckApiView], search: str) -> ColumnElement:
+        return func.ts_rank(self._get_vector(view), self._get_query(search))
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Iterator, Optional
+
+from blinker import Namespace
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Sent with the view class as the sender and the phase durations in milliseconds as `timings` after every timed
+# request.
+_signals = Namespace()
+request_timed = _signals.signal("flask-muck.request-timed")
+
+# The timer of the request currently being handled, if it is timed.
+_current_timer: ContextVar[Optional[RequestTimer]] = ContextVar(
+    "flask_muck_request_timer", default=None
+)
+
+_sql_timing_lock = Lock()
+_sql_timing_installed = False
+
+
+class RequestTimer:
+    """Times the phases of a request. Phases nest and each one only records the time spent in it while it is the
+    innermost phase, so the phase durations add up to the time spent in the view. SQL execution time is recorded
+    separately under "sql" and overlaps the phase it occurred in. If `record_statements` is set the SQL statements
+    executed are also recorded along with the phase they were executed in.
+    """
+
+    def __init__(self, record_statements: bool = False) -> None:
+        self.durations: dict[str, float] = {}
+        self.statements: Optional[list[tuple[str, str]]] = (
+            [] if record_statements else None
+        )
+        self._phases: list[str] = []
+        self._started_at = self._mark = time.perf_counter()
+
+    def _record_current_phase(self) -> None:
+        now = time.perf_counter()
+        if self._phases:
+            name = self._phases[-1]
+            self.durations[name] = self.durations.get(name, 0.0) + now - self._mark
+        self._mark = now
+
+    def push(self, name: str) -> None:
+        """Starts a phase, pausing the current one until it ends."""
+        self._record_current_phase()
+        self._phases.append(name)
+
+    def pop(self) -> None:
+        """Ends the current phase and resumes the one it interrupted."""
+        self._record_current_phase()
+        self._phases.pop()
+
+    @property
+    def current_phase(self) -> Optional[str]:
+        return self._phases[-1] if self._phases else None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Adds time measured elsewhere to a phase without affecting the current phase."""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def get_timings(self) -> dict[str, float]:
+        """Returns the duration of each phase and the total duration in milliseconds."""
+        timings = {name: seconds * 1000 for name, seconds in self.durations.items()}
+        timings["total"] = (time.perf_counter() - self._started_at) * 1000
+        return timings
+
+
+def get_request_timer() -> Optional[RequestTimer]:
+    """Returns the timer of the request currently being handled or None if the request isn't timed."""
+    return _current_timer.get()
+
+
+@contextmanager
+def request_timer(record_statements: bool = False) -> Iterator[RequestTimer]:
+    """Times the request handled inside the block."""
+    _install_sql_timing()
+    timer = RequestTimer(record_statements)
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+@contextmanager
+def request_phase(name: str) -> Iterator[None]:
+    """Records the time spent in the block as a phase of the current request. Does nothing for untimed requests."""
+    if (timer := _current_timer.get()) is None:
+        yield
+        return
+    with timer.phase(name):
+        yield
+
+
+def timed_phase(name: str) -> Callable:
+    """Decorates a function so the time spent in it is recorded as a phase of timed requests."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if (timer := _current_timer.get()) is None:
+                return func(*args, **kwargs)
+            with timer.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_parsing(parse_decorator: Callable) -> Callable:
+    """Wraps a webargs parsing decorator, such as `parser.use_kwargs(...)`, so the time spent parsing the request is
+    recorded as the "parse" phase of timed requests.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        def parsed(*args: Any, **kwargs: Any) -> Any:
+            if (timer := _current_timer.get()) is not None:
+                timer.pop()
+            return func(*args, **kwargs)
+
+        parse_and_call = parse_decorator(wraps(func)(parsed))
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if (timer := _current_timer.get()) is None:
+                return parse_and_call(*args, **kwargs)
+            timer.push("parse")
+            try:
+                return parse_and_call(*args, **kwargs)
+            except Exception:
+                # Parsing errors are raised before the phase is ended by `parsed`.
+                if timer.current_phase == "parse":
+                    timer.pop()
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    """Formats phase durations in milliseconds as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={duration:.2f}" for name, duration in timings.items())
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    if _current_timer.get() is not None:
+        conn.info.setdefault("flask_muck_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if (timer := _current_timer.get()) is not None and (
+        starts := conn.info.get("flask_muck_query_start")
+    ):
+        timer.add("sql", time.perf_counter() - starts.pop())
+        if timer.statements is not None:
+            timer.statements.append((timer.current_phase or "query", statement))
+
+
+def _install_sql_timing() -> None:
+    """Listens to statement execution on every engine the first time a request is timed."""
+    global _sql_timing_installed
+    if _sql_timing_installed:
+        return
+    with _sql_timing_lock:
+        if not _sql_timing_installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _sql_timing_installed = True
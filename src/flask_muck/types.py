@@ -1,4 +1,4 @@
-from typing import Any, Union
+from typing import Any, Union, Literal
 
 from marshmallow import Schema
 from pydantic import BaseModel
@@ -18,3 +18,7 @@ ResourceId = Union[str, int]
 SqlaModelType = type[DeclarativeBase]
 SqlaModel = DeclarativeBase
 SerializerType = Union[type[Schema], type[BaseModel]]
+EagerLoadStrategy = Literal[
+    "selectin", "joined", "subquery", "immediate", "lazy", "noload", "raise"
+]
+RelationshipFilterStrategy = Literal["auto", "join", "exists"]
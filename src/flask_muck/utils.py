@@ -1,16 +1,53 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Union, Literal
+import base64
+import binascii
+import json
+import operator
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+    Union,
+    Literal,
+    Iterable,
+    Iterator,
+    Any,
+    Callable,
+    NamedTuple,
+    Sequence,
+    Collection,
+    get_args,
+    get_origin,
+)
 
 import humps
 from apispec import APISpec
 from flask import request, Blueprint, Flask
-from marshmallow import Schema
-from pydantic import BaseModel, create_model
+from marshmallow import Schema, fields as mf
+from marshmallow import ValidationError as MarshmallowValidationError
+from pydantic import BaseModel, create_model, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy import Column, inspect
+from sqlalchemy import orm as sqlalchemy_orm
+from sqlalchemy.orm import Load, MANYTOONE
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement, BinaryExpression
+from werkzeug.exceptions import BadRequest
 
 from flask_muck.exceptions import MuckImplementationError
-from flask_muck.types import SqlaModelType, SqlaModel, JsonDict, SerializerType
+from flask_muck.timing import timed_phase
+from flask_muck.types import (
+    SqlaModelType,
+    SqlaModel,
+    JsonDict,
+    SerializerType,
+    EagerLoadStrategy,
+)
 
 if TYPE_CHECKING:
     from flask_muck.views import FlaskMuckApiView
@@ -36,9 +73,7 @@ def get_url_rule(
     return f"{url_prefix}{rule}"
 
 
-def get_fk_column(
-    parent_model: SqlaModelType, child_model: SqlaModelType
-) -> Optional[Column]:
+def get_fk_column(parent_model: SqlaModelType, child_model: SqlaModelType) -> Column:
     """Get the foreign key column for a child model."""
     for column in inspect(child_model).columns:
         if column.foreign_keys:
@@ -65,20 +100,81 @@ def get_pk_type(model: SqlaModelType) -> Literal["str", "int"]:
         return "str"
 
 
+class ViewPlan(NamedTuple):
+    """Values derived only from a FlaskMuckApiView's class configuration. They are compiled once, when the view is
+    registered, so requests read them instead of inspecting the models again.
+    """
+
+    Model: SqlaModelType
+    parent: Optional[type[FlaskMuckApiView]]
+    allowed_methods_source: Collection[str]
+    allowed_methods: frozenset[str]
+    pk_column: Column
+    pk_type: Literal["str", "int"]
+    url_path_variable: str
+    # Foreign key columns and the url path variables they are compared to, from the view's own parent upwards.
+    path_filters: tuple[tuple[Column, str], ...]
+
+    def is_current(self, view: type[FlaskMuckApiView]) -> bool:
+        """Indicates whether the configuration the plan was compiled from is still set on the view."""
+        return (
+            self.Model is view.Model
+            and self.parent is view.parent
+            and self.allowed_methods_source is view.allowed_methods
+        )
+
+
+_view_plans: dict[type[FlaskMuckApiView], ViewPlan] = {}
+
+
+def compile_muck_view(muck_view: type[FlaskMuckApiView]) -> ViewPlan:
+    """Compiles and stores the plan for a FlaskMuckApiView class."""
+    path_filters = []
+    view = muck_view
+    while view.parent:
+        path_filters.append(
+            (
+                get_fk_column(view.parent.Model, view.Model),
+                get_url_path_variable(view.parent),
+            )
+        )
+        view = view.parent
+    plan = ViewPlan(
+        Model=muck_view.Model,
+        parent=muck_view.parent,
+        allowed_methods_source=muck_view.allowed_methods,
+        allowed_methods=frozenset(m.lower() for m in muck_view.allowed_methods),
+        pk_column=get_pk_column(muck_view.Model),
+        pk_type=get_pk_type(muck_view.Model),
+        url_path_variable=get_url_path_variable(muck_view),
+        path_filters=tuple(path_filters),
+    )
+    _view_plans[muck_view] = plan
+    return plan
+
+
+def get_view_plan(view: Union[type[FlaskMuckApiView], FlaskMuckApiView]) -> ViewPlan:
+    """Returns the compiled plan for a view. Views are compiled when registered but are compiled on first use, or
+    recompiled if their configuration has been replaced since, so the plan is always current.
+    """
+    view_class = view if isinstance(view, type) else type(view)
+    plan = _view_plans.get(view_class)
+    if plan is None or not plan.is_current(view_class):
+        plan = compile_muck_view(view_class)
+    return plan
+
+
 def get_query_filters_from_request_path(
     view: Union[type[FlaskMuckApiView], FlaskMuckApiView], query_filters: list
 ) -> list:
-    """Recursively builds query kwargs from the request path based on nested MuckApiViews. If the view has no parent
-    then nothing is done and original query_kwargs are returned.
+    """Builds query filters from the request path based on nested MuckApiViews. If the view has no parent then nothing
+    is done and original query_filters are returned.
     """
-    if view.parent:
-        child_model = view.Model
-        parent_model = view.parent.Model
-        fk_column = get_fk_column(parent_model, child_model)
-        query_filters.append(
-            fk_column == request.view_args[get_url_path_variable(view.parent)]
-        )
-        return get_query_filters_from_request_path(view.parent, query_filters)
+    view_args = request.view_args or {}
+    query_filters.extend(
+        fk_column == view_args[url_path_variable]
+        for fk_column, url_path_variable in get_view_plan(view).path_filters
+    )
     return query_filters
 
 
@@ -94,29 +190,398 @@ def get_join_models_from_parent_views(
     return join_models
 
 
+FILTER_PLAN_CACHE_SIZE = 1024
+
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], BinaryExpression]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "ne": operator.ne,
+    "in": lambda column, value: column.in_(value),
+    "not_in": lambda column, value: column.not_in(value),
+}
+
+
+class CompiledFilter(NamedTuple):
+    """A filter key resolved to the column it filters, the operator it applies and, for filters on a related model's
+    column, the relationship and the model that must be joined.
+    """
+
+    key: str
+    column: InstrumentedAttribute
+    operator: Callable[[Any, Any], BinaryExpression]
+    join_model: Optional[SqlaModelType]
+    relationship: Optional[InstrumentedAttribute] = None
+
+
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def compile_filter_plan(
+    model: SqlaModelType, filter_keys: tuple[str, ...], operator_separator: str
+) -> tuple[CompiledFilter, ...]:
+    """Resolves the column, relationship and operator of each filter key once. Plans are cached by the shape of the
+    filters, their keys and operators but not their values, so repeated filter shapes skip the parsing and mapper
+    lookups. Values are bound when the plan is applied so the resulting statements only differ by their bind
+    parameters and hit SQLAlchemy's compiled statement cache.
+    """
+    compiled_filters = []
+    for key in filter_keys:
+        column_name, _, operator_name = key.partition(operator_separator)
+
+        # Handle nested filters.
+        join_model = None
+        field = None
+        _Model = model
+        if "." in column_name:
+            relationship_name, column_name = column_name.split(".")
+            field = getattr(model, relationship_name, None)
+            if not field:
+                raise BadRequest(
+                    f"{column_name} is not a valid filter field. The relationship does not exist."
+                )
+            _Model = join_model = field.property.mapper.class_
+
+        if not (column := getattr(_Model, column_name, None)):
+            raise BadRequest(f"{column_name} is not a valid filter field.")
+
+        compiled_filters.append(
+            CompiledFilter(
+                key=key,
+                column=column,
+                operator=FILTER_OPERATORS.get(operator_name, operator.eq),
+                join_model=join_model,
+                relationship=field,
+            )
+        )
+    return tuple(compiled_filters)
+
+
+@lru_cache(maxsize=256)
+def join_fans_out(model: SqlaModelType, join_model: SqlaModelType) -> bool:
+    """Indicates whether joining a related model to a model's query can return a row more than once. Only joins to
+    the "one" side of a many-to-one relationship, or to a model referenced by a foreign key when there's no
+    relationship, are known not to fan out.
+    """
+    relationships = [
+        r for r in inspect(model).relationships if r.mapper.class_ is join_model
+    ]
+    if relationships:
+        return any(r.direction is not MANYTOONE for r in relationships)
+    join_table = inspect(join_model).local_table
+    return not any(
+        fk.column.table is join_table for fk in inspect(model).local_table.foreign_keys
+    )
+
+
+@lru_cache(maxsize=256)
+def get_marshmallow_schema(serializer: type[Schema], many: bool = False) -> Schema:
+    """Returns a cached instance of a Marshmallow schema. Building a schema instance is relatively expensive so a single
+    instance is shared for all serialization done with the schema class.
+    """
+    return serializer(many=many)
+
+
+@lru_cache(maxsize=256)
+def get_pydantic_list_adapter(serializer: type[BaseModel]) -> TypeAdapter:
+    """Returns a cached TypeAdapter used to validate and dump a list of instances with a Pydantic model in one pass."""
+    return TypeAdapter(list[serializer])  # type: ignore
+
+
+@timed_phase("serialize")
 def serialize_model_instance(
     instance: SqlaModel, serializer: SerializerType
 ) -> JsonDict:
     """Serializes a SQLAlchemy model instance using a Marshmallow schema or Pydantic model."""
     if issubclass(serializer, Schema):
-        return serializer().dump(instance)
+        return get_marshmallow_schema(serializer).dump(instance)
     elif issubclass(serializer, BaseModel):
-        return serializer.model_validate(instance, from_attributes=True).model_dump()
+        return serializer.model_validate(instance, from_attributes=True).model_dump(
+            include=getattr(serializer, "__muck_sparse_fields__", None)
+        )
     else:
         raise TypeError(
             f"Schemas must be Marshmallow Schemas or Pydantic BaseModels. {serializer} is a {type(serializer)}"
         )
 
 
-def pydantic_model_to_optional(model: type[BaseModel]) -> type[BaseModel]:
-    """Returns a new model where all fields are Optional. Used for PATCH JSON payload validation."""
-    return create_model(  # type: ignore
-        model.__class__.__name__,
-        **{
-            name: (Optional[type_], None)
-            for name, type_ in model.__annotations__.items()
-        },
+@timed_phase("serialize")
+def serialize_model_instances(
+    instances: Iterable[SqlaModel], serializer: SerializerType
+) -> list[JsonDict]:
+    """Serializes a collection of SQLAlchemy model instances using a Marshmallow schema or Pydantic model. The whole
+    collection is serialized in a single pass using a cached `Schema(many=True)` or `TypeAdapter(list[Model])`.
+    """
+    if issubclass(serializer, Schema):
+        return get_marshmallow_schema(serializer, many=True).dump(instances)
+    elif issubclass(serializer, BaseModel):
+        adapter = get_pydantic_list_adapter(serializer)
+        sparse_fields = getattr(serializer, "__muck_sparse_fields__", None)
+        return adapter.dump_python(
+            adapter.validate_python(list(instances), from_attributes=True),
+            include=None if sparse_fields is None else {"__all__": sparse_fields},
+        )
+    else:
+        raise TypeError(
+            f"Schemas must be Marshmallow Schemas or Pydantic BaseModels. {serializer} is a {type(serializer)}"
+        )
+
+
+EAGER_LOAD_MAX_DEPTH = 5
+
+LOADER_OPTION_NAMES: dict[str, str] = {
+    "selectin": "selectinload",
+    "joined": "joinedload",
+    "subquery": "subqueryload",
+    "immediate": "immediateload",
+    "lazy": "lazyload",
+    "noload": "noload",
+    "raise": "raiseload",
+}
+
+
+def _get_pydantic_nested_model(annotation: Any) -> Optional[type[BaseModel]]:
+    """Returns the Pydantic model found in a field annotation such as `Child`, `Optional[Child]` or `list[Child]`."""
+    if (
+        get_origin(annotation) is None
+        and isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+    ):
+        return annotation
+    for arg in get_args(annotation):
+        if model := _get_pydantic_nested_model(arg):
+            return model
+    return None
+
+
+def _get_serialized_attributes(
+    serializer: SerializerType,
+) -> Iterator[tuple[str, Optional[SerializerType]]]:
+    """Yields the name of each model attribute read by a serializer along with the serializer used for the nested
+    value, if any.
+    """
+    if issubclass(serializer, Schema):
+        for field_name, field in get_marshmallow_schema(serializer).dump_fields.items():
+            attribute = (field.attribute or field_name).split(".")[0]
+            if isinstance(field, mf.List):
+                field = field.inner
+            nested = type(field.schema) if isinstance(field, mf.Nested) else None
+            yield attribute, nested
+    elif issubclass(serializer, BaseModel):
+        for field_name, field_info in serializer.model_fields.items():
+            alias = field_info.validation_alias
+            if not isinstance(alias, str):
+                alias = field_info.alias
+            yield alias or field_name, _get_pydantic_nested_model(field_info.annotation)
+
+
+def _add_to_eager_load_plan(
+    model: SqlaModelType,
+    serializer: SerializerType,
+    plan: dict[str, EagerLoadStrategy],
+    prefix: str,
+    depth: int,
+) -> None:
+    """Recursively adds the relationships read by a serializer, and any serializers nested within it, to a plan."""
+    relationships = inspect(model).relationships
+    for attribute, nested_serializer in _get_serialized_attributes(serializer):
+        if attribute not in relationships:
+            continue
+        relationship = relationships[attribute]
+        path = f"{prefix}{attribute}"
+        plan[path] = "selectin" if relationship.uselist else "joined"
+        if nested_serializer and depth < EAGER_LOAD_MAX_DEPTH:
+            _add_to_eager_load_plan(
+                relationship.mapper.class_,
+                nested_serializer,
+                plan,
+                prefix=f"{path}.",
+                depth=depth + 1,
+            )
+
+
+@lru_cache(maxsize=256)
+def get_eager_load_plan(
+    model: SqlaModelType, serializer: SerializerType
+) -> tuple[tuple[str, EagerLoadStrategy], ...]:
+    """Inspects a Marshmallow schema or Pydantic model and returns the relationship paths (in dot notation) it will
+    read from a model when serializing, paired with the loading strategy that avoids N+1 queries. Collections are
+    loaded with a "selectin" load and scalar relationships with a "joined" load.
+    """
+    plan: dict[str, EagerLoadStrategy] = {}
+    _add_to_eager_load_plan(model, serializer, plan, prefix="", depth=1)
+    return tuple(plan.items())
+
+
+def get_view_eager_load_plan(
+    view: Union[type[FlaskMuckApiView], FlaskMuckApiView], serializer: SerializerType
+) -> dict[str, EagerLoadStrategy]:
+    """Returns the eager load plan for a view and serializer with the view's `eager_load_strategies` applied."""
+    plan = (
+        dict(get_eager_load_plan(view.Model, serializer))
+        if view.auto_eager_load
+        else {}
     )
+    plan.update(view.eager_load_strategies)
+    return plan
+
+
+def get_eager_load_options(
+    model: SqlaModelType, plan: dict[str, EagerLoadStrategy]
+) -> list[Load]:
+    """Translates an eager load plan into SQLAlchemy loader options. Intermediate relationships missing from the plan
+    keep their default loading strategy.
+    """
+    options = []
+    for path in plan:
+        if any(other.startswith(f"{path}.") for other in plan):
+            # The relationship is loaded as part of a deeper path's option chain.
+            continue
+        option: Any = None
+        _model = model
+        segments = path.split(".")
+        for i, name in enumerate(segments):
+            relationship = inspect(_model).relationships.get(name)
+            if relationship is None:
+                raise MuckImplementationError(
+                    f"{path} is not a valid eager load path. {_model.__name__} has no relationship named {name}."
+                )
+            strategy = plan.get(".".join(segments[: i + 1]))
+            loader_name = LOADER_OPTION_NAMES[strategy] if strategy else "defaultload"
+            attribute = getattr(_model, name)
+            option = (
+                getattr(option, loader_name)(attribute)
+                if option is not None
+                else getattr(sqlalchemy_orm, loader_name)(attribute)
+            )
+            _model = relationship.mapper.class_
+        options.append(option)
+    return options
+
+
+def get_serializer_field_names(serializer: SerializerType) -> list[str]:
+    """Returns the names of the fields a Marshmallow schema or Pydantic model outputs when serializing."""
+    if issubclass(serializer, Schema):
+        return list(get_marshmallow_schema(serializer).dump_fields)
+    elif issubclass(serializer, BaseModel):
+        return [*serializer.model_fields, *serializer.model_computed_fields]
+    else:
+        raise TypeError(
+            f"Schemas must be Marshmallow Schemas or Pydantic BaseModels. {serializer} is a {type(serializer)}"
+        )
+
+
+@lru_cache(maxsize=256)
+def get_sparse_serializer(
+    serializer: SerializerType, field_names: frozenset[str]
+) -> SerializerType:
+    """Returns a serializer derived from a Marshmallow schema or Pydantic model that only outputs the given fields.
+    Used for sparse fieldsets requested with the `fields` query param. Pydantic models are subclassed rather than
+    rebuilt so their serializers and computed fields are kept and the other fields are left out when dumping.
+    """
+    ordered_names = tuple(
+        name for name in get_serializer_field_names(serializer) if name in field_names
+    )
+    if issubclass(serializer, Schema):
+        meta = type("Meta", (serializer.Meta,), {"fields": ordered_names})
+        return type(serializer.__name__, (serializer,), {"Meta": meta})
+    return type(
+        serializer.__name__,
+        (serializer,),
+        {"__muck_sparse_fields__": frozenset(ordered_names)},
+    )
+
+
+@lru_cache(maxsize=256)
+def get_load_only_columns(
+    model: SqlaModelType, serializer: SerializerType
+) -> Optional[tuple[InstrumentedAttribute, ...]]:
+    """Returns the column attributes of a model read by a serializer, along with the foreign key columns needed to
+    load the relationships it reads. The primary key is always included. Returns None if the serializer reads values
+    that can't be traced back to a column or relationship, such as Marshmallow `Method` and `Function` fields, Pydantic
+    computed fields or model properties, since restricting the loaded columns would lazy load the ones they read for
+    every row.
+    """
+    if issubclass(serializer, Schema):
+        dump_fields = get_marshmallow_schema(serializer).dump_fields.values()
+        if any(isinstance(field, (mf.Method, mf.Function)) for field in dump_fields):
+            return None
+    elif issubclass(serializer, BaseModel) and serializer.model_computed_fields:
+        return None
+    mapper = inspect(model)
+    columns = {prop.key for prop in mapper.column_attrs if prop.columns[0].primary_key}
+    for attribute, _ in _get_serialized_attributes(serializer):
+        if attribute in mapper.column_attrs:
+            columns.add(attribute)
+        elif attribute in mapper.relationships:
+            for column in mapper.relationships[attribute].local_columns:
+                if column.table is model.__table__:
+                    columns.add(mapper.get_property_by_column(column).key)
+        else:
+            return None
+    return tuple(getattr(model, column) for column in sorted(columns))
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yields lists of up to `size` items from an iterable without materializing the whole iterable."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _json_default(value: Any) -> Any:
+    """Encodes values that the json module cannot handle natively when building cursors."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"{type(value)} values can not be used in a pagination cursor.")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort key values of the last row in a page into an opaque, url-safe cursor string."""
+    payload = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence[ColumnElement]) -> list[Any]:
+    """Decodes a cursor created by `encode_cursor` and coerces its values back to the python types of the columns
+    it will be compared against. Raises a ValueError if the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cursor [{cursor}] is not valid.") from e
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError(f"Cursor [{cursor}] is not valid.")
+    coerced = []
+    for value, column in zip(values, columns):
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = None
+        if value is not None and python_type in (datetime, date, time):
+            value = python_type.fromisoformat(value)
+        elif value is not None and python_type is Decimal:
+            value = Decimal(value)
+        coerced.append(value)
+    return coerced
+
+
+@lru_cache(maxsize=256)
+def pydantic_model_to_optional(model: type[BaseModel]) -> type[BaseModel]:
+    """Returns a new model where all fields are Optional. Used for PATCH JSON payload validation. The model subclasses
+    the original and only overrides the field definitions, so each field keeps its type, nested models and constraints
+    and all of the model's validators, serializers and config are inherited. The model is built once per model class
+    because creating a Pydantic model and its core schema is expensive.
+    """
+    fields = {
+        name: (
+            Optional[field_info.annotation],
+            FieldInfo.merge_field_infos(field_info, default=None),
+        )
+        for name, field_info in model.model_fields.items()
+    }
+    return create_model(model.__name__, __base__=model, **fields)  # type: ignore
 
 
 def validate_payload(
@@ -128,8 +593,38 @@ def validate_payload(
     elif issubclass(serializer, BaseModel):
         if partial:
             serializer = pydantic_model_to_optional(serializer)
-        serializer.model_config["from_attributes"] = True
-        return serializer.model_validate(payload).model_dump()
+        return serializer.model_validate(payload).model_dump(exclude_unset=partial)
+    else:
+        raise TypeError(
+            f"Schemas must be Marshmallow Schemas or Pydantic BaseModels. {serializer} is a {type(serializer)}"
+        )
+
+
+def validate_payloads(
+    payloads: list[Any], serializer: SerializerType
+) -> tuple[list[JsonDict], dict[int, Any]]:
+    """Validates a list of JSON payloads in a single pass using `Schema(many=True)` or `TypeAdapter(list[Model])`.
+    Returns the validated items and a dictionary of error messages keyed by the index of each invalid item. Error
+    messages use Marshmallow's format, a dictionary of field names to lists of messages, for both serializer types.
+    """
+    if issubclass(serializer, Schema):
+        try:
+            return get_marshmallow_schema(serializer, many=True).load(payloads), {}
+        except MarshmallowValidationError as e:
+            return [], e.normalized_messages()
+    elif issubclass(serializer, BaseModel):
+        adapter = get_pydantic_list_adapter(serializer)
+        try:
+            return adapter.dump_python(adapter.validate_python(payloads)), {}
+        except PydanticValidationError as e:
+            errors: dict[int, dict[str, list[str]]] = {}
+            for error in e.errors():
+                index, *loc = error["loc"]
+                field_name = ".".join(str(part) for part in loc) or "_schema"
+                errors.setdefault(int(index), {}).setdefault(field_name, []).append(
+                    error["msg"]
+                )
+            return [], errors
     else:
         raise TypeError(
             f"Schemas must be Marshmallow Schemas or Pydantic BaseModels. {serializer} is a {type(serializer)}"
@@ -147,6 +642,15 @@ def register_muck_view(
     """
     from flask_muck.open_api import update_spec_from_muck_view
 
+    plan = compile_muck_view(muck_view)
+
+    # Build the eager load plans up front so misconfigured relationship paths fail at registration.
+    for serializer in (muck_view.ResponseSchema, muck_view.DetailSchema):
+        if serializer:
+            get_eager_load_options(
+                muck_view.Model, get_view_eager_load_plan(muck_view, serializer)
+            )
+
     url_rule = get_url_rule(muck_view, None, url_prefix=url_prefix)
     api_view = muck_view.as_view(f"{muck_view.api_name}_api")
     update_spec_from_muck_view(
@@ -165,6 +669,20 @@ def register_muck_view(
         # Create endpoint - POST on /
         api.add_url_rule(url_rule, view_func=api_view, methods=["POST"])
 
+        # Bulk Update, Delete endpoints - PATCH, DELETE on /, only registered for views that allow them.
+        bulk_methods = {
+            method
+            for method in ("PATCH", "DELETE")
+            if muck_view.allows_bulk_modification(method)
+        }
+        if bulk_methods:
+            api.add_url_rule(
+                url_rule,
+                defaults={"resource_id": None},
+                view_func=api_view,
+                methods=bulk_methods,
+            )
+
         # List endpoint - GET on /
         api.add_url_rule(
             url_rule,
@@ -174,9 +692,8 @@ def register_muck_view(
         )
 
         # Detail, Update, Patch, Delete endpoints - GET, PUT, PATCH, DELETE on /<resource_id>
-        pk_type = get_pk_type(muck_view.Model)
         api.add_url_rule(
-            f"{url_rule}<{pk_type}:resource_id>/",
+            f"{url_rule}<{plan.pk_type}:resource_id>/",
             view_func=api_view,
             methods={"GET", "PUT", "PATCH", "DELETE"},
         )
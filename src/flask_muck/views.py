@@ -1,46 +1,133 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+from inspect import isawaitable
 from json import JSONDecodeError
 from logging import getLogger
-from typing import Optional, Union, Any
+from typing import Optional, Union, Any, Literal, Iterator
 
-from flask import request, Blueprint
+from flask import (
+    request,
+    Blueprint,
+    Response,
+    current_app,
+    stream_with_context,
+    after_this_request,
+    make_response,
+    jsonify,
+)
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 from marshmallow import Schema
+from sqlalchemy import (
+    and_,
+    or_,
+    tuple_,
+    func,
+    distinct,
+    inspect,
+    update,
+    delete,
+    select,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Query, scoped_session
+from sqlalchemy.orm import Query, scoped_session, load_only
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql.elements import (
-    BinaryExpression,
-    UnaryExpression,
-    BooleanClauseList,
-    or_,
+    ColumnElement,
 )
+from sqlalchemy.sql.util import find_tables
 from webargs import fields
 from webargs.flaskparser import parser
-from werkzeug.exceptions import MethodNotAllowed, BadRequest, Conflict
+from werkzeug.exceptions import MethodNotAllowed, BadRequest, Conflict, HTTPException
 
+from flask_muck.cache import TTLCache, CacheBackend, CacheStats
 from flask_muck.callback import CallbackType
-from flask_muck.callback import FlaskMuckCallback
+from flask_muck.callback import (
+    FlaskMuckCallback,
+    DeferredCallbackExecutor,
+    default_callback_executor,
+)
+from flask_muck.compression import compress_response, get_compressor
+from flask_muck.exceptions import MuckImplementationError
+from flask_muck.encoders import (
+    Encoder,
+    get_binary_encoder,
+    get_encoder,
+    get_json_encoder,
+)
+from flask_muck.metrics import MuckMetrics, get_serialized_row_count
+from flask_muck.search import SearchBackend, ILikeSearchBackend
+from flask_muck.profiling import QueryProfile, queries_profiled, is_profiling_forced
+from flask_muck.timing import (
+    request_timed,
+    request_timer,
+    timed_phase,
+    timed_parsing,
+    format_server_timing,
+)
 from flask_muck.types import (
     SqlaModelType,
     JsonDict,
     ResourceId,
     SqlaModel,
     SerializerType,
+    EagerLoadStrategy,
+    RelationshipFilterStrategy,
 )
 from flask_muck.utils import (
     get_query_filters_from_request_path,
-    get_pk_column,
+    get_view_plan,
+    get_view_eager_load_plan,
+    get_eager_load_options,
+    get_serializer_field_names,
+    get_sparse_serializer,
+    get_load_only_columns,
+    chunked,
+    join_fans_out,
+    compile_filter_plan,
+    encode_cursor,
+    decode_cursor,
     serialize_model_instance,
+    serialize_model_instances,
     validate_payload,
+    validate_payloads,
     register_muck_view,
 )
 
 logger = getLogger(__name__)
 
+CountStrategy = Literal["exact", "none", "window", "cached", "estimated"]
+
+# Shared cache of total counts for views using the "cached" count strategy. Keys include the view class.
+_count_cache = TTLCache(maxsize=1024)
+
+# Response cache hit/miss counters keyed by view class.
+_response_cache_stats: dict[type, CacheStats] = {}
+
+# Sort param value that orders search results by relevance.
+RELEVANCE_SORT = "relevance"
+
+# Response headers stored alongside cached response bodies. Anything else, notably cookies, is never cached.
+CACHED_RESPONSE_HEADERS = (
+    "Content-Type",
+    "Content-Encoding",
+    "ETag",
+    "Last-Modified",
+    "Vary",
+)
+
+
+def _get_response_cache_generation_key(
+    view: type[FlaskMuckApiView], tenant: str
+) -> tuple[str, str, str]:
+    return ("flask_muck.generation", f"{view.__module__}.{view.__qualname__}", tenant)
+
+
 METHOD_OPERATION_MAP = {
     "POST": "create",
     "PUT": "update",
@@ -75,9 +162,49 @@ class FlaskMuckApiView(MethodView):
         post_update_callbacks (list[type[FlaskMuckCallback]]): A list of post-update callbacks.
         post_patch_callbacks (list[type[FlaskMuckCallback]]): A list of post-patch callbacks.
         post_delete_callbacks (list[type[FlaskMuckCallback]]): A list of post-delete callbacks.
+        callback_executor (DeferredCallbackExecutor): The executor that runs deferred post callbacks in the
+            background. Views share a single executor by default.
 
         searchable_columns (list[InstrumentedAttribute]): A list of columns that can be searched.
+        search_backend (SearchBackend): The backend used to search the searchable columns. Defaults to case-insensitive
+            substring matching.
+        auto_eager_load (bool): Indicates whether relationships read by the response schemas are eagerly loaded.
+        eager_load_strategies (dict[str, EagerLoadStrategy]): Loading strategy overrides keyed by relationship path.
         default_pagination_limit (int): The default pagination limit.
+        allow_cursor_pagination (bool): Indicates whether the list endpoint supports keyset (cursor) pagination.
+        stream_list_responses (bool): Indicates whether unpaginated list responses are streamed as a chunked JSON array.
+        stream_chunk_size (int): The number of rows fetched and serialized at a time when streaming a list response.
+        media_types (list[str]): The media types responses can be negotiated in with the Accept header and request
+            bodies can be sent in. Supports "application/json", "application/msgpack" and "application/cbor". The first
+            is used when the client accepts none of them.
+        compression_encodings (list[str]): The content encodings responses can be compressed with, in order of
+            preference, negotiated with the Accept-Encoding header. Supports "zstd" and "gzip". zstd is skipped unless
+            Python 3.14+ or the zstandard package provides it. Compression is disabled if empty.
+        compression_min_size (int): The size in bytes a response body must reach to be compressed. Streamed responses
+            are always compressed as they're written.
+        count_strategy (CountStrategy): How the total is calculated for paginated list responses.
+        count_cache_ttl (float): Number of seconds totals are cached for when using the "cached" count strategy.
+        version_column (Optional[str]): The name of a version or last updated column on the Model used to answer
+            conditional GET requests with ETag and Last-Modified validators.
+        response_cache (Optional[CacheBackend]): The cache backend used to cache GET responses. Caching is disabled if
+            not set.
+        response_cache_ttl (Optional[float]): Number of seconds GET responses are cached for. Defaults to the cache
+            backend's ttl.
+        max_bulk_create_size (Optional[int]): The maximum number of resources that can be created in a single bulk
+            create request. Unlimited if set to None.
+        allow_bulk_modification (bool): Indicates whether PATCH and DELETE requests to the collection URL update or
+            delete every resource matching the filters query param with a single statement. Resources aren't loaded, so
+            bulk requests are refused for methods with callbacks or, for DELETE, a DeleteSchema.
+        relationship_filter_strategy (RelationshipFilterStrategy): How filters on related models' columns are
+            applied. "join" outer joins the related model, "exists" filters with a correlated EXISTS subquery and "auto"
+            uses EXISTS for to-many relationships, which would otherwise multiply rows, and joins for the rest. EXISTS
+            subqueries need an index on the related model's foreign key to perform well.
+        query_profiling (bool): Indicates whether the SQL statements executed by each request are counted by phase and
+            checked for N+1 patterns. Intended for debugging and tests. Profiled responses include an X-Query-Count
+            header and the profiles are passed to `record_query_profile`.
+        request_timing (bool): Indicates whether requests are timed. Timed responses include a Server-Timing header
+            breaking the request down into parse, query, count, serialize, callbacks and encode phases, plus the total time
+            spent executing SQL. The timings are passed to `record_request_timing`.
         one_to_one_api (bool): Indicates whether the API represents a one-to-one relationship.
         allowed_methods (set[str]): A set of allowed HTTP methods.
         operator_separator (str): The separator used in filter operators.
@@ -104,9 +231,29 @@ class FlaskMuckApiView(MethodView):
     post_update_callbacks: list[type[FlaskMuckCallback]] = []
     post_patch_callbacks: list[type[FlaskMuckCallback]] = []
     post_delete_callbacks: list[type[FlaskMuckCallback]] = []
+    callback_executor: DeferredCallbackExecutor = default_callback_executor
 
     searchable_columns: list[InstrumentedAttribute] = []
+    search_backend: SearchBackend = ILikeSearchBackend()
+    auto_eager_load: bool = True
+    eager_load_strategies: dict[str, EagerLoadStrategy] = {}
     default_pagination_limit: int = 20
+    allow_cursor_pagination: bool = False
+    stream_list_responses: bool = False
+    stream_chunk_size: int = 1000
+    media_types: list[str] = ["application/json"]
+    compression_encodings: list[str] = []
+    compression_min_size: int = 1024
+    count_strategy: CountStrategy = "exact"
+    count_cache_ttl: float = 60
+    version_column: Optional[str] = None
+    response_cache: Optional[CacheBackend] = None
+    response_cache_ttl: Optional[float] = None
+    max_bulk_create_size: Optional[int] = 1000
+    allow_bulk_modification: bool = False
+    relationship_filter_strategy: RelationshipFilterStrategy = "join"
+    request_timing: bool = False
+    query_profiling: bool = False
     one_to_one_api: bool = False
     allowed_methods: set[str] = {"GET", "POST", "PUT", "PATCH", "DELETE"}
     operator_separator: str = "__"
@@ -116,19 +263,322 @@ class FlaskMuckApiView(MethodView):
         return self.session.query(self.Model)
 
     def dispatch_request(self, **kwargs: Any) -> ResponseReturnValue:
-        if request.method.lower() not in [m.lower() for m in self.allowed_methods]:
+        profile_queries = self.query_profiling or is_profiling_forced()
+        metrics = self._get_metrics()
+        if not self.request_timing and not profile_queries and metrics is None:
+            return self._compress_response(
+                self._make_response(self._dispatch_request(**kwargs))
+            )
+        with request_timer(record_statements=profile_queries) as timer:
+            try:
+                with timer.phase("query"):
+                    rv = self._dispatch_request(**kwargs)
+                with timer.phase("encode"):
+                    response = self._make_response(rv)
+                    payload_bytes = response.calculate_content_length()
+                    response = self._compress_response(response)
+            except Exception as e:
+                if metrics is not None:
+                    status_code = (
+                        e.code if isinstance(e, HTTPException) else None
+                    ) or 500
+                    self._record_metrics(metrics, timer.get_timings(), status_code)
+                raise
+            timings = timer.get_timings()
+        if self.request_timing:
+            response.headers["Server-Timing"] = format_server_timing(timings)
+            self.record_request_timing(timings)
+        if timer.statements is not None:
+            profile = QueryProfile(
+                type(self), request.method, request.full_path, timer.statements
+            )
+            response.headers["X-Query-Count"] = str(profile.count)
+            self.record_query_profile(profile)
+        if metrics is not None:
+            self._record_metrics(
+                metrics,
+                timings,
+                response.status_code,
+                # Cached responses don't call the view method and count as zero rows.
+                rows=vars(self).get("_serialized_row_count", 0),
+                payload_bytes=payload_bytes,
+            )
+        return response
+
+    def _make_response(self, rv: ResponseReturnValue) -> Response:
+        """Encodes the dicts and lists returned by the view's methods in the media type negotiated with the Accept
+        header. JSON is encoded with the encoder configured by `MUCK_JSON_ENCODER`. Any other return value is converted
+        to a response by Flask.
+        """
+        body, status = rv if isinstance(rv, tuple) and len(rv) == 2 else (rv, 200)
+        if isinstance(body, (dict, list)) and isinstance(status, int):
+            response = self._get_response_encoder().response(body, status)
+            if len(self.media_types) > 1:
+                response.vary.add("Accept")
+            return response
+        return make_response(rv)
+
+    def _compress_response(self, response: Response) -> Response:
+        """Compresses the response with the encoding in `compression_encodings` negotiated with the Accept-Encoding
+        header.
+        """
+        if not self.compression_encodings:
+            return response
+        response.vary.add("Accept-Encoding")
+        if (compressor := get_compressor(self.compression_encodings)) is None:
+            return response
+        return compress_response(response, compressor, self.compression_min_size)
+
+    def _get_response_encoder(self) -> Encoder:
+        """Returns the encoder for the media type in `media_types` that best matches the request's Accept header."""
+        if len(self.media_types) == 1:
+            return get_encoder(self.media_types[0])
+        return get_encoder(
+            request.accept_mimetypes.best_match(
+                self.media_types, default=self.media_types[0]
+            )
+        )
+
+    def _get_request_payload(self) -> Any:
+        """Returns the decoded request body. Binary media types in `media_types` are decoded with their encoder, once
+        per request, and anything else is parsed as JSON by Flask.
+        """
+        if (
+            request.mimetype == "application/json"
+            or request.mimetype not in self.media_types
+        ):
+            return request.json
+        if "_request_payload" not in vars(self):
+            encoder = get_binary_encoder(request.mimetype)
+            try:
+                vars(self)["_request_payload"] = encoder.loads(request.get_data())
+            except Exception as e:
+                raise BadRequest(
+                    f"Failed to decode the {request.mimetype} request body."
+                ) from e
+        return vars(self)["_request_payload"]
+
+    def _get_metrics(self) -> Optional[MuckMetrics]:
+        """Returns the metrics collected by the FlaskMuck extension if it is initialized with metrics enabled."""
+        extension = current_app.extensions.get("muck")
+        return getattr(extension, "metrics", None)
+
+    def _record_metrics(
+        self,
+        metrics: MuckMetrics,
+        timings: dict[str, float],
+        status_code: int,
+        rows: int = 0,
+        payload_bytes: Optional[int] = None,
+    ) -> None:
+        metrics.get_view_metrics(self.api_name, request.method).observe(
+            latency=timings["total"] / 1000,
+            status_code=status_code,
+            rows=rows,
+            payload_bytes=payload_bytes,
+            count_query_seconds=timings.get("count", 0.0) / 1000,
+        )
+
+    def record_request_timing(self, timings: dict[str, float]) -> None:
+        """Called with the duration of each phase in milliseconds after a timed request. Sends the `request_timed`
+        signal by default. Override it to send the timings somewhere else.
+        """
+        request_timed.send(type(self), timings=timings)
+
+    def record_query_profile(self, profile: QueryProfile) -> None:
+        """Called with the SQL statements executed by a profiled request. Logs a warning if any statement shape was
+        repeated enough to look like an N+1 pattern and sends the `queries_profiled` signal.
+        """
+        if repeated := profile.get_repeated_statements():
+            logger.warning(
+                f"{profile.method} {profile.path} repeated statements that look like N+1 queries: {repeated}"
+            )
+        queries_profiled.send(type(self), profile=profile)
+
+    def _dispatch_request(self, **kwargs: Any) -> ResponseReturnValue:
+        if request.method.lower() not in get_view_plan(self).allowed_methods:
             raise MethodNotAllowed
-        return super().dispatch_request(**kwargs)
+        if self.response_cache is None:
+            return self._call_method(**kwargs)
+
+        if request.method == "GET":
+            cache_key = self._get_response_cache_key()
+            stats = self.get_response_cache_stats()
+            if (cached := self.response_cache.get(cache_key)) is not None:
+                stats.record_hit()
+                body, status, headers = cached
+                response = Response(body, status=status, headers=headers)
+                return response.make_conditional(request)
+            stats.record_miss()
+            response = self._make_response(self._call_method(**kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                self._cache_response(cache_key)
+            return response
+
+        response = self._make_response(self._call_method(**kwargs))
+        if response.status_code < 400:
+            self._invalidate_response_cache()
+        return response
+
+    def _call_method(self, **kwargs: Any) -> ResponseReturnValue:
+        """Calls the view method for the request's HTTP method. The number of resources it returns is kept for the
+        request metrics, since the return value may be turned into a response before the metrics are recorded.
+        """
+        rv = super().dispatch_request(**kwargs)
+        vars(self)["_serialized_row_count"] = get_serialized_row_count(rv)
+        return rv
+
+    @classmethod
+    def get_response_cache_stats(cls) -> CacheStats:
+        """Returns the response cache hit and miss counters for this view."""
+        return _response_cache_stats.setdefault(cls, CacheStats())
+
+    def _get_response_cache_generation(
+        self, view: type[FlaskMuckApiView], tenant: str
+    ) -> str:
+        """Returns the current generation token for a view and tenant. Cache keys include the generation tokens of the
+        view and its parents, so replacing a token invalidates every response cached under it.
+        """
+        assert self.response_cache is not None
+        key = _get_response_cache_generation_key(view, tenant)
+        if (generation := self.response_cache.get(key)) is None:
+            generation = uuid.uuid4().hex
+            self.response_cache.set(key, generation, ttl=None)
+        return generation
+
+    def _get_response_cache_views(self) -> list[type[FlaskMuckApiView]]:
+        """Returns this view's class followed by its parent views."""
+        views = [type(self)]
+        while views[-1].parent:
+            views.append(views[-1].parent)
+        return views
+
+    def _get_response_cache_key(self) -> str:
+        """Returns the cache key for a GET request. The key is built from the view, the path args (including the
+        parent path args), the base query kwargs, the normalized query string, the Accept header and, for views that
+        compress responses, the Accept-Encoding header.
+        """
+        tenant = json.dumps(self.get_base_query_kwargs(), sort_keys=True, default=str)
+        return json.dumps(
+            [
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                [
+                    self._get_response_cache_generation(view, tenant)
+                    for view in self._get_response_cache_views()
+                ],
+                request.view_args,
+                tenant,
+                sorted(request.args.items(multi=True)),
+                request.headers.get("Accept"),
+                (
+                    request.headers.get("Accept-Encoding")
+                    if self.compression_encodings
+                    else None
+                ),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    def _cache_response(self, cache_key: str) -> None:
+        """Stores the response once it is finalized so headers added by after request hooks are included."""
 
+        @after_this_request
+        def cache_response(response: Response) -> Response:
+            assert self.response_cache is not None
+            headers = [
+                (name, value)
+                for name, value in response.headers.items()
+                if name in CACHED_RESPONSE_HEADERS
+            ]
+            self.response_cache.set(
+                cache_key,
+                (response.get_data(), response.status_code, headers),
+                ttl=self.response_cache_ttl,
+            )
+            return response
+
+    def _invalidate_response_cache(self) -> None:
+        """Invalidates the cached responses of this view and its parent views for the current tenant. Parent views are
+        included because their responses may nest this view's resources.
+        """
+        assert self.response_cache is not None
+        tenant = json.dumps(self.get_base_query_kwargs(), sort_keys=True, default=str)
+        for view in self._get_response_cache_views():
+            self.response_cache.set(
+                _get_response_cache_generation_key(view, tenant),
+                uuid.uuid4().hex,
+                ttl=None,
+            )
+
+    @timed_phase("callbacks")
     def _execute_callbacks(
         self,
         resource: SqlaModel,
         kwargs: JsonDict,
         callback_type: CallbackType,
     ) -> None:
+        for callback in self._get_callbacks(callback_type):
+            if callback_type == CallbackType.post and callback.deferred:
+                snapshot = self._get_resource_snapshot(resource)
+                self.callback_executor.submit(
+                    callback, callback(snapshot, dict(kwargs)).execute
+                )
+            else:
+                self._finish_callback(callback(resource, kwargs).execute())
+
+    @timed_phase("callbacks")
+    def _execute_batch_callbacks(
+        self,
+        resources: list[SqlaModel],
+        kwargs_list: list[JsonDict],
+        callback_type: CallbackType,
+    ) -> None:
+        for callback in self._get_callbacks(callback_type):
+            if callback_type == CallbackType.post and callback.deferred:
+                snapshots = [self._get_resource_snapshot(r) for r in resources]
+                self.callback_executor.submit(
+                    callback,
+                    partial(
+                        callback.execute_batch,
+                        snapshots,
+                        [dict(kwargs) for kwargs in kwargs_list],
+                    ),
+                )
+            else:
+                self._finish_callback(callback.execute_batch(resources, kwargs_list))
+
+    def _get_callbacks(
+        self, callback_type: CallbackType
+    ) -> list[type[FlaskMuckCallback]]:
         attr = f"{callback_type.value}_{METHOD_OPERATION_MAP[request.method]}_callbacks"
-        for callback in getattr(self, attr):
-            callback(resource, kwargs).execute()
+        return getattr(self, attr)
+
+    def _finish_callback(self, result: Any) -> None:
+        """Handles the value returned by a callback executed inline. Callbacks are synchronous so it is ignored, unless
+        it's awaitable, which means an async callback was attached to a sync view where it would never run.
+        """
+        if isawaitable(result):
+            if hasattr(result, "close"):
+                result.close()
+            raise MuckImplementationError(
+                "Async callbacks can only run inline on AsyncFlaskMuckApiViews. Use a FlaskMuckCallback or defer the "
+                "callback to run it from a sync view."
+            )
+
+    def _has_deferred_callbacks(self, callback_type: CallbackType) -> bool:
+        return any(c.deferred for c in self._get_callbacks(callback_type))
+
+    def _get_resource_snapshot(self, resource: SqlaModel) -> JsonDict:
+        """Returns the resource serialized with the ResponseSchema. Deferred callbacks receive this snapshot rather than
+        the model instance, which is bound to the request's session. Snapshots are cached for the rest of the request.
+        """
+        snapshots = vars(self).setdefault("_resource_snapshots", {})
+        if id(resource) not in snapshots:
+            snapshots[id(resource)] = serialize_model_instance(
+                resource, self.ResponseSchema
+            )
+        return snapshots[id(resource)]
 
     def get_base_query_kwargs(self) -> JsonDict:
         """Returns a set of base query args. This can be overridden to add additional kwargs to the base query.
@@ -136,18 +586,46 @@ class FlaskMuckApiView(MethodView):
         """
         return {}
 
-    def _get_base_query(self) -> Query:
+    def _get_base_query(
+        self,
+        serializer: Optional[SerializerType] = None,
+        load_only_serialized_columns: bool = False,
+    ) -> Query:
+        """Returns the query all operations start from. If a serializer is provided, the relationships it reads are
+        eagerly loaded according to the view's eager load plan and, if `load_only_serialized_columns` is set, only the
+        columns it reads are fetched from the database.
+        """
         base_query: Query = self.query
         base_query = base_query.filter(*get_query_filters_from_request_path(self, []))
         if query_kwargs := self.get_base_query_kwargs():
             base_query = base_query.filter_by(**query_kwargs)
+        if serializer and (
+            options := get_eager_load_options(
+                self.Model, get_view_eager_load_plan(self, serializer)
+            )
+        ):
+            base_query = base_query.options(*options)
+        if (
+            serializer
+            and load_only_serialized_columns
+            and (columns := get_load_only_columns(self.Model, serializer)) is not None
+        ):
+            if self.version_column is not None:
+                # The version is read from the resource to build the response's validators.
+                columns = (*columns, getattr(self.Model, self.version_column))
+            base_query = base_query.options(load_only(*columns))
         return base_query
 
-    def _get_resource(cls, resource_id: Optional[ResourceId]) -> SqlaModel:
-        query = cls._get_base_query()
+    def _get_resource(
+        cls,
+        resource_id: Optional[ResourceId],
+        serializer: Optional[SerializerType] = None,
+        load_only_serialized_columns: bool = False,
+    ) -> SqlaModel:
+        query = cls._get_base_query(serializer, load_only_serialized_columns)
         if cls.one_to_one_api:
             return query.one()
-        return query.filter(get_pk_column(cls.Model) == resource_id).one()
+        return query.filter(get_view_plan(cls).pk_column == resource_id).one()
 
     def _get_clean_filter_data(self, filters: str) -> JsonDict:
         try:
@@ -155,6 +633,17 @@ class FlaskMuckApiView(MethodView):
         except JSONDecodeError:
             raise BadRequest(f"Filters [{filters}] is not valid json.")
 
+    def _get_sparse_serializer(
+        self, serializer: SerializerType, field_names: list[str]
+    ) -> SerializerType:
+        """Returns a serializer that only outputs the fields requested with the `fields` query param."""
+        available_fields = get_serializer_field_names(serializer)
+        for field_name in field_names:
+            if field_name not in available_fields:
+                raise BadRequest(f"{field_name} is not a valid field.")
+        return get_sparse_serializer(serializer, frozenset(field_names))
+
+    @timed_phase("parse")
     def _get_kwargs_from_request_payload(self) -> JsonDict:
         """Creates the correct schema based on request method and returns a sanitized dictionary of kwargs from the
         request json.
@@ -169,22 +658,28 @@ class FlaskMuckApiView(MethodView):
         if not serializer:
             raise NotImplementedError
         kwargs = validate_payload(
-            payload=request.json or {},
+            payload=self._get_request_payload() or {},
             serializer=serializer,
             partial=request.method == "PATCH",
         )
         kwargs.update(self.get_base_query_kwargs())
         return kwargs
 
-    @parser.use_kwargs(
-        {
-            "limit": fields.Integer(missing=None),
-            "offset": fields.Integer(missing=None),
-            "filters": fields.String(required=False, missing=None),
-            "sort": fields.String(required=False, missing=None),
-            "search": fields.String(required=False, missing=None),
-        },
-        location="querystring",
+    @timed_parsing(
+        parser.use_kwargs(
+            {
+                "limit": fields.Integer(missing=None),
+                "offset": fields.Integer(missing=None),
+                "filters": fields.String(required=False, missing=None),
+                "sort": fields.String(required=False, missing=None),
+                "search": fields.String(required=False, missing=None),
+                "cursor": fields.String(required=False, missing=None),
+                "sparse_fields": fields.DelimitedList(
+                    fields.String(), data_key="fields", required=False, missing=None
+                ),
+            },
+            location="querystring",
+        )
     )
     def get(
         self,
@@ -194,19 +689,39 @@ class FlaskMuckApiView(MethodView):
         filters: Optional[str],
         sort: Optional[str],
         search: Optional[str],
+        cursor: Optional[str],
+        sparse_fields: Optional[list[str]],
         **kwargs: Any,
-    ) -> tuple[Union[JsonDict, list[JsonDict]], int]:
+    ) -> Union[tuple[Union[JsonDict, list[JsonDict]], int], Response]:
         if resource_id or self.one_to_one_api:
-            resource = self._get_resource(resource_id)
-            if hasattr(self, "DetailSchema") and self.DetailSchema:
-                return serialize_model_instance(resource, self.DetailSchema), 200
-            else:
-                return (
-                    serialize_model_instance(resource, self.ResponseSchema),
-                    200,
-                )
+            serializer = (
+                self.DetailSchema
+                if hasattr(self, "DetailSchema") and self.DetailSchema
+                else self.ResponseSchema
+            )
+            if sparse_fields:
+                serializer = self._get_sparse_serializer(serializer, sparse_fields)
+            if (
+                self.version_column is not None
+                and self._is_conditional_request()
+                and (not_modified := self._check_detail_not_modified(resource_id))
+            ):
+                return not_modified
+            resource = self._get_resource(
+                resource_id,
+                serializer,
+                load_only_serialized_columns=bool(sparse_fields),
+            )
+            if self.version_column is not None and not self._is_conditional_request():
+                self._check_not_modified(getattr(resource, self.version_column))
+            return serialize_model_instance(resource, serializer), 200
         else:
-            query = self._get_base_query()
+            serializer = self.ResponseSchema
+            if sparse_fields:
+                serializer = self._get_sparse_serializer(serializer, sparse_fields)
+            query = self._get_base_query(
+                serializer, load_only_serialized_columns=bool(sparse_fields)
+            )
             query_filters: list = []
             join_models: set[SqlaModelType] = set()
             if filters:
@@ -214,10 +729,13 @@ class FlaskMuckApiView(MethodView):
                 query_filters, _join_models = self._get_query_filters(_filters)
                 join_models.update(_join_models)
 
-            # Get order by from request
-            order_by = None
+            # Get sort column from request
+            sort_column: Optional[ColumnElement] = None
+            sort_direction: Literal["asc", "desc"] = "asc"
             if sort:
-                order_by, _join_models = self._get_query_order_by(sort)
+                sort_column, sort_direction, _join_models = self._get_query_sort_column(
+                    sort, search
+                )
                 join_models.update(_join_models)
 
             if search:
@@ -226,15 +744,45 @@ class FlaskMuckApiView(MethodView):
                 if search_filter is not None:
                     query_filters.append(search_filter)
 
-            # Apply joins, filters and order by to the query.
-            for model in join_models:
-                if model != self.Model:
-                    query = query.outerjoin(model)
-            if query_filters:
-                query = query.filter(*query_filters)
-            if order_by is not None:
-                query = query.order_by(order_by)
-            query = query.distinct()
+            # Apply joins and filters to the query.
+            query = self._apply_list_filters(
+                query, query_filters, join_models, sort_column
+            )
+
+            if self.version_column is not None and (
+                not_modified := self._check_list_not_modified(
+                    self._apply_list_filters(
+                        self._get_base_query(), query_filters, join_models
+                    )
+                )
+            ):
+                return not_modified
+
+            # If a cursor was included in the query params return a keyset paginated response object.
+            if cursor is not None:
+                if not self.allow_cursor_pagination:
+                    raise BadRequest(
+                        "Cursor pagination is not supported on this endpoint."
+                    )
+                if offset:
+                    raise BadRequest("Cursor and offset can not be used together.")
+                if sort_column is not None and not isinstance(
+                    sort_column, InstrumentedAttribute
+                ):
+                    raise BadRequest(
+                        "Relevance sorting can not be used with cursor pagination."
+                    )
+                return (
+                    self._get_cursor_page(
+                        query, sort_column, sort_direction, cursor, limit, serializer
+                    ),
+                    200,
+                )
+
+            if sort_column is not None:
+                query = query.order_by(
+                    sort_column.asc() if sort_direction == "asc" else sort_column.desc()
+                )
 
             # If offset or limit were included in the query params return paginated response object else return a flat
             # list of all items.
@@ -242,37 +790,381 @@ class FlaskMuckApiView(MethodView):
             if offset or limit:
                 query_limit = limit or self.default_pagination_limit
                 query_offset = offset or 0
-                resources = query.limit(query_limit).offset(query_offset).all()
+                resources, count_data = self._get_page(
+                    query,
+                    query_limit,
+                    query_offset,
+                    fan_out=self._joins_fan_out(
+                        self._get_used_join_models(
+                            join_models, [*query_filters, sort_column]
+                        )
+                    ),
+                    count_cache_key=self._get_count_cache_key(filters, search),
+                )
                 response_data = {
                     "limit": query_limit,
                     "offset": query_offset,
-                    "total": query.count(),
-                    "items": [
-                        serialize_model_instance(r, self.ResponseSchema)
-                        for r in resources
-                    ],
+                    **count_data,
+                    "items": serialize_model_instances(resources, serializer),
                 }
+            elif (mimetype := self._get_stream_mimetype()) is not None:
+                return self._stream_list_response(query, mimetype, serializer)
             else:
                 resources = query.all()
-                response_data = [
-                    serialize_model_instance(r, self.ResponseSchema) for r in resources
-                ]
+                response_data = serialize_model_instances(resources, serializer)
             return response_data, 200
 
+    def _apply_list_filters(
+        self,
+        query: Query,
+        query_filters: list,
+        join_models: set[SqlaModelType],
+        sort_column: Optional[ColumnElement] = None,
+    ) -> Query:
+        """Applies the joins and filters built from the list request's query params to a query. Models are only
+        joined if a filter or the sort column references them and DISTINCT is only added when a join can fan out.
+        """
+        join_models = self._get_used_join_models(
+            join_models, [*query_filters, sort_column]
+        )
+        for model in join_models:
+            query = query.outerjoin(model)
+        if query_filters:
+            query = query.filter(*query_filters)
+        if self._joins_fan_out(join_models):
+            query = query.distinct()
+        return query
+
+    def _get_used_join_models(
+        self,
+        join_models: set[SqlaModelType],
+        expressions: list[Optional[ColumnElement]],
+    ) -> set[SqlaModelType]:
+        """Returns the related models whose tables are referenced by any of the expressions."""
+        tables = {
+            table
+            for expression in expressions
+            if expression is not None
+            for table in find_tables(expression.expression, check_columns=True)
+        }
+        return {
+            model
+            for model in join_models
+            if model != self.Model and inspect(model).local_table in tables
+        }
+
+    def _joins_fan_out(self, join_models: set[SqlaModelType]) -> bool:
+        return any(join_fans_out(self.Model, model) for model in join_models)
+
+    def _is_conditional_request(self) -> bool:
+        return bool(request.if_none_match or request.if_modified_since)
+
+    def _check_detail_not_modified(
+        self, resource_id: Optional[ResourceId]
+    ) -> Optional[Response]:
+        """Checks a conditional detail request against the resource's version column without loading the resource.
+        Requests without conditional headers skip this query and build their validators from the loaded resource.
+        """
+        assert self.version_column is not None
+        query = self._get_base_query().with_entities(
+            getattr(self.Model, self.version_column)
+        )
+        if not self.one_to_one_api:
+            query = query.filter(get_view_plan(self).pk_column == resource_id)
+        if (row := query.one_or_none()) is None:
+            return None
+        return self._check_not_modified(row[0])
+
+    def _check_list_not_modified(self, query: Query) -> Optional[Response]:
+        """Checks a conditional list request against the latest version and the number of resources matched by the
+        query. Both are fetched with a single aggregate query instead of loading the resources.
+        """
+        assert self.version_column is not None
+        version, count = query.with_entities(
+            func.max(getattr(self.Model, self.version_column)),
+            func.count(distinct(get_view_plan(self).pk_column)),
+        ).one()
+        return self._check_not_modified(version, count)
+
+    def _check_not_modified(
+        self, version: Any, count: Optional[int] = None
+    ) -> Optional[Response]:
+        """Builds the ETag and Last-Modified validators for a response from its version and returns a 304 response if
+        the client's copy is still current. Otherwise the validators are added to the response once it is built.
+        """
+        etag = hashlib.sha1(
+            json.dumps(
+                [
+                    f"{type(self).__module__}.{type(self).__qualname__}",
+                    request.view_args,
+                    request.query_string.decode(),
+                    request.headers.get("Accept"),
+                    self.get_base_query_kwargs(),
+                    version,
+                    count,
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        last_modified = version if isinstance(version, datetime) else None
+        if last_modified and last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        @after_this_request
+        def add_validators(response: Response) -> Response:
+            if response.status_code in (200, 304):
+                response.set_etag(etag, weak=True)
+                if last_modified:
+                    response.last_modified = last_modified
+            return response
+
+        # If-None-Match takes precedence over If-Modified-Since when both are sent.
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains_weak(etag)
+        else:
+            not_modified = bool(
+                last_modified
+                and request.if_modified_since
+                and last_modified.replace(microsecond=0) <= request.if_modified_since
+            )
+        return Response(status=304) if not_modified else None
+
+    def _get_count_cache_key(
+        self, filters: Optional[str], search: Optional[str]
+    ) -> str:
+        """Returns a key identifying the set of rows a list request matches. Used to cache totals."""
+        return json.dumps(
+            [
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                request.view_args,
+                self.get_base_query_kwargs(),
+                filters,
+                search,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    def _get_page(
+        self,
+        query: Query,
+        limit: int,
+        offset: int,
+        fan_out: bool,
+        count_cache_key: str,
+    ) -> tuple[list[SqlaModel], JsonDict]:
+        """Fetches a page of resources and returns them along with the count data to include in the response based on
+        the view's `count_strategy`.
+        """
+        page_query = query.limit(limit).offset(offset)
+        if self.count_strategy == "none":
+            resources = query.limit(limit + 1).offset(offset).all()
+            return resources[:limit], {"has_more": len(resources) > limit}
+        if self.count_strategy == "window" and not fan_out:
+            # The total is selected alongside every row. Joins that can multiply rows are excluded because the window
+            # is evaluated before DISTINCT removes the duplicates.
+            rows = page_query.add_columns(func.count().over()).all()
+            if rows or offset == 0:
+                return [row[0] for row in rows], {"total": rows[0][1] if rows else 0}
+            return [], {"total": self._count_query(query)}
+        resources = page_query.all()
+        if self.count_strategy == "cached":
+            if (total := _count_cache.get(count_cache_key)) is None:
+                total = self._count_query(query)
+                _count_cache.set(count_cache_key, total, ttl=self.count_cache_ttl)
+            return resources, {"total": total}
+        if self.count_strategy == "estimated":
+            if (total := self._get_estimated_count(query)) is not None:
+                return resources, {"total": total}
+        return resources, {"total": self._count_query(query)}
+
+    @timed_phase("count")
+    def _count_query(self, query: Query) -> int:
+        return query.count()
+
+    @timed_phase("count")
+    def _get_estimated_count(self, query: Query) -> Optional[int]:
+        """Returns the query planner's row estimate for a query, or None if the database does not provide one. Only
+        PostgreSQL is supported.
+        """
+        connection = self.session.connection()
+        if connection.dialect.name != "postgresql":
+            return None
+        compiled = query.statement.compile(dialect=connection.dialect)
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params
+        ).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _get_stream_mimetype(self) -> Optional[str]:
+        """Returns the mimetype to stream an unpaginated list response with or None if it should not be streamed.
+        Clients opt in to newline delimited JSON with the `Accept: application/x-ndjson` header while views opt in to
+        streaming a JSON array with the `stream_list_responses` setting.
+        """
+        if self._get_response_encoder().mimetype != "application/json":
+            return None
+        best_match = request.accept_mimetypes.best_match(
+            ["application/json", "application/x-ndjson"]
+        )
+        if best_match == "application/x-ndjson":
+            return best_match
+        if self.stream_list_responses:
+            return "application/json"
+        return None
+
+    def _stream_list_response(
+        self, query: Query, mimetype: str, serializer: SerializerType
+    ) -> Response:
+        """Streams all resources matched by the query. Rows are fetched from the database in batches of
+        `stream_chunk_size` and each batch is serialized and written to the response before the next is fetched, so
+        memory usage stays flat regardless of how many rows are returned.
+        """
+        dumps = get_json_encoder().dumps
+        is_ndjson = mimetype == "application/x-ndjson"
+
+        def generate() -> Iterator[bytes]:
+            if not is_ndjson:
+                yield b"["
+            separator = b""
+            for resources in chunked(
+                query.yield_per(self.stream_chunk_size), self.stream_chunk_size
+            ):
+                items = serialize_model_instances(resources, serializer)
+                if is_ndjson:
+                    yield b"".join(dumps(item) + b"\n" for item in items)
+                else:
+                    yield separator + b",".join(dumps(item) for item in items)
+                    separator = b","
+            if not is_ndjson:
+                yield b"]"
+
+        return Response(stream_with_context(generate()), mimetype=mimetype)
+
+    def _get_cursor_page(
+        self,
+        query: Query,
+        sort_column: Optional[InstrumentedAttribute],
+        sort_direction: Literal["asc", "desc"],
+        cursor: str,
+        limit: Optional[int],
+        serializer: SerializerType,
+    ) -> JsonDict:
+        """Returns a keyset paginated response object. Rows are ordered by the sort column with the primary key as a
+        tie-breaker and the page is selected with a `WHERE (sort_column, pk) > (...)` comparison against the values
+        encoded in the cursor, so deep pages cost the same as the first one.
+        """
+        query_limit = limit or self.default_pagination_limit
+        pk_column = get_view_plan(self).pk_column
+        key_columns: list = (
+            [pk_column] if sort_column is None else [sort_column, pk_column]
+        )
+
+        if cursor:
+            try:
+                cursor_values = decode_cursor(cursor, key_columns)
+            except ValueError as e:
+                raise BadRequest(str(e))
+            query = query.filter(
+                self._get_keyset_filter(key_columns, cursor_values, sort_direction)
+            )
+
+        order_by = [
+            c.asc() if sort_direction == "asc" else c.desc() for c in key_columns
+        ]
+        # The key columns are selected alongside the resource so the next cursor can be built from the last row even
+        # when sorting by a related model's column.
+        rows = (
+            query.add_columns(*key_columns)
+            .order_by(*order_by)
+            .limit(query_limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(rows) > query_limit:
+            rows = rows[:query_limit]
+            next_cursor = encode_cursor(rows[-1][1:])
+        return {
+            "limit": query_limit,
+            "cursor": cursor or None,
+            "next_cursor": next_cursor,
+            "items": serialize_model_instances([row[0] for row in rows], serializer),
+        }
+
+    def _get_keyset_filter(
+        self,
+        key_columns: list,
+        cursor_values: list[Any],
+        sort_direction: Literal["asc", "desc"],
+    ) -> ColumnElement:
+        """Returns the filter selecting the rows after the cursor. A `(sort_column, pk) > (...)` row value comparison is
+        used when the sort column can't be NULL. Comparisons with NULL are never true, so when it can be the filter is
+        expanded to place NULLs where the database sorts them: last in ascending order on PostgreSQL and Oracle and
+        first on other databases.
+        """
+        is_asc = sort_direction == "asc"
+        if len(key_columns) == 1 or not self._is_nullable(key_columns[0]):
+            if is_asc:
+                return tuple_(*key_columns) > tuple_(*cursor_values)
+            return tuple_(*key_columns) < tuple_(*cursor_values)
+
+        sort_column, pk_column = key_columns
+        sort_value, pk_value = cursor_values
+        nulls_largest = self.session.get_bind().dialect.name in ("postgresql", "oracle")
+        nulls_after = nulls_largest == is_asc
+
+        def after(column: Any, value: Any) -> ColumnElement:
+            return column > value if is_asc else column < value
+
+        if sort_value is None:
+            after_cursor = and_(sort_column.is_(None), after(pk_column, pk_value))
+            if nulls_after:
+                return after_cursor
+            return or_(sort_column.is_not(None), after_cursor)
+        after_cursor = or_(
+            after(sort_column, sort_value),
+            and_(sort_column == sort_value, after(pk_column, pk_value)),
+        )
+        if nulls_after:
+            return or_(after_cursor, sort_column.is_(None))
+        return after_cursor
+
+    def _is_nullable(self, column: Any) -> bool:
+        """Indicates whether a sort column's values can be NULL. Columns of related models are always treated as
+        nullable because an outer join yields NULLs for resources without a related row.
+        """
+        expression = getattr(column, "expression", column)
+        return getattr(
+            expression, "table", None
+        ) is not self.Model.__table__ or getattr(expression, "nullable", True)
+
     def _create_resource(self, kwargs: JsonDict) -> SqlaModel:
         resource = self.Model(**kwargs)
         self.session.add(resource)
         self.session.flush()
         return resource
 
+    def _create_resources(self, kwargs_list: list[JsonDict]) -> list[SqlaModel]:
+        """Creates resources in bulk. The resources are flushed together so SQLAlchemy batches them into as few
+        INSERT statements as the database driver allows.
+        """
+        resources = [self.Model(**kwargs) for kwargs in kwargs_list]
+        self.session.add_all(resources)
+        self.session.flush()
+        return resources
+
     def _update_resource(self, resource: SqlaModel, kwargs: JsonDict) -> SqlaModel:
         for attr, value in kwargs.items():
             setattr(resource, attr, value)
         return resource
 
-    def post(self) -> tuple[JsonDict, int]:
+    def post(self) -> tuple[Union[JsonDict, list[JsonDict]], int]:
         if not self.CreateSchema:
             raise NotImplementedError()
+        if isinstance(payload := self._get_request_payload(), list):
+            return self._bulk_create(payload), 201
         kwargs = self.get_base_query_kwargs()
         data = self._get_kwargs_from_request_payload()
         kwargs.update(data)
@@ -282,10 +1174,50 @@ class FlaskMuckApiView(MethodView):
             self.session.rollback()
             raise Conflict(str(e))
         self._execute_callbacks(resource, kwargs, CallbackType.pre)
+        self._index_resources([resource])
         self.session.commit()
         self._execute_callbacks(resource, kwargs, CallbackType.post)
         return serialize_model_instance(resource, self.ResponseSchema), 201
 
+    def _bulk_create(self, payloads: list[Any]) -> list[JsonDict]:
+        """Validates a list of payloads in a single pass and creates all of the resources in a single transaction.
+        If any item is invalid nothing is created and the errors for each invalid item are returned keyed by its index.
+        """
+        assert self.CreateSchema is not None
+        if not payloads:
+            raise BadRequest("Bulk create requests must contain at least one item.")
+        if (
+            self.max_bulk_create_size is not None
+            and len(payloads) > self.max_bulk_create_size
+        ):
+            raise BadRequest(
+                f"Bulk create requests are limited to {self.max_bulk_create_size} items."
+            )
+        kwargs_list, errors = validate_payloads(payloads, self.CreateSchema)
+        if errors:
+            response = jsonify(errors=errors)
+            response.status_code = 400
+            raise BadRequest(response=response)
+        base_query_kwargs = self.get_base_query_kwargs()
+        for kwargs in kwargs_list:
+            kwargs.update(base_query_kwargs)
+        try:
+            resources = self._create_resources(kwargs_list)
+        except IntegrityError as e:
+            self.session.rollback()
+            raise Conflict(str(e))
+        pk_column = get_view_plan(self).pk_column
+        resource_ids = [getattr(resource, pk_column.name) for resource in resources]
+        self._execute_batch_callbacks(resources, kwargs_list, CallbackType.pre)
+        self._index_resources(resources)
+        self.session.commit()
+        # Committing expires the new resources. Reload them in chunks rather than refreshing each one on access.
+        base_query = self._get_base_query(self.ResponseSchema)
+        for chunk in chunked(resource_ids, self.stream_chunk_size):
+            base_query.filter(pk_column.in_(chunk)).all()
+        self._execute_batch_callbacks(resources, kwargs_list, CallbackType.post)
+        return serialize_model_instances(resources, self.ResponseSchema)
+
     def put(self, resource_id: ResourceId, **kwargs: Any) -> tuple[JsonDict, int]:
         if not self.UpdateSchema:
             raise NotImplementedError()
@@ -293,89 +1225,212 @@ class FlaskMuckApiView(MethodView):
         kwargs = self._get_kwargs_from_request_payload()
         resource = self._update_resource(resource, kwargs)
         self._execute_callbacks(resource, kwargs, CallbackType.pre)
+        self._index_resources([resource])
         self.session.commit()
         self._execute_callbacks(resource, kwargs, CallbackType.post)
         return serialize_model_instance(resource, self.ResponseSchema), 200
 
     def patch(self, resource_id: ResourceId, **kwargs: Any) -> tuple[JsonDict, int]:
+        if resource_id is None and not self.one_to_one_api:
+            return self._bulk_update(), 200
         if not self.PatchSchema:
             raise NotImplementedError()
         resource = self._get_resource(resource_id)
         kwargs = self._get_kwargs_from_request_payload()
         resource = self._update_resource(resource, kwargs)
         self._execute_callbacks(resource, kwargs, CallbackType.pre)
+        self._index_resources([resource])
         self.session.commit()
         self._execute_callbacks(resource, kwargs, CallbackType.post)
         return serialize_model_instance(resource, self.ResponseSchema), 200
 
-    def delete(self, resource_id: ResourceId, **kwargs: Any) -> tuple[str, int]:
+    def delete(
+        self, resource_id: ResourceId, **kwargs: Any
+    ) -> tuple[Union[str, JsonDict], int]:
+        if resource_id is None and not self.one_to_one_api:
+            return self._bulk_delete(), 200
         resource = self._get_resource(resource_id)
         kwargs = {}
         if self.DeleteSchema:
             kwargs = self._get_kwargs_from_request_payload()
+        if self._has_deferred_callbacks(CallbackType.post):
+            # Deleted resources can't be reloaded after the commit so they're snapshotted beforehand.
+            self._get_resource_snapshot(resource)
         self.session.delete(resource)
         self._execute_callbacks(resource, kwargs, CallbackType.pre)
+        self._index_resources([resource], removed=True)
         self.session.commit()
         self._execute_callbacks(resource, kwargs, CallbackType.post)
         return "", 204
 
+    @classmethod
+    def allows_bulk_modification(cls, method: str) -> bool:
+        """Indicates whether PATCH or DELETE requests to the collection URL are handled as bulk modifications. Bulk
+        modifications don't load resources, so they're refused if the method has callbacks or, for DELETE, a
+        DeleteSchema that would otherwise be skipped. Bulk updates also require a PatchSchema.
+        """
+        if not cls.allow_bulk_modification or method not in cls.allowed_methods:
+            return False
+        if method == "PATCH" and not cls.PatchSchema:
+            return False
+        operation = METHOD_OPERATION_MAP[method]
+        if getattr(cls, f"pre_{operation}_callbacks") or getattr(
+            cls, f"post_{operation}_callbacks"
+        ):
+            return False
+        return method != "DELETE" or cls.DeleteSchema is None
+
+    def _get_bulk_modification_criteria(self) -> list[ColumnElement]:
+        """Returns the WHERE criteria for a bulk update or delete built from the filters query param, the parent path
+        filters and the base query kwargs. Criteria that can only be satisfied with joins are rewritten as a primary key
+        IN subquery so the modification is still a single statement.
+        """
+        if not self.allows_bulk_modification(request.method):
+            raise MethodNotAllowed
+        filter_data = self._get_clean_filter_data(request.args.get("filters") or "{}")
+        if not isinstance(filter_data, dict) or not filter_data:
+            raise BadRequest(
+                "Bulk updates and deletes require a non-empty filters object."
+            )
+        query_filters, join_models = self._get_query_filters(filter_data)
+        criteria: list[ColumnElement] = [
+            *get_query_filters_from_request_path(self, []),
+            *query_filters,
+            *(
+                getattr(self.Model, key) == value
+                for key, value in self.get_base_query_kwargs().items()
+            ),
+        ]
+        tables = {table for _filter in criteria for table in find_tables(_filter)}
+        if tables <= {self.Model.__table__} and join_models <= {self.Model}:
+            return criteria
+        pk_column = get_view_plan(self).pk_column
+        subquery = self._apply_list_filters(
+            self._get_base_query(), query_filters, join_models
+        ).with_entities(pk_column)
+        return [pk_column.in_(subquery.scalar_subquery())]
+
+    def _bulk_update(self) -> JsonDict:
+        """Updates every resource matching the request's filters with a single UPDATE statement."""
+        criteria = self._get_bulk_modification_criteria()
+        kwargs = self._get_kwargs_from_request_payload()
+        column_attrs = inspect(self.Model).column_attrs
+        for key in kwargs:
+            if key not in column_attrs:
+                raise BadRequest(f"{key} can not be updated in bulk.")
+        if not kwargs:
+            raise BadRequest("Bulk updates require at least one field to update.")
+        resource_ids = self._get_bulk_search_index_ids(criteria)
+        result = self.session.execute(
+            update(self.Model).where(*criteria).values(**kwargs)
+        )
+        if resource_ids:
+            self.search_backend.index(self.session, type(self), resource_ids)
+        self.session.commit()
+        return {"count": result.rowcount}
+
+    def _bulk_delete(self) -> JsonDict:
+        """Deletes every resource matching the request's filters with a single DELETE statement."""
+        criteria = self._get_bulk_modification_criteria()
+        if resource_ids := self._get_bulk_search_index_ids(criteria):
+            self.search_backend.remove(self.session, type(self), resource_ids)
+        result = self.session.execute(delete(self.Model).where(*criteria))
+        self.session.commit()
+        return {"count": result.rowcount}
+
+    def _get_bulk_search_index_ids(
+        self, criteria: list[ColumnElement]
+    ) -> list[ResourceId]:
+        """Returns the ids of the resources a bulk modification will touch if the search backend maintains an index
+        that needs to be kept in sync with them.
+        """
+        if not self.search_backend.maintains_index or not self.searchable_columns:
+            return []
+        pk_column = get_view_plan(self).pk_column
+        return list(self.session.scalars(select(pk_column).where(*criteria)))
+
+    def _index_resources(
+        self, resources: list[SqlaModel], removed: bool = False
+    ) -> None:
+        """Keeps the search backend's index in sync with resources written in this request's transaction."""
+        if not self.search_backend.maintains_index or not self.searchable_columns:
+            return
+        pk_name = get_view_plan(self).pk_column.name
+        resource_ids = [getattr(resource, pk_name) for resource in resources]
+        if removed:
+            self.search_backend.remove(self.session, type(self), resource_ids)
+        else:
+            self.search_backend.index(self.session, type(self), resource_ids)
+
     def _get_query_filters(
         self, filters: JsonDict
-    ) -> tuple[list[BinaryExpression], set[SqlaModelType]]:
+    ) -> tuple[list[ColumnElement], set[SqlaModelType]]:
         """Translates a dictionary of column names and values into a list of SQLA query filters.
         Also returns a list of models that should be joined to the base query.
         """
-        query_filters: list[BinaryExpression] = []
+        plan = compile_filter_plan(
+            self.Model, tuple(sorted(filters)), self.operator_separator
+        )
+        query_filters: list[ColumnElement] = []
         join_models: set[SqlaModelType] = set()
-        for column_name, value in filters.items():
-            # Get operator.
-            operator = None
-            if self.operator_separator in column_name:
-                column_name, operator = column_name.split(self.operator_separator)
-
-            # Handle nested filters.
-            if "." in column_name:
-                relationship_name, column_name = column_name.split(".")
-                field = getattr(self.Model, relationship_name, None)
-                if not field:
-                    raise BadRequest(
-                        f"{column_name} is not a valid filter field. The relationship does not exist."
-                    )
-                _Model = field.property.mapper.class_
-                join_models.add(_Model)
+        exists_filters: dict[str, tuple[InstrumentedAttribute, list]] = {}
+        for compiled_filter in plan:
+            query_filter = compiled_filter.operator(
+                compiled_filter.column, filters[compiled_filter.key]
+            )
+            relationship = compiled_filter.relationship
+            if relationship is None or compiled_filter.join_model is None:
+                query_filters.append(query_filter)
+            elif self._use_exists_filter(relationship):
+                exists_filters.setdefault(relationship.key, (relationship, []))[
+                    1
+                ].append(query_filter)
             else:
-                _Model = self.Model
-
-            if not (column := getattr(_Model, column_name, None)):
-                raise BadRequest(f"{column_name} is not a valid filter field.")
-
-            if operator == "gt":
-                _filter = column > value
-            elif operator == "gte":
-                _filter = column >= value
-            elif operator == "lt":
-                _filter = column < value
-            elif operator == "lte":
-                _filter = column <= value
-            elif operator == "ne":
-                _filter = column != value
-            elif operator == "in":
-                _filter = column.in_(value)
-            elif operator == "not_in":
-                _filter = column.not_in(value)
+                query_filters.append(query_filter)
+                join_models.add(compiled_filter.join_model)
+        # Filters on the same relationship share a subquery so they must all match the same related row, just as
+        # they would when joined.
+        for relationship, relationship_filters in exists_filters.values():
+            if relationship.property.uselist:
+                query_filters.append(relationship.any(and_(*relationship_filters)))
             else:
-                _filter = column == value
-            query_filters.append(_filter)
+                query_filters.append(relationship.has(and_(*relationship_filters)))
         return query_filters, join_models
 
-    def _get_query_order_by(
-        self, sort: str
-    ) -> tuple[Optional[UnaryExpression], set[SqlaModelType]]:
+    def _use_exists_filter(self, relationship: InstrumentedAttribute) -> bool:
+        if self.relationship_filter_strategy == "auto":
+            return relationship.property.uselist
+        return self.relationship_filter_strategy == "exists"
+
+    def _get_query_sort_column(
+        self, sort: str, search: Optional[str] = None
+    ) -> tuple[ColumnElement, Literal["asc", "desc"], set[SqlaModelType]]:
+        """Translates a sort query param into the column to sort by, the sort direction and a set of models that
+        should be joined to the base query. Sorting by `relevance`, most relevant first by default, orders search
+        results using the search backend's ranking.
+        """
         if self.operator_separator in sort:
             column_name, direction = sort.split(self.operator_separator)
         else:
             column_name, direction = sort, "asc"
 
+        if column_name == RELEVANCE_SORT and not hasattr(self.Model, RELEVANCE_SORT):
+            if not search or not self.search_backend.supports_ranking:
+                raise BadRequest(
+                    "Relevance sorting is only supported for searches on endpoints with ranked search."
+                )
+            if self.operator_separator not in sort:
+                direction = "desc"
+            if direction not in ("asc", "desc"):
+                raise BadRequest(
+                    f"Invalid sort direction: {direction}. Must asc or desc"
+                )
+            return (
+                self.search_backend.get_rank(type(self), search),
+                direction,  # type: ignore
+                set(),
+            )
+
         # Handle nested fields.
         join_models = set()
         if "." in column_name:
@@ -388,35 +1443,19 @@ class FlaskMuckApiView(MethodView):
         else:
             _Model = self.Model
 
-        if hasattr(_Model, column_name):
-            column = getattr(_Model, column_name)
-            if direction == "asc":
-                order_by = column.asc()
-            elif direction == "desc":
-                order_by = column.desc()
-            else:
-                raise BadRequest(
-                    f"Invalid sort direction: {direction}. Must asc or desc"
-                )
-        else:
+        if not hasattr(_Model, column_name):
             raise BadRequest(f"{column_name} is not a valid sort field.")
-        return order_by, join_models
+        if direction not in ("asc", "desc"):
+            raise BadRequest(f"Invalid sort direction: {direction}. Must asc or desc")
+        return getattr(_Model, column_name), direction, join_models  # type: ignore
 
     def _get_query_search_filter(
         self, search_string: str
-    ) -> tuple[Optional[BooleanClauseList], set[SqlaModelType]]:
+    ) -> tuple[Optional[ColumnElement], set[SqlaModelType]]:
         """Returns SQLA full text search filters for the search_term provided."""
         if not self.searchable_columns:
             raise BadRequest("Search is not supported on this endpoint.")
-        searches = []
-        join_models = set()
-        for column in self.searchable_columns:
-            join_models.add(column.parent.class_)
-            searches.append(column.ilike(f"%{search_string}%"))
-        if len(searches) == 1:
-            return searches[0], join_models
-        else:
-            return or_(*searches), join_models
+        return self.search_backend.get_filter(type(self), search_string)
 
     @classmethod
     def add_rules_to_blueprint(cls, blueprint: Blueprint) -> None:
@@ -1,3 +1,7 @@
+import asyncio
+from datetime import datetime
+from importlib.util import find_spec
+
 import marshmallow as ma
 from flask import Flask, Blueprint
 from flask_login import (
@@ -11,9 +15,20 @@ from flask_login import (
 from flask_sqlalchemy import SQLAlchemy
 from marshmallow import fields as mf
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import (
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped
+from sqlalchemy.pool import NullPool
 
-from flask_muck import FlaskMuckCallback, FlaskMuck
+from flask_muck import (
+    FlaskMuckCallback,
+    FlaskMuck,
+    AsyncFlaskMuckApiView,
+    AsyncFlaskMuckCallback,
+)
 from flask_muck.views import FlaskMuckApiView
 
 login_manager = LoginManager()
@@ -26,6 +41,13 @@ class Base(DeclarativeBase):
 
 db = SQLAlchemy(model_class=Base)
 
+# Async views share the same sqlite file through aiosqlite when it is installed.
+ASYNC_VIEWS_SUPPORTED = bool(find_spec("aiosqlite") and find_spec("asgiref"))
+async_session_factory = async_sessionmaker()
+async_session = async_scoped_session(
+    async_session_factory, scopefunc=asyncio.current_task
+)
+
 
 # Create SQLAlchemy database models.
 class UserModel(db.Model, UserMixin):
@@ -44,6 +66,7 @@ class GuardianModel(db.Model):
     name = db.Column(db.String, nullable=False, unique=True)
     age = db.Column(db.Integer, nullable=True)
     family_id = db.Column(db.Integer, db.ForeignKey(FamilyModel.id))
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     family = db.relationship(FamilyModel)
     children: Mapped[list["ChildModel"]] = db.relationship()
 
@@ -170,6 +193,65 @@ class ToyApiView(BaseApiView):
     one_to_one_api = True
 
 
+class BulkBaseApiView(BaseApiView):
+    """Base view for APIs that allow bulk updates and deletes, which can't have patch or delete callbacks."""
+
+    allow_bulk_modification = True
+    pre_patch_callbacks = []
+    pre_delete_callbacks = []
+    post_patch_callbacks = []
+    post_delete_callbacks = []
+
+
+class BulkGuardianApiView(BulkBaseApiView, GuardianApiView):
+    pass
+
+
+class BulkChildApiView(BulkBaseApiView, ChildApiView):
+    parent = BulkGuardianApiView
+
+
+class AsyncPreCallback(AsyncFlaskMuckCallback):
+    async def execute(self) -> None:
+        return
+
+
+class AsyncPostCallback(AsyncFlaskMuckCallback):
+    async def execute(self) -> None:
+        return
+
+
+class AsyncBaseApiView(AsyncFlaskMuckApiView):
+    session = async_session
+    decorators = [login_required]
+    pre_create_callbacks = [AsyncPreCallback]
+    pre_patch_callbacks = [AsyncPreCallback]
+    post_create_callbacks = [AsyncPostCallback]
+    post_patch_callbacks = [AsyncPostCallback]
+
+
+class AsyncGuardianApiView(AsyncBaseApiView):
+    api_name = "async-guardians"
+    Model = GuardianModel
+    ResponseSchema = GuardianSchema
+    CreateSchema = GuardianSchema
+    PatchSchema = GuardianSchema
+    UpdateSchema = GuardianSchema
+    DetailSchema = GuardianDetailSchema
+    searchable_columns = [GuardianModel.name, GuardianModel.age]
+
+
+class AsyncChildApiView(AsyncBaseApiView):
+    api_name = "async-children"
+    Model = ChildModel
+    ResponseSchema = ChildSchema
+    CreateSchema = ChildSchema
+    PatchSchema = ChildSchema
+    UpdateSchema = ChildSchema
+    parent = AsyncGuardianApiView
+    searchable_columns = [ChildModel.name]
+
+
 def create_app(use_extension: bool = True) -> Flask:
     app = Flask(__name__)
     app.config["SECRET_KEY"] = "super-secret"
@@ -179,13 +261,28 @@ def create_app(use_extension: bool = True) -> Flask:
     app.test_client_class = FlaskLoginClient
     login_manager.init_app(app)
     db.init_app(app)
+    views = [GuardianApiView, ChildApiView, ToyApiView]
     if use_extension:
         muck = FlaskMuck(app)
         with app.app_context():
-            muck.register_muck_views([GuardianApiView, ChildApiView, ToyApiView])
+            muck.register_muck_views(views)
     else:
-        GuardianApiView.add_rules_to_blueprint(api_blueprint)
-        ChildApiView.add_rules_to_blueprint(api_blueprint)
-        ToyApiView.add_rules_to_blueprint(api_blueprint)
+        for view in views:
+            view.add_rules_to_blueprint(api_blueprint)
         app.register_blueprint(api_blueprint)
+    bulk_api_blueprint = Blueprint("bulk_api", __name__, url_prefix="/bulk/")
+    BulkGuardianApiView.add_rules_to_blueprint(bulk_api_blueprint)
+    BulkChildApiView.add_rules_to_blueprint(bulk_api_blueprint)
+    app.register_blueprint(bulk_api_blueprint)
+    if ASYNC_VIEWS_SUPPORTED:
+        async_session_factory.configure(
+            bind=create_async_engine(
+                f"sqlite+aiosqlite:///{app.instance_path}/todo_example.db",
+                poolclass=NullPool,
+            )
+        )
+        async_api_blueprint = Blueprint("async_api", __name__, url_prefix="/")
+        AsyncGuardianApiView.add_rules_to_blueprint(async_api_blueprint)
+        AsyncChildApiView.add_rules_to_blueprint(async_api_blueprint)
+        app.register_blueprint(async_api_blueprint)
     return app
@@ -1,10 +1,12 @@
-from typing import Callable, Literal
+from contextlib import contextmanager
+from typing import Callable, Literal, Iterator
 
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient, FlaskCliRunner
 from flask_sqlalchemy import SQLAlchemy
 from pydantic import BaseModel
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
 
 from flask_muck.types import JsonDict
@@ -84,6 +86,24 @@ def delete(client) -> Callable:
     return _delete
 
 
+@pytest.fixture
+def count_queries(db) -> Callable:
+    @contextmanager
+    def _count_queries() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def _before_cursor_execute(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _count_queries
+
+
 @pytest.fixture
 def db(app) -> SQLAlchemy:
     _db.create_all()
@@ -1,25 +1,77 @@
+import gzip
 import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from typing import Optional
 from unittest.mock import patch
 
 import pytest
-from pydantic import BaseModel
-
+from flask import Flask
+from marshmallow import Schema, fields as mf
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+from apispec import APISpec
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from werkzeug.exceptions import BadRequest
+
+from flask_muck.cache import TTLCache
+from flask_muck.callback import DeferredCallbackExecutor
+from flask_muck.encoders import OrjsonEncoder, get_json_encoder
+from flask_muck.metrics import MuckMetrics
+from flask_muck.open_api import update_spec_from_muck_view
+from flask_muck.timing import request_timed
+from flask_muck.profiling import (
+    assert_max_queries,
+    get_statement_shape,
+    profile_queries,
+)
+from flask_muck.search import SQLiteFTS5SearchBackend, PostgresSearchBackend
 from flask_muck.exceptions import MuckImplementationError
+from flask_muck import views, FlaskMuck
+from flask_muck.views import _count_cache
 from flask_muck.utils import (
     get_url_rule,
     get_fk_column,
     get_query_filters_from_request_path,
     get_join_models_from_parent_views,
+    serialize_model_instance,
+    serialize_model_instances,
+    validate_payload,
+    validate_payloads,
+    compile_filter_plan,
+    join_fans_out,
+    compile_muck_view,
+    get_view_plan,
+    get_eager_load_plan,
+    get_eager_load_options,
+    pydantic_model_to_optional,
 )
 from tests.app import (
     GuardianModel,
+    FamilyModel,
     ToyApiView,
     ChildModel,
     ToyModel,
     BaseApiView,
+    ChildApiView,
     PreCallback,
     PostCallback,
     GuardianApiView,
+    BulkGuardianApiView,
+    GuardianDetailSchema,
+    GuardianSchema,
+    ChildSchema,
+    AsyncPreCallback,
+    AsyncPostCallback,
 )
 
 
@@ -97,6 +149,582 @@ class TestPagination:
         }
 
 
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestCountStrategies:
+    @pytest.fixture(autouse=True)
+    def clear_count_cache(self):
+        _count_cache.clear()
+
+    @pytest.fixture
+    def count_strategy(self, monkeypatch):
+        def _count_strategy(strategy: str) -> None:
+            monkeypatch.setattr(BaseApiView, "count_strategy", strategy)
+
+        return _count_strategy
+
+    def test_none(self, get, count_strategy):
+        count_strategy("none")
+        assert get("/guardians/?limit=1") == {
+            "items": [{"name": "Marge"}],
+            "limit": 1,
+            "offset": 0,
+            "has_more": True,
+        }
+        assert get("/guardians/?limit=1&offset=1")["has_more"] is False
+
+    @pytest.mark.parametrize("strategy", ["exact", "window", "cached", "estimated"])
+    def test_total(self, get, count_strategy, strategy):
+        count_strategy(strategy)
+        assert get("/guardians/?limit=1") == {
+            "items": [{"name": "Marge"}],
+            "limit": 1,
+            "offset": 0,
+            "total": 2,
+        }
+        assert get("/guardians/?limit=1&offset=5")["total"] == 2
+        assert get('/guardians/?limit=1&filters={"children.name": "Bart"}') == {
+            "items": [{"name": "Marge"}],
+            "limit": 1,
+            "offset": 0,
+            "total": 1,
+        }
+
+    def test_window_is_single_query(self, db, get, count_queries, count_strategy):
+        count_strategy("window")
+        db.session.expire_all()
+        with count_queries() as queries:
+            get("/guardians/?limit=1")
+        assert len(queries) == 1
+
+    def test_cached(self, get, create_model, count_strategy):
+        count_strategy("cached")
+        assert get("/guardians/?limit=1&search=a")["total"] == 1
+        create_model(GuardianModel(name="Abe"))
+        assert get("/guardians/?limit=1&search=a")["total"] == 1
+        assert get("/guardians/?limit=1&search=ab")["total"] == 1
+        assert get("/guardians/?limit=1")["total"] == 3
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestConditionalRequests:
+    @pytest.fixture(autouse=True)
+    def version_column(self, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "version_column", "updated_at")
+
+    def test_detail(self, client, db, marge, count_queries):
+        url = f"/guardians/{marge.id}/"
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        last_modified = response.headers["Last-Modified"]
+
+        db.session.expire_all()
+        with count_queries() as queries:
+            response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        assert len(queries) == 1
+
+        response = client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        client.patch(url, json={"name": "Marjorie"})
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.parametrize("query_string", ["", "?fields=name"])
+    def test_unconditional_detail_queries(
+        self, client, db, marge, count_queries, monkeypatch, query_string
+    ):
+        url = f"/guardians/{marge.id}/{query_string}"
+        db.session.expire_all()
+        with count_queries() as queries:
+            response = client.get(url)
+        assert "ETag" in response.headers
+        monkeypatch.setattr(GuardianApiView, "version_column", None)
+        db.session.expire_all()
+        with count_queries() as unversioned_queries:
+            client.get(url)
+        assert len(queries) == len(unversioned_queries)
+
+    def test_list(self, client, create_model):
+        etag = client.get("/guardians/").headers["ETag"]
+        assert (
+            client.get("/guardians/", headers={"If-None-Match": etag}).status_code
+            == 304
+        )
+        assert (
+            client.get(
+                "/guardians/?limit=1", headers={"If-None-Match": etag}
+            ).status_code
+            == 200
+        )
+        create_model(GuardianModel(name="Abe"))
+        response = client.get("/guardians/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json) == 3
+
+    def test_no_version_column(self, client, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "version_column", None)
+        assert "ETag" not in client.get("/guardians/").headers
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def response_cache(self, monkeypatch):
+        cache = TTLCache(maxsize=100)
+        monkeypatch.setattr(BaseApiView, "response_cache", cache)
+        monkeypatch.setattr(views, "_response_cache_stats", {})
+        return cache
+
+    def test_hit(self, db, get, count_queries):
+        response = get("/guardians/?sort=name")
+        db.session.expire_all()
+        with count_queries() as queries:
+            assert get("/guardians/?sort=name") == response
+        assert not any("guardian_model" in query for query in queries)
+        assert GuardianApiView.get_response_cache_stats().to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_ratio": 0.5,
+        }
+
+    def test_query_string_is_normalized(self, get):
+        get("/guardians/?limit=1&offset=1")
+        get("/guardians/?offset=1&limit=1")
+        assert GuardianApiView.get_response_cache_stats().hits == 1
+
+    def test_write_invalidates(self, get, post, patch, marge):
+        assert len(get("/guardians/")) == 2
+        post("/guardians/", json={"name": "Abe"})
+        assert len(get("/guardians/")) == 3
+        patch(f"/guardians/{marge.id}/", json={"name": "Marjorie"})
+        assert get(f"/guardians/{marge.id}/")["name"] == "Marjorie"
+        assert GuardianApiView.get_response_cache_stats().hits == 0
+
+    def test_child_write_invalidates_parent(self, get, patch, marge, bart):
+        url = f"/guardians/{marge.id}/"
+        assert {"name": "Bart"} in get(url)["children"]
+        patch(f"/guardians/{marge.id}/children/{bart.id}/", json={"name": "El Barto"})
+        assert {"name": "El Barto"} in get(url)["children"]
+
+    def test_tenants_are_separated(self, get, monkeypatch, simpson_family):
+        get("/guardians/")
+        monkeypatch.setattr(
+            BaseApiView,
+            "get_base_query_kwargs",
+            lambda self: {"family_id": simpson_family.id},
+        )
+        assert get("/guardians/") == [{"name": "Marge"}]
+
+    def test_extension_stats(self, app, get):
+        get("/guardians/")
+        if muck := app.extensions.get("muck"):
+            assert muck.response_cache_stats["guardians"] == {
+                "hits": 0,
+                "misses": 1,
+                "hit_ratio": 0.0,
+            }
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestCursorPagination:
+    @pytest.fixture(autouse=True)
+    def enable_cursor_pagination(self, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "allow_cursor_pagination", True)
+
+    @pytest.fixture
+    def get_all_pages(self, get):
+        def _get_all_pages(url: str) -> list[list[dict]]:
+            pages = []
+            cursor = ""
+            while cursor is not None:
+                response = get(f"{url}&cursor={cursor}")
+                assert response["cursor"] == (cursor or None)
+                pages.append(response["items"])
+                cursor = response["next_cursor"]
+            return pages
+
+        return _get_all_pages
+
+    def test_first_page(self, get):
+        response = get("/guardians/?cursor=&limit=1")
+        assert response["items"] == [{"name": "Marge"}]
+        assert response["limit"] == 1
+        assert response["cursor"] is None
+        assert response["next_cursor"] is not None
+
+    def test_pages(self, get_all_pages):
+        assert get_all_pages("/guardians/?limit=1") == [
+            [{"name": "Marge"}],
+            [{"name": "Bob"}],
+        ]
+        assert get_all_pages("/guardians/?limit=5") == [
+            [{"name": "Marge"}, {"name": "Bob"}]
+        ]
+
+    def test_sort(self, get_all_pages, marge):
+        assert get_all_pages("/guardians/?limit=1&sort=name") == [
+            [{"name": "Bob"}],
+            [{"name": "Marge"}],
+        ]
+        assert get_all_pages(
+            f"/guardians/{marge.id}/children/?limit=2&sort=age__desc"
+        ) == [[{"name": "Bart"}, {"name": "Lisa"}], [{"name": "Maggie"}]]
+
+    def test_nested_sort(self, get_all_pages):
+        assert get_all_pages("/guardians/?limit=1&sort=family.surname") == [
+            [{"name": "Bob"}],
+            [{"name": "Marge"}],
+        ]
+
+    def test_filters_and_search(self, get_all_pages, marge):
+        assert get_all_pages(
+            f'/guardians/{marge.id}/children/?limit=1&filters={{"age__gt": 1}}'
+        ) == [[{"name": "Bart"}], [{"name": "Lisa"}]]
+        assert get_all_pages(
+            f"/guardians/{marge.id}/children/?limit=1&search=a&sort=name"
+        ) == [[{"name": "Bart"}], [{"name": "Lisa"}], [{"name": "Maggie"}]]
+
+    @pytest.mark.parametrize(
+        "sort, names",
+        [
+            ("age", ["Homer", "Patty", "Marge", "Selma", "Bob"]),
+            ("age__desc", ["Bob", "Selma", "Marge", "Patty", "Homer"]),
+        ],
+    )
+    @pytest.mark.parametrize("limit", [1, 2])
+    def test_sort_with_nulls(self, get_all_pages, create_model, sort, names, limit):
+        for name, age in [("Homer", None), ("Patty", None), ("Selma", 43)]:
+            create_model(GuardianModel(name=name, age=age))
+        pages = get_all_pages(f"/guardians/?limit={limit}&sort={sort}")
+        assert [item["name"] for page in pages for item in page] == names
+
+    def test_bad_cursor(self, get):
+        get("/guardians/?cursor=notacursor", expected_status_code=400)
+        get("/guardians/?cursor=&offset=1", expected_status_code=400)
+
+    def test_not_allowed(self, get, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "allow_cursor_pagination", False)
+        get("/guardians/?cursor=", expected_status_code=400)
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestStreaming:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "stream_chunk_size", 2)
+
+    def test_ndjson(self, client, marge):
+        response = client.get(
+            f"/guardians/{marge.id}/children/?sort=name",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.content_length is None
+        assert response.mimetype == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"name": "Bart"},
+            {"name": "Lisa"},
+            {"name": "Maggie"},
+        ]
+
+    def test_json_array(self, client, get, monkeypatch):
+        expected = get("/guardians/")
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        response = client.get("/guardians/")
+        assert response.content_length is None
+        assert response.mimetype == "application/json"
+        assert response.json == expected
+
+    def test_empty(self, client, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        assert client.get("/guardians/?search=nobody").json == []
+        response = client.get(
+            "/guardians/?search=nobody", headers={"Accept": "application/x-ndjson"}
+        )
+        assert response.text == ""
+
+    def test_paginated_responses_are_not_streamed(self, client, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        response = client.get("/guardians/?limit=1")
+        assert response.content_length is not None
+        assert response.json["items"] == [{"name": "Marge"}]
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestJsonEncoder:
+    def test_orjson_matches_stdlib(self, app, client, get, post, monkeypatch):
+        expected_list = get("/guardians/")
+        expected_page = get("/guardians/?limit=1")
+        monkeypatch.setitem(app.config, "MUCK_JSON_ENCODER", "orjson")
+        assert get("/guardians/") == expected_list
+        assert get("/guardians/?limit=1") == expected_page
+        assert post("/guardians/", json={"name": "Abe"})["name"] == "Abe"
+
+    def test_orjson_stream(self, app, client, get, monkeypatch):
+        expected = get("/guardians/")
+        monkeypatch.setitem(app.config, "MUCK_JSON_ENCODER", "orjson")
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        response = client.get("/guardians/")
+        assert response.content_length is None
+        assert response.json == expected
+
+    def test_orjson_types(self):
+        encoder = OrjsonEncoder()
+        assert json.loads(
+            encoder.dumps(
+                {
+                    "created": datetime(2024, 1, 2, 3, 4, 5),
+                    "price": Decimal("1.10"),
+                    "id": UUID("12345678123456781234567812345678"),
+                }
+            )
+        ) == {
+            "created": "2024-01-02T03:04:05",
+            "price": "1.10",
+            "id": "12345678-1234-5678-1234-567812345678",
+        }
+        with pytest.raises(TypeError):
+            encoder.dumps({"value": object()})
+
+    def test_unknown_encoder(self, app, monkeypatch):
+        monkeypatch.setitem(app.config, "MUCK_JSON_ENCODER", "nope")
+        with pytest.raises(MuckImplementationError):
+            get_json_encoder()
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestBinaryMediaTypes:
+    @pytest.fixture(autouse=True)
+    def media_types(self, monkeypatch):
+        monkeypatch.setattr(
+            BaseApiView,
+            "media_types",
+            ["application/json", "application/msgpack", "application/cbor"],
+        )
+
+    @pytest.fixture
+    def msgpack(self):
+        return pytest.importorskip("msgpack")
+
+    @pytest.fixture
+    def cbor2(self):
+        return pytest.importorskip("cbor2")
+
+    def test_msgpack_response(self, client, get, msgpack):
+        expected = get("/guardians/?limit=1")
+        response = client.get(
+            "/guardians/?limit=1", headers={"Accept": "application/msgpack"}
+        )
+        assert response.mimetype == "application/msgpack"
+        assert "Accept" in response.vary
+        assert msgpack.unpackb(response.data) == expected
+
+    def test_cbor_response(self, client, get, marge, cbor2):
+        expected = get(f"/guardians/{marge.id}/")
+        response = client.get(
+            f"/guardians/{marge.id}/", headers={"Accept": "application/cbor"}
+        )
+        assert response.mimetype == "application/cbor"
+        assert cbor2.loads(response.data) == expected
+
+    def test_defaults_to_json(self, client):
+        response = client.get("/guardians/", headers={"Accept": "text/html"})
+        assert response.mimetype == "application/json"
+
+    def test_binary_responses_are_not_streamed(self, client, monkeypatch, msgpack):
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        response = client.get("/guardians/", headers={"Accept": "application/msgpack"})
+        assert response.content_length is not None
+        assert len(msgpack.unpackb(response.data)) == 2
+
+    def test_msgpack_request(self, client, get, msgpack):
+        response = client.post(
+            "/guardians/",
+            data=msgpack.packb({"name": "Abe"}),
+            content_type="application/msgpack",
+        )
+        assert response.status_code == 201
+        assert response.json["name"] == "Abe"
+        response = client.post(
+            "/guardians/",
+            data=msgpack.packb([{"name": "Mona"}, {"name": "Herb"}]),
+            content_type="application/msgpack",
+        )
+        assert [g["name"] for g in response.json] == ["Mona", "Herb"]
+
+    def test_cbor_request(self, client, marge, cbor2):
+        response = client.patch(
+            f"/guardians/{marge.id}/",
+            data=cbor2.dumps({"name": "Marjorie"}),
+            content_type="application/cbor",
+            headers={"Accept": "application/cbor"},
+        )
+        assert response.status_code == 200
+        assert cbor2.loads(response.data)["name"] == "Marjorie"
+
+    def test_invalid_body(self, client, msgpack):
+        response = client.post(
+            "/guardians/", data=b"\xc1", content_type="application/msgpack"
+        )
+        assert response.status_code == 400
+
+    def test_unsupported_media_type(self, client, monkeypatch, msgpack):
+        monkeypatch.setattr(BaseApiView, "media_types", ["application/json"])
+        response = client.post(
+            "/guardians/",
+            data=msgpack.packb({"name": "Abe"}),
+            content_type="application/msgpack",
+        )
+        assert response.status_code == 415
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestCompression:
+    @pytest.fixture(autouse=True)
+    def compression(self, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "compression_encodings", ["zstd", "gzip"])
+        monkeypatch.setattr(BaseApiView, "compression_min_size", 0)
+
+    @pytest.fixture
+    def zstandard(self):
+        return pytest.importorskip("zstandard")
+
+    def test_gzip(self, client, get):
+        expected = get("/guardians/")
+        response = client.get("/guardians/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.vary
+        assert response.content_length == len(response.data)
+        assert json.loads(gzip.decompress(response.data)) == expected
+
+    def test_zstd(self, client, get, zstandard):
+        expected = get("/guardians/")
+        response = client.get(
+            "/guardians/", headers={"Accept-Encoding": "gzip, deflate, zstd"}
+        )
+        assert response.headers["Content-Encoding"] == "zstd"
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert json.loads(decompressor.decompress(response.data)) == expected
+
+    def test_not_accepted(self, client):
+        response = client.get("/guardians/", headers={"Accept-Encoding": "br"})
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.vary
+
+    def test_min_size(self, client, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "compression_min_size", 1_000_000)
+        response = client.get("/guardians/", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_stream(self, client, get, monkeypatch):
+        expected = get("/guardians/")
+        monkeypatch.setattr(BaseApiView, "stream_list_responses", True)
+        monkeypatch.setattr(BaseApiView, "stream_chunk_size", 1)
+        monkeypatch.setattr(BaseApiView, "compression_min_size", 1_000_000)
+        response = client.get("/guardians/", headers={"Accept-Encoding": "gzip"})
+        assert response.content_length is None
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.data)) == expected
+
+    def test_response_cache(self, client, get, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "response_cache", TTLCache(maxsize=100))
+        monkeypatch.setattr(views, "_response_cache_stats", {})
+        for _ in range(2):
+            compressed = client.get("/guardians/", headers={"Accept-Encoding": "gzip"})
+            assert compressed.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(compressed.data)) == get("/guardians/")
+        assert GuardianApiView.get_response_cache_stats().hits == 2
+
+    def test_unsupported_encoding(self, client, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "compression_encodings", ["br"])
+        with pytest.raises(MuckImplementationError):
+            client.get("/guardians/", headers={"Accept-Encoding": "br"})
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestSparseFieldsets:
+    def test_list(self, get, marge):
+        assert get("/guardians/?fields=name&sort=id") == [
+            {"name": "Marge"},
+            {"name": "Bob"},
+        ]
+        assert get(f"/guardians/{marge.id}/children/?fields=name&limit=1") == {
+            "items": [{"name": "Bart"}],
+            "limit": 1,
+            "offset": 0,
+            "total": 3,
+        }
+
+    def test_detail(self, get, marge):
+        assert get(f"/guardians/{marge.id}/?fields=name") == {"name": "Marge"}
+        assert get(f"/guardians/{marge.id}/?fields=children") == {
+            "children": [{"name": "Bart"}, {"name": "Maggie"}, {"name": "Lisa"}]
+        }
+
+    def test_pydantic(self, get, marge, pydantic_swap):
+        assert get(f"/guardians/{marge.id}/?fields=name") == {"name": "Marge"}
+
+    def test_pydantic_serializers(self, get, marge, monkeypatch):
+        class SerializedGuardianModel(BaseModel):
+            name: str
+            age: Optional[int]
+
+            @field_serializer("name")
+            def upper(self, value: str) -> str:
+                return value.upper()
+
+            @computed_field  # type: ignore[prop-decorator]
+            @property
+            def greeting(self) -> str:
+                return f"Hi {self.name}"
+
+        monkeypatch.setattr(GuardianApiView, "ResponseSchema", SerializedGuardianModel)
+        monkeypatch.setattr(GuardianApiView, "DetailSchema", None)
+        assert get(f"/guardians/{marge.id}/?fields=name,greeting") == {
+            "name": "MARGE",
+            "greeting": "Hi Marge",
+        }
+        assert get("/guardians/?fields=name&sort=id") == [
+            {"name": "MARGE"},
+            {"name": "BOB"},
+        ]
+
+    def test_columns_are_not_fetched(self, db, get, count_queries, marge):
+        db.session.expire_all()
+        with count_queries() as queries:
+            get(f"/guardians/{marge.id}/?fields=name")
+        assert "guardian_model.name" in queries[-1]
+        assert "guardian_model.age" not in queries[-1]
+        assert "child_model" not in " ".join(queries)
+
+    def test_method_fields_load_all_columns(self, db, get, count_queries, monkeypatch):
+        class DisplaySchema(Schema):
+            name = mf.String()
+            display = mf.Method("get_display")
+
+            def get_display(self, obj):
+                return f"{obj.name} ({obj.age})"
+
+        monkeypatch.setattr(GuardianApiView, "ResponseSchema", DisplaySchema)
+        db.session.expire_all()
+        with count_queries() as queries:
+            assert get("/guardians/?fields=display&sort=id") == [
+                {"display": "Marge (34)"},
+                {"display": "Bob (46)"},
+            ]
+        assert len(queries) == 1
+
+    def test_invalid_field(self, get, marge):
+        get("/guardians/?fields=nope", expected_status_code=400)
+        get(f"/guardians/{marge.id}/?fields=name,nope", expected_status_code=400)
+
+
 @pytest.mark.usefixtures("simpsons", "belchers")
 class TestFiltering:
     @pytest.fixture
@@ -188,6 +816,53 @@ class TestFiltering:
         assert filter_guardians({"children.name": "Bart"}) == [{"name": "Marge"}]
         assert filter_guardians({"children.name": "Gene"}) == [{"name": "Bob"}]
 
+    def test_distinct_only_for_fan_out_joins(
+        self, filter_guardians, count_queries, monkeypatch
+    ):
+        monkeypatch.setattr(GuardianApiView, "relationship_filter_strategy", "join")
+        with count_queries() as queries:
+            assert filter_guardians({"family.surname": "Simpsons"}) == [
+                {"name": "Marge"}
+            ]
+        assert "JOIN family_model" in queries[-1]
+        assert "DISTINCT" not in queries[-1]
+        with count_queries() as queries:
+            assert filter_guardians({"children.age__gt": 0}) == [
+                {"name": "Marge"},
+                {"name": "Bob"},
+            ]
+        assert "DISTINCT" in queries[-1]
+
+    @pytest.mark.parametrize("strategy", ["auto", "exists"])
+    def test_exists_filters(
+        self, filter_guardians, count_queries, monkeypatch, strategy
+    ):
+        monkeypatch.setattr(GuardianApiView, "relationship_filter_strategy", strategy)
+        with count_queries() as queries:
+            assert filter_guardians({"children.age__gt": 0}) == [
+                {"name": "Marge"},
+                {"name": "Bob"},
+            ]
+        assert "EXISTS" in queries[-1]
+        assert "JOIN" not in queries[-1]
+        assert "DISTINCT" not in queries[-1]
+        # Filters on the same relationship must match the same related row.
+        assert filter_guardians({"children.name": "Bart", "children.age": 10}) == [
+            {"name": "Marge"}
+        ]
+        assert filter_guardians({"children.name": "Bart", "children.age": 8}) == []
+        with count_queries() as queries:
+            assert filter_guardians({"family.surname": "Simpsons"}) == [
+                {"name": "Marge"}
+            ]
+        assert ("EXISTS" in queries[-1]) == (strategy == "exists")
+
+    def test_unfiltered_list_has_no_distinct(self, get, count_queries):
+        with count_queries() as queries:
+            get("/guardians/")
+        assert "DISTINCT" not in queries[-1]
+        assert "JOIN" not in queries[-1]
+
     def test_bad_json(self, get):
         get("/guardians/?filters=notjson", expected_status_code=400)
 
@@ -265,6 +940,518 @@ class TestSearch:
         monkeypatch.setattr(GuardianApiView, "searchable_columns", [])
         get(f"/guardians/?search=marge", expected_status_code=400)
 
+    def test_relevance_requires_ranked_search(self, get):
+        get("/guardians/?search=marge&sort=relevance", expected_status_code=400)
+
+
+class TestSearchBackends:
+    @pytest.fixture
+    def fts5(self, db, simpsons, belchers, monkeypatch):
+        backend = SQLiteFTS5SearchBackend()
+        monkeypatch.setattr(GuardianApiView, "search_backend", backend)
+        backend.create_index(db.session, GuardianApiView)
+        yield backend
+        db.session.rollback()
+        db.session.execute(text("DROP TABLE IF EXISTS guardian_model_fts"))
+        db.session.commit()
+
+    def test_fts5_search(self, get, fts5):
+        assert get("/guardians/?search=marge") == [{"name": "Marge"}]
+        assert get("/guardians/?search=mar") == [{"name": "Marge"}]
+        assert get('/guardians/?search="bob') == [{"name": "Bob"}]
+        assert get("/guardians/?search=nobody") == []
+
+    def test_fts5_blank_search(self, get, fts5):
+        get("/guardians/?search=%20%20", expected_status_code=400)
+        get("/guardians/?search=%20&sort=relevance", expected_status_code=400)
+
+    def test_fts5_index_sync(self, client, get, post, put, fts5):
+        jill = post("/guardians/", json={"name": "Jill"})
+        assert get("/guardians/?search=jill") == [jill]
+        jill_id = GuardianModel.query.filter_by(name="Jill").one().id
+        put(f"/guardians/{jill_id}/", json={"name": "Jillian"})
+        assert get("/guardians/?search=jillian") == [{"name": "Jillian"}]
+        client.delete(f"/guardians/{jill_id}/")
+        assert get("/guardians/?search=jill") == []
+
+    def test_fts5_bulk_sync(self, client, get, post, fts5):
+        post("/guardians/", json=[{"name": "Jill"}, {"name": "Jack"}])
+        assert len(get("/guardians/?search=j")) == 2
+        client.patch('/bulk/guardians/?filters={"name": "Jack"}', json={"name": "Jim"})
+        assert get("/guardians/?search=jim") == [{"name": "Jim"}]
+        client.delete('/bulk/guardians/?filters={"name": "Jim"}')
+        assert get("/guardians/?search=jim") == []
+
+    def test_relevance_sort(self, get, post, fts5):
+        post("/guardians/", json=[{"name": "Bob Smith"}, {"name": "Bob Bob"}])
+        assert get("/guardians/?search=bob&sort=relevance") == [
+            {"name": "Bob Bob"},
+            {"name": "Bob"},
+            {"name": "Bob Smith"},
+        ]
+        get(
+            "/guardians/?search=bob&sort=relevance&cursor=",
+            expected_status_code=400,
+        )
+
+    def test_postgres_search(self):
+        backend = PostgresSearchBackend()
+        search_filter, join_models = backend.get_filter(GuardianApiView, "marge")
+        assert join_models == {GuardianModel}
+        sql = str(search_filter.compile(dialect=postgresql.dialect()))
+        assert "to_tsvector" in sql and "websearch_to_tsquery" in sql
+        rank = backend.get_rank(GuardianApiView, "marge")
+        assert "ts_rank" in str(rank.compile(dialect=postgresql.dialect()))
+
+
+class ToyPydanticModel(BaseModel):
+    name: str
+
+
+class ChildPydanticModel(BaseModel):
+    name: str
+    toy: Optional[ToyPydanticModel]
+
+
+class GuardianPydanticModel(BaseModel):
+    name: str
+    children: list[ChildPydanticModel]
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestEagerLoading:
+    def test_marshmallow_plan(self):
+        assert get_eager_load_plan(GuardianModel, GuardianDetailSchema) == (
+            ("children", "selectin"),
+        )
+        assert get_eager_load_plan(GuardianModel, GuardianSchema) == ()
+
+    def test_pydantic_plan(self):
+        assert get_eager_load_plan(GuardianModel, GuardianPydanticModel) == (
+            ("children", "selectin"),
+            ("children.toy", "joined"),
+        )
+
+    def test_invalid_plan(self):
+        with pytest.raises(MuckImplementationError):
+            get_eager_load_options(GuardianModel, {"children.nope": "joined"})
+
+    def test_list_avoids_n_plus_one(self, db, get, count_queries, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "ResponseSchema", GuardianDetailSchema)
+        db.session.expire_all()
+        with count_queries() as eager_queries:
+            eager_response = get("/guardians/")
+        monkeypatch.setattr(BaseApiView, "auto_eager_load", False)
+        db.session.expire_all()
+        with count_queries() as lazy_queries:
+            lazy_response = get("/guardians/")
+        assert eager_response == lazy_response
+        assert len(eager_queries) == 2
+        assert len(lazy_queries) == 3
+
+    def test_override_strategy(self, get, marge, monkeypatch):
+        monkeypatch.setattr(
+            GuardianApiView, "eager_load_strategies", {"children": "noload"}
+        )
+        assert get(f"/guardians/{marge.id}/") == {"name": "Marge", "children": []}
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestBulkModification:
+    def test_bulk_update(self, patch, get, count_queries):
+        with count_queries() as queries:
+            response = patch(
+                f'/bulk/guardians/?filters={{"age__gt": 40}}', json={"name": "Robert"}
+            )
+        assert response == {"count": 1}
+        assert get("/guardians/?sort=name") == [{"name": "Marge"}, {"name": "Robert"}]
+        assert len([q for q in queries if q.startswith("UPDATE")]) == 1
+        assert not any(q.startswith("SELECT guardian_model") for q in queries)
+
+    def test_bulk_delete(self, client, get, marge, bob):
+        response = client.delete(
+            f'/bulk/guardians/{marge.id}/children/?filters={{"age__lt": 10}}'
+        )
+        assert response.status_code == 200
+        assert response.json == {"count": 2}
+        assert get(f"/guardians/{marge.id}/children/") == [{"name": "Bart"}]
+        assert len(get(f"/guardians/{bob.id}/children/")) == 3
+
+    def test_relationship_filter(self, patch, get):
+        assert patch(
+            '/bulk/guardians/?filters={"children.name": "Bart"}',
+            json={"name": "Marjorie"},
+        ) == {"count": 1}
+        assert get("/guardians/?sort=name") == [{"name": "Bob"}, {"name": "Marjorie"}]
+
+    def test_base_query_kwargs(self, patch, monkeypatch, simpson_family):
+        monkeypatch.setattr(
+            BaseApiView,
+            "get_base_query_kwargs",
+            lambda self: {"family_id": simpson_family.id},
+        )
+        assert patch(
+            '/bulk/guardians/?filters={"age__gt": 0}', json={"name": "Marjorie"}
+        ) == {"count": 1}
+
+    def test_requires_filters(self, patch, client):
+        patch("/bulk/guardians/", json={"name": "Nope"}, expected_status_code=400)
+        assert client.delete("/bulk/guardians/").status_code == 400
+
+    @pytest.mark.parametrize("filters", ["{}", "[]", '"age"', "null"])
+    def test_requires_filter_object(self, client, filters):
+        assert client.delete(f"/bulk/guardians/?filters={filters}").status_code == 400
+        assert (
+            client.patch(
+                f"/bulk/guardians/?filters={filters}", json={"name": "Nope"}
+            ).status_code
+            == 400
+        )
+        assert GuardianModel.query.count() == 2
+
+    def test_opt_out(self, client, monkeypatch):
+        monkeypatch.setattr(BulkGuardianApiView, "allow_bulk_modification", False)
+        assert (
+            client.delete('/bulk/guardians/?filters={"age__gt": 0}').status_code == 405
+        )
+        assert GuardianModel.query.count() == 2
+
+    def test_disabled_by_default(self, client, monkeypatch):
+        assert client.delete('/guardians/?filters={"age__gt": 0}').status_code == 405
+        assert (
+            client.patch(
+                '/guardians/?filters={"age__gt": 0}', json={"name": "Nope"}
+            ).status_code
+            == 405
+        )
+        assert client.options("/guardians/").allow == {"GET", "HEAD", "OPTIONS", "POST"}
+        assert "DELETE" in client.options("/bulk/guardians/").allow
+        monkeypatch.setattr(GuardianApiView, "PatchSchema", None)
+        assert client.patch("/guardians/", json={"name": "Nope"}).status_code == 405
+        assert GuardianModel.query.count() == 2
+
+    def test_refused_with_callbacks(self, client, monkeypatch):
+        monkeypatch.setattr(BulkGuardianApiView, "pre_delete_callbacks", [PreCallback])
+        monkeypatch.setattr(BulkGuardianApiView, "post_patch_callbacks", [PostCallback])
+        assert (
+            client.delete('/bulk/guardians/?filters={"age__gt": 0}').status_code == 405
+        )
+        assert (
+            client.patch(
+                '/bulk/guardians/?filters={"age__gt": 0}', json={"name": "Nope"}
+            ).status_code
+            == 405
+        )
+        assert GuardianModel.query.count() == 2
+
+    def test_refused_with_delete_schema(self, client, monkeypatch):
+        monkeypatch.setattr(BulkGuardianApiView, "DeleteSchema", GuardianSchema)
+        assert (
+            client.delete('/bulk/guardians/?filters={"age__gt": 0}').status_code == 405
+        )
+        assert GuardianModel.query.count() == 2
+
+    def test_refused_without_patch_schema(self, client, monkeypatch):
+        monkeypatch.setattr(BulkGuardianApiView, "PatchSchema", None)
+        assert (
+            client.patch(
+                '/bulk/guardians/?filters={"age__gt": 0}', json={"name": "Nope"}
+            ).status_code
+            == 405
+        )
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestAsyncViews:
+    @pytest.fixture(autouse=True)
+    def commit(self, db, user, simpsons, belchers):
+        """Async views use their own connections so fixture data must be committed to be visible to them."""
+        pytest.importorskip("aiosqlite")
+        pytest.importorskip("asgiref")
+        db.session.commit()
+
+    def test_list(self, get):
+        assert get("/async-guardians/?sort=name") == [
+            {"name": "Bob"},
+            {"name": "Marge"},
+        ]
+        assert get('/async-guardians/?filters={"age__gt": 40}') == [{"name": "Bob"}]
+        assert get("/async-guardians/?search=marg") == [{"name": "Marge"}]
+        assert get("/async-guardians/?limit=1&offset=1&sort=name") == {
+            "limit": 1,
+            "offset": 1,
+            "total": 2,
+            "items": [{"name": "Marge"}],
+        }
+
+    def test_detail(self, get, marge):
+        assert get(f"/async-guardians/{marge.id}/") == {
+            "name": "Marge",
+            "children": [{"name": "Bart"}, {"name": "Maggie"}, {"name": "Lisa"}],
+        }
+
+    def test_nested(self, get, marge, bob):
+        assert get(f"/async-guardians/{marge.id}/async-children/?sort=age") == [
+            {"name": "Maggie"},
+            {"name": "Lisa"},
+            {"name": "Bart"},
+        ]
+        assert len(get(f"/async-guardians/{bob.id}/async-children/")) == 3
+
+    def test_write(self, db, get, post, put, patch, client, marge):
+        assert post("/async-guardians/", json={"name": "Abe"}) == {"name": "Abe"}
+        post("/async-guardians/", json={"name": "Abe"}, expected_status_code=409)
+        assert post("/async-guardians/", json=[{"name": "Herb"}, {"name": "Mona"}]) == [
+            {"name": "Herb"},
+            {"name": "Mona"},
+        ]
+        assert put(f"/async-guardians/{marge.id}/", json={"name": "Marjorie"}) == {
+            "name": "Marjorie"
+        }
+        assert patch(f"/async-guardians/{marge.id}/", json={"name": "Midge"}) == {
+            "name": "Midge"
+        }
+        assert client.delete(f"/async-guardians/{marge.id}/").status_code == 204
+        db.session.expire_all()
+        assert sorted(g.name for g in GuardianModel.query) == [
+            "Abe",
+            "Bob",
+            "Herb",
+            "Mona",
+        ]
+
+    def test_async_callbacks(self, client, post, marge):
+        url = f"/async-guardians/{marge.id}/"
+        with (
+            patch.object(AsyncPreCallback, "execute") as pre,
+            patch.object(AsyncPostCallback, "execute") as post_callback,
+        ):
+            post("/async-guardians/", json={"name": "Abe"})
+            post("/async-guardians/", json=[{"name": "Herb"}, {"name": "Mona"}])
+            client.patch(url, json={"name": "Midge"})
+        assert pre.await_count == 4
+        assert post_callback.await_count == 4
+
+
+class TestBulkCreate:
+    def test_bulk_create(self, post, user, count_queries):
+        with count_queries() as queries:
+            response = post("/guardians/", json=[{"name": "Jill"}, {"name": "Jack"}])
+        assert response == [{"name": "Jill"}, {"name": "Jack"}]
+        assert [g.name for g in GuardianModel.query.order_by(GuardianModel.id)] == [
+            "Jill",
+            "Jack",
+        ]
+        # New resources are reloaded with a single query instead of being refreshed one by one.
+        assert (
+            len(
+                [q for q in queries if q.startswith("SELECT") and "guardian_model" in q]
+            )
+            == 1
+        )
+
+    def test_per_item_errors(self, client, user):
+        response = client.post(
+            "/guardians/", json=[{"name": "Jill"}, {}, {"name": ["nope"]}]
+        )
+        assert response.status_code == 400
+        assert set(response.json["errors"]) == {"1", "2"}
+        assert "name" in response.json["errors"]["1"]
+        assert GuardianModel.query.count() == 0
+
+    def test_bulk_create_is_atomic(self, post, user):
+        post(
+            "/guardians/",
+            json=[{"name": "Jill"}, {"name": "Jill"}],
+            expected_status_code=409,
+        )
+        assert GuardianModel.query.count() == 0
+
+    def test_limits(self, post, user, monkeypatch):
+        post("/guardians/", json=[], expected_status_code=400)
+        monkeypatch.setattr(GuardianApiView, "max_bulk_create_size", 1)
+        post(
+            "/guardians/",
+            json=[{"name": "Jill"}, {"name": "Jack"}],
+            expected_status_code=400,
+        )
+
+    def test_batch_callbacks(self, post, user):
+        with (
+            patch.object(PreCallback, "execute_batch") as pre,
+            patch.object(PostCallback, "execute_batch") as post_callback,
+        ):
+            post("/guardians/", json=[{"name": "Jill"}, {"name": "Jack"}])
+        for callback in (pre, post_callback):
+            callback.assert_called_once()
+            resources, kwargs_list = callback.call_args.args
+            assert [r.name for r in resources] == ["Jill", "Jack"]
+            assert kwargs_list == [{"name": "Jill"}, {"name": "Jack"}]
+
+    def test_default_batch_callbacks_execute_per_resource(self, post, user):
+        with patch.object(PreCallback, "execute") as pre:
+            post("/guardians/", json=[{"name": "Jill"}, {"name": "Jack"}])
+        assert pre.call_count == 2
+
+
+class TestRequestTiming:
+    @pytest.fixture(autouse=True)
+    def request_timing(self, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "request_timing", True)
+
+    def test_server_timing_header(self, client, marge):
+        response = client.get("/guardians/?limit=5&sort=name")
+        timings = dict(
+            entry.split(";dur=")
+            for entry in response.headers["Server-Timing"].split(", ")
+        )
+        assert {"parse", "query", "sql", "serialize", "encode", "total"} <= set(timings)
+        assert all(float(duration) >= 0 for duration in timings.values())
+
+    def test_write_phases(self, client, user):
+        response = client.post("/guardians/", json={"name": "Jill"})
+        assert response.status_code == 201
+        assert "callbacks;dur=" in response.headers["Server-Timing"]
+        assert "parse;dur=" in response.headers["Server-Timing"]
+
+    def test_request_timed_signal(self, client, marge):
+        received = []
+
+        def receiver(sender, timings):
+            received.append((sender, timings))
+
+        with request_timed.connected_to(receiver):
+            client.get(f"/guardians/{marge.id}/")
+        [(sender, timings)] = received
+        assert sender is GuardianApiView
+        phases = sum(v for k, v in timings.items() if k not in ("sql", "total"))
+        assert phases <= timings["total"]
+
+    def test_untimed_views(self, client, monkeypatch, marge):
+        monkeypatch.setattr(GuardianApiView, "request_timing", False)
+        assert "Server-Timing" not in client.get("/guardians/").headers
+
+    def test_parse_errors(self, client, user):
+        assert client.get("/guardians/?limit=nope").status_code == 422
+
+
+@pytest.mark.usefixtures("simpsons", "belchers")
+class TestQueryProfiling:
+    @pytest.fixture
+    def detail_schema(self, db, create_model, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "ResponseSchema", GuardianDetailSchema)
+        create_model(GuardianModel(name="Abe"))
+        db.session.expire_all()
+
+    def test_counts_by_phase(self, client):
+        with profile_queries() as profiles:
+            response = client.get("/guardians/?limit=1")
+        [profile] = profiles
+        assert profile.view is GuardianApiView
+        assert profile.get_counts_by_phase() == {"query": 1, "count": 1}
+        assert response.headers["X-Query-Count"] == "2"
+
+    def test_profiling_header(self, client, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "query_profiling", True)
+        response = client.get("/guardians/?limit=1")
+        assert response.headers["X-Query-Count"] == "2"
+
+    def test_detects_n_plus_one(self, db, client, detail_schema, monkeypatch, caplog):
+        monkeypatch.setattr(BaseApiView, "auto_eager_load", False)
+        with profile_queries() as profiles:
+            client.get("/guardians/")
+        [profile] = profiles
+        assert profile.get_counts_by_phase()["serialize"] == 3
+        [(shape, count)] = profile.get_repeated_statements().items()
+        assert "FROM child_model" in shape and count == 3
+        assert "N+1" in caplog.text
+        db.session.expire_all()
+        with pytest.raises(AssertionError, match="N\\+1"):
+            with assert_max_queries(10):
+                client.get("/guardians/")
+
+    def test_query_budget(self, client, detail_schema):
+        with assert_max_queries(2, view=GuardianApiView):
+            client.get("/guardians/")
+        with pytest.raises(AssertionError, match="exceeding the budget of 1"):
+            with assert_max_queries(1):
+                client.get("/guardians/")
+        with assert_max_queries(1, view=ChildApiView):
+            client.get("/guardians/")
+
+    def test_statement_shape(self):
+        assert get_statement_shape(
+            "SELECT *\nFROM t WHERE t.id IN (?, ?, ?)"
+        ) == get_statement_shape("SELECT * FROM t WHERE t.id IN (?, ?)")
+
+
+@pytest.mark.usefixtures("simpsons")
+class TestMetrics:
+    @pytest.fixture
+    def metrics(self, app, monkeypatch):
+        if "muck" not in app.extensions:
+            pytest.skip("Metrics are collected by the FlaskMuck extension.")
+        metrics = MuckMetrics(buckets=(0.5, 60))
+        monkeypatch.setattr(app.extensions["muck"], "metrics", metrics)
+        return metrics
+
+    def test_collects_per_view_and_method(self, get, post, metrics):
+        get("/guardians/")
+        get("/guardians/?limit=1")
+        post("/guardians/", json={"name": "Abe"})
+        get("/guardians/?fields=nope", expected_status_code=400)
+        guardians = metrics.to_dict()["guardians"]
+        assert set(guardians) == {"GET", "POST"}
+        assert guardians["GET"]["requests"] == 3
+        assert guardians["GET"]["rows"] == 2
+        assert guardians["GET"]["errors"] == {400: 1}
+        assert guardians["GET"]["latency_seconds"]["buckets"]["+Inf"] == 3
+        assert guardians["GET"]["latency_seconds"]["buckets"]["60"] == 3
+        assert guardians["GET"]["payload_bytes"] > 0
+        assert guardians["GET"]["count_query_seconds"] > 0
+        assert guardians["POST"]["requests"] == 1
+        assert guardians["POST"]["rows"] == 1
+        assert guardians["POST"]["errors"] == {}
+
+    def test_rows_with_response_cache(self, get, metrics, monkeypatch):
+        monkeypatch.setattr(BaseApiView, "response_cache", TTLCache(maxsize=100))
+        monkeypatch.setattr(views, "_response_cache_stats", {})
+        assert len(get("/guardians/")) == 1
+        get("/guardians/")
+        # Only the miss serialized rows.
+        assert metrics.to_dict()["guardians"]["GET"]["rows"] == 1
+        assert GuardianApiView.get_response_cache_stats().hits == 1
+
+    def test_prometheus_text(self, get, metrics):
+        get("/guardians/?limit=1")
+        text = metrics.to_prometheus()
+        assert "# TYPE flask_muck_requests_total counter" in text
+        assert 'flask_muck_requests_total{view="guardians",method="GET"} 1' in text
+        assert (
+            'flask_muck_request_duration_seconds_bucket{view="guardians",method="GET",le="+Inf"} 1'
+            in text
+        )
+        assert 'flask_muck_rows_returned_total{view="guardians",method="GET"} 1' in text
+
+    def test_endpoint(self):
+        app = Flask(__name__)
+        app.config["MUCK_METRICS_ENABLED"] = True
+        app.config["MUCK_APIDOCS_ENABLED"] = False
+        muck = FlaskMuck(app)
+        muck.metrics.get_view_metrics("guardian", "GET").observe(0.1, 500)
+        response = app.test_client().get("/metrics/")
+        assert response.mimetype == "text/plain"
+        assert (
+            'flask_muck_errors_total{view="guardian",method="GET",status="500"} 1'
+            in response.text
+        )
+
+    def test_disabled_by_default(self):
+        app = Flask(__name__)
+        app.config["MUCK_APIDOCS_ENABLED"] = False
+        assert FlaskMuck(app).metrics is None
+        assert app.test_client().get("/metrics/").status_code == 404
+
 
 class TestCallbacks:
     @pytest.fixture
@@ -305,6 +1492,81 @@ class TestCallbacks:
         pre_callback_patch.assert_called_once()
         post_callback_patch.assert_called_once()
 
+    @pytest.mark.filterwarnings("error::RuntimeWarning")
+    def test_async_callback_on_sync_view(self, client, user, monkeypatch):
+        monkeypatch.setattr(GuardianApiView, "pre_create_callbacks", [AsyncPreCallback])
+        with pytest.raises(MuckImplementationError):
+            client.post("/guardians/", json={"name": "Jill"})
+
+
+class TestDeferredCallbacks:
+    @pytest.fixture
+    def executor(self, monkeypatch):
+        executor = DeferredCallbackExecutor(synchronous=True)
+        monkeypatch.setattr(PostCallback, "deferred", True)
+        monkeypatch.setattr(PostCallback, "retry_delay", 0)
+        monkeypatch.setattr(GuardianApiView, "callback_executor", executor)
+        yield executor
+        executor.shutdown()
+
+    @pytest.fixture
+    def resources(self, monkeypatch):
+        resources = []
+
+        def execute(callback):
+            resources.append(callback.resource)
+
+        monkeypatch.setattr(PostCallback, "execute", execute)
+        return resources
+
+    def test_receives_snapshot(self, post, user, executor, resources):
+        post("/guardians/", json={"name": "Jill"})
+        assert resources == [{"name": "Jill"}]
+        assert executor.stats.to_dict()["succeeded"] == 1
+
+    def test_delete_receives_snapshot(self, client, guardian, executor, resources):
+        client.delete(f"/guardians/{guardian.id}/")
+        assert resources == [{"name": guardian.name}]
+
+    def test_batch_receives_snapshots(self, post, user, executor):
+        with patch.object(PostCallback, "execute_batch") as execute_batch:
+            post("/guardians/", json=[{"name": "Jill"}, {"name": "Jack"}])
+        execute_batch.assert_called_once_with(
+            [{"name": "Jill"}, {"name": "Jack"}], [{"name": "Jill"}, {"name": "Jack"}]
+        )
+
+    def test_retries(self, post, user, executor, monkeypatch):
+        monkeypatch.setattr(PostCallback, "max_retries", 2)
+        with patch.object(
+            PostCallback, "execute", side_effect=[ValueError, None]
+        ) as execute:
+            post("/guardians/", json={"name": "Jill"})
+        assert execute.call_count == 2
+        assert executor.stats.retried == 1
+        assert executor.stats.succeeded == 1
+
+    def test_failures_do_not_fail_request(self, post, user, executor, monkeypatch):
+        monkeypatch.setattr(PostCallback, "max_retries", 1)
+        with patch.object(PostCallback, "execute", side_effect=ValueError) as execute:
+            post("/guardians/", json={"name": "Jill"})
+        assert execute.call_count == 2
+        assert executor.stats.failed == 1
+
+    def test_background_execution(self, post, user, executor, resources):
+        executor.synchronous = False
+        post("/guardians/", json={"name": "Jill"})
+        executor.shutdown()
+        assert resources == [{"name": "Jill"}]
+        assert executor.stats.queue_depth == 0
+        assert executor.stats.ran_inline == 0
+
+    def test_full_queue_runs_inline(self, post, user, executor, resources):
+        executor.synchronous = False
+        executor.max_queue_size = 0
+        post("/guardians/", json={"name": "Jill"})
+        assert resources == [{"name": "Jill"}]
+        assert executor.stats.ran_inline == 1
+
 
 @pytest.mark.usefixtures("simpsons", "belchers")
 class TestNestedApis:
@@ -358,12 +1620,143 @@ class TestUtils:
                 str(ChildModel.guardian_id == 65),
             ]
 
+    def test_compile_muck_view(self, monkeypatch):
+        plan = compile_muck_view(ToyApiView)
+        assert plan.pk_column is ToyModel.__table__.c.id
+        assert plan.pk_type == "int"
+        assert plan.url_path_variable == "toy_model_id"
+        assert plan.allowed_methods == {"get", "post", "put", "patch", "delete"}
+        assert plan.path_filters == (
+            (ToyModel.__table__.c.child_id, "child_model_id"),
+            (ChildModel.__table__.c.guardian_id, "guardian_model_id"),
+        )
+        assert get_view_plan(ToyApiView) is plan
+        assert get_view_plan(ToyApiView()) is plan
+
+        # Replacing configuration after registration recompiles the plan.
+        monkeypatch.setattr(ToyApiView, "allowed_methods", {"GET"})
+        assert get_view_plan(ToyApiView).allowed_methods == {"get"}
+
     def test_get_join_models_from_parent_views(self):
         assert get_join_models_from_parent_views(ToyApiView, []) == [
             GuardianModel,
             ChildModel,
         ]
 
+    def test_ttl_cache(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        cache.set("d", 4, ttl=0)
+        assert cache.get("d", "expired") == "expired"
+        cache.delete("a")
+        assert len(cache) == 0
+
+    def test_pydantic_model_to_optional(self):
+        class ParentModel(GuardianPydanticModel):
+            age: int = Field(gt=0)
+
+            @field_validator("name")
+            @classmethod
+            def upper(cls, value: str) -> str:
+                return value.upper()
+
+        config = dict(ParentModel.model_config)
+        partial = pydantic_model_to_optional(ParentModel)
+        assert pydantic_model_to_optional(ParentModel) is partial
+        assert partial.__name__ == "ParentModel"
+        assert partial().model_dump(exclude_unset=True) == {}
+        # Validators, constraints and nested models are kept.
+        assert validate_payload(
+            {"name": "marge", "children": [{"name": "Bart", "toy": None}]},
+            ParentModel,
+            partial=True,
+        ) == {"name": "MARGE", "children": [{"name": "Bart", "toy": None}]}
+        with pytest.raises(ValidationError):
+            partial(age=0)
+        with pytest.raises(ValidationError):
+            partial(children=[{"toy": None}])
+        assert ParentModel.model_config == config
+
+    def test_pydantic_model_to_optional_keeps_all_validators(self):
+        class StrippedModel(BaseModel):
+            name: str
+            nickname: str
+
+            @field_validator("*")
+            @classmethod
+            def strip(cls, value: str) -> str:
+                return value.strip()
+
+            @model_validator(mode="after")
+            def different_nickname(self) -> "StrippedModel":
+                if self.nickname is not None and self.nickname == self.name:
+                    raise ValueError("nickname must differ from name")
+                return self
+
+        assert validate_payload({"name": "  ab  "}, StrippedModel, partial=True) == {
+            "name": "ab"
+        }
+        with pytest.raises(ValidationError):
+            validate_payload(
+                {"name": "a", "nickname": " a "}, StrippedModel, partial=True
+            )
+
+    @pytest.mark.parametrize("serializer", [GuardianSchema, GuardianDetailSchema])
+    def test_serialize_model_instances(self, serializer):
+        guardians = [
+            GuardianModel(name="Marge", children=[ChildModel(name="Bart")]),
+            GuardianModel(name="Bob", children=[]),
+        ]
+        assert serialize_model_instances(guardians, serializer) == [
+            serialize_model_instance(guardian, serializer) for guardian in guardians
+        ]
+        assert serialize_model_instances([], serializer) == []
+
+    def test_join_fans_out(self):
+        assert join_fans_out(GuardianModel, ChildModel)
+        assert not join_fans_out(ChildModel, GuardianModel)
+        assert not join_fans_out(GuardianModel, FamilyModel)
+        assert not join_fans_out(ToyModel, FamilyModel)
+        assert join_fans_out(FamilyModel, ToyModel)
+
+    def test_compile_filter_plan(self):
+        compile_filter_plan.cache_clear()
+        plan = compile_filter_plan(GuardianModel, ("age__gt", "children.name"), "__")
+        assert plan == compile_filter_plan(
+            GuardianModel, ("age__gt", "children.name"), "__"
+        )
+        assert compile_filter_plan.cache_info().hits == 1
+        age, child_name = plan
+        assert (age.column, age.join_model) == (GuardianModel.age, None)
+        assert (child_name.column, child_name.join_model) == (
+            ChildModel.name,
+            ChildModel,
+        )
+        # Values are bound, so filters with the same shape compile to the same SQL.
+        assert str(age.operator(age.column, 1)) == str(age.operator(age.column, 2))
+
+        with pytest.raises(BadRequest):
+            compile_filter_plan(GuardianModel, ("nope",), "__")
+        with pytest.raises(BadRequest):
+            compile_filter_plan(GuardianModel, ("nope.name",), "__")
+
+    @pytest.mark.parametrize("serializer", [GuardianSchema, ChildSchema])
+    def test_validate_payloads(self, serializer):
+        valid = {"name": "Bart", "guardian_id": 1}
+        assert validate_payloads([valid], serializer) == (
+            [validate_payload(valid, serializer)],
+            {},
+        )
+        items, errors = validate_payloads([valid, {}, "nope"], serializer)
+        assert items == []
+        assert set(errors) == {1, 2}
+        assert "name" in errors[1]
+
 
 @pytest.mark.usefixtures("simpsons", "belchers")
 class TestBaseQueryKwargs:
@@ -425,6 +1818,23 @@ class TestOpenAPI:
         if muck := app.extensions.get("muck"):
             assert snapshot == muck.openapi_spec_dict
 
+    def test_media_types(self, monkeypatch):
+        monkeypatch.setattr(
+            BaseApiView, "media_types", ["application/json", "application/msgpack"]
+        )
+        spec = APISpec(title="Test", version="1.0.0", openapi_version="3.0.3")
+        update_spec_from_muck_view(spec, "/", GuardianApiView)
+        operations = spec.to_dict()["paths"]["/guardians/{guardian_model_id}/"]
+        for method in ["post", "put", "patch"]:
+            assert list(operations[method]["requestBody"]["content"]) == [
+                "application/json",
+                "application/msgpack",
+            ]
+        assert list(operations["get"]["responses"]["200"]["content"]) == [
+            "application/json",
+            "application/msgpack",
+        ]
+
 
 class TestCommands:
     def test_openapi(self, cli_runner, snapshot):